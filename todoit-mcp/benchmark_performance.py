@@ -8,6 +8,7 @@ import time
 import tempfile
 import os
 from core.manager import TodoManager
+from core.database import Database
 
 
 def benchmark_create_list_with_items(num_items=50):
@@ -71,6 +72,161 @@ def benchmark_get_next_pending_complex():
     return (end_time - start_time) / 100
 
 
+def count_db_activity(manager, func, *args, **kwargs):
+    """Run func and count SQL statements and commits issued on the engine"""
+    from sqlalchemy import event
+
+    counts = {"queries": 0, "commits": 0}
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        counts["queries"] += 1
+
+    def on_commit(conn):
+        counts["commits"] += 1
+
+    engine = manager.db.engine
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    try:
+        func(*args, **kwargs)
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(engine, "commit", on_commit)
+    return counts
+
+
+def benchmark_unit_of_work(num_items=20):
+    """Benchmark queries/commits per add_item and update_item_status with and without unit of work"""
+    db_path = "/tmp/benchmark_uow.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    manager = TodoManager(db_path=db_path)
+    manager.create_list("uow_test", "Unit Of Work Test")
+    manager.add_item("uow_test", "parent", "Parent task")
+    manager.add_subitem("uow_test", "parent", "child_0", "Child task")
+
+    # "before" calls the undecorated methods, one session per Database call
+    operations = {
+        "add_item": lambda add, i: add(manager, "uow_test", f"task_{i}", f"Task {i}"),
+        "update_item_status": lambda update, i: update(
+            manager,
+            "uow_test",
+            "child_0",
+            "completed" if i % 2 else "in_progress",
+            parent_item_key="parent",
+        ),
+    }
+    methods = {
+        "add_item": TodoManager.add_item,
+        "update_item_status": TodoManager.update_item_status,
+    }
+
+    print(f"📊 UNIT OF WORK BENCHMARK ({num_items} calls each):")
+    results = {}
+    for name, operation in operations.items():
+        for mode, method in (
+            ("before", methods[name].__wrapped__),
+            ("after", methods[name]),
+        ):
+            offset = 0 if mode == "before" else num_items
+            totals = {"queries": 0, "commits": 0}
+            start_time = time.time()
+            for i in range(num_items):
+                counts = count_db_activity(manager, operation, method, i + offset)
+                totals["queries"] += counts["queries"]
+                totals["commits"] += counts["commits"]
+            elapsed = time.time() - start_time
+            results[(name, mode)] = totals
+            print(
+                f"   {name:<20} {mode:<6} "
+                f"queries/call: {totals['queries'] / num_items:5.1f}  "
+                f"commits/call: {totals['commits'] / num_items:4.1f}  "
+                f"time/call: {elapsed / num_items * 1000:6.2f}ms"
+            )
+
+    return results
+
+
+def benchmark_db_profiles(num_items=200):
+    """Benchmark a write + read workload per engine profile and per single setting"""
+    from core.database import SQLITE_PROFILES
+
+    performance = SQLITE_PROFILES["performance"]
+    # Each performance setting applied alone on top of the default profile
+    variants = [("default", None, {}), ("performance", "performance", {})]
+    for key, value in performance.items():
+        if value != SQLITE_PROFILES["default"][key]:
+            overrides = {key: value}
+            if key == "pool_size":
+                overrides["max_overflow"] = performance["max_overflow"]
+            if key != "max_overflow":
+                variants.append((f"default + {key}", "default", overrides))
+
+    print(f"📊 DATABASE PROFILE BENCHMARK ({num_items} items):")
+    results = {}
+    for label, profile, overrides in variants:
+        db_path = "/tmp/benchmark_profile.db"
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+        manager = TodoManager(db_path=db_path)
+        manager.db = Database(db_path, profile=profile, settings=overrides)
+        manager.create_list("profile_test", "Profile Test")
+
+        start_time = time.time()
+        for i in range(num_items):
+            manager.add_item("profile_test", f"task_{i}", f"Task {i}")
+        write_time = time.time() - start_time
+
+        start_time = time.time()
+        for i in range(0, num_items, 4):
+            manager.update_item_status("profile_test", f"task_{i}", "completed")
+            manager.get_progress("profile_test")
+        read_time = time.time() - start_time
+
+        results[label] = (write_time, read_time)
+        print(
+            f"   {label:<32} writes: {write_time * 1000:7.1f}ms  "
+            f"mixed: {read_time * 1000:7.1f}ms"
+        )
+        manager.db.engine.dispose()
+
+    return results
+
+
+def benchmark_ordered_limit(num_items=5000, limit=10):
+    """Benchmark fetching the first items of a large, naturally ordered list"""
+    db_path = "/tmp/benchmark_sort_key.db"
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    manager = TodoManager(db_path=db_path)
+    manager.create_list("sorted_test", "Sorted Test")
+    list_id = manager.db.get_list_by_key("sorted_test").id
+    with manager.db.unit_of_work():
+        for i in range(num_items, 0, -1):
+            manager.db.create_item(
+                {
+                    "list_id": list_id,
+                    "item_key": f"task_{i}",
+                    "content": f"Task {i}",
+                    "position": i,
+                }
+            )
+
+    start_time = time.time()
+    for _ in range(20):
+        items = manager.db.get_list_items(list_id, limit=limit)
+    elapsed = (time.time() - start_time) / 20
+
+    print(f"📊 ORDERED LIMIT BENCHMARK (first {limit} of {num_items} items):")
+    print(f"   First key: {items[0].item_key}")
+    print(f"   Time per call: {elapsed * 1000:.2f}ms")
+    return elapsed
+
+
 def main():
     """Run performance benchmarks"""
     print("🚀 TODOIT MCP Performance Benchmarks")
@@ -84,6 +240,18 @@ def main():
     # Benchmark 2: Complex next pending queries
     query_time = benchmark_get_next_pending_complex()
     print()
+
+    # Benchmark 3: Queries and commits per write operation
+    benchmark_unit_of_work()
+    print()
+
+    # Benchmark 4: First items of a large list (ORDER BY sort_key + LIMIT)
+    benchmark_ordered_limit()
+    print()
+
+    # Benchmark 5: SQLite engine profiles
+    benchmark_db_profiles()
+    print()
     
     # Summary
     print("📈 PERFORMANCE SUMMARY:")
@@ -95,6 +263,7 @@ def main():
     print("   ✅ Bulk item creation in single transaction")
     print("   ✅ Composite database indexes optimized")
     print("   ✅ Bulk dependency checking")
+    print("   ✅ One session and commit per write operation (unit of work)")
     print()
     
     # Performance targets
@@ -6,8 +6,9 @@ SQLAlchemy models and database operations
 import os
 import re
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from sqlalchemy import (
     JSON,
@@ -18,13 +19,34 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    and_,
+    bindparam,
+    case,
     create_engine,
     event,
+    exists,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    union,
 )
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
+from sqlalchemy.orm import (
+    Session,
+    aliased,
+    declarative_base,
+    relationship,
+    sessionmaker,
+    validates,
+)
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import func
 
+from .key_cache import ANY_PARENT, KeyCache
 from .models import (
     DependencyType,
     HistoryAction,
@@ -58,6 +80,54 @@ def utc_now():
     )  # Store as naive UTC for SQLite compatibility
 
 
+def natural_sort_value(text: str) -> str:
+    """Encode a key as a string whose binary order is its natural order.
+
+    Text runs are lowercased and terminated with \x01 (below any printable
+    character), digit runs become a 3-digit length prefix followed by the
+    number without leading zeros, so 'task_2' < 'task_10' in plain SQL
+    ORDER BY. Keys comparing equal here compare equal in natural_sort_key.
+    """
+    parts = []
+    for index, part in enumerate(re.split("([0-9]+)", text)):
+        if index % 2:
+            digits = part.lstrip("0") or "0"
+            parts.append(f"{len(digits):03d}{digits}")
+        else:
+            parts.append(part.lower() + "\x01")
+    return "".join(parts)
+
+
+def regexp_match_start(pattern: Optional[str], value: Optional[str]) -> bool:
+    """SQL function regexp_match_start(pattern, value): re.match semantics.
+
+    Unlike REGEXP (re.search) the pattern is matched from the start of value
+    and is used as given, so global inline flags like '(?i)' stay valid.
+    """
+    if pattern is None or value is None:
+        return False
+    return re.match(pattern, value) is not None
+
+
+def casefold(value: Optional[str]) -> Optional[str]:
+    """SQL function casefold(value): Unicode case folding.
+
+    SQLite's lower() only folds ASCII, so case-insensitive matching of
+    titles such as 'Łódź' compares casefold() of both sides instead.
+    """
+    return value.casefold() if value is not None else None
+
+
+def _sort_key_default(source_column: str):
+    """Column default computing sort_key from the inserted key column"""
+
+    def default(context):
+        value = context.get_current_parameters().get(source_column)
+        return natural_sort_value(value) if value is not None else None
+
+    return default
+
+
 # SQLAlchemy ORM Models
 class TodoListDB(Base):
     """SQLAlchemy model for todo_lists table"""
@@ -66,6 +136,7 @@ class TodoListDB(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     list_key = Column(String(100), unique=True, nullable=False)
+    sort_key = Column(String(512), default=_sort_key_default("list_key"))
     title = Column(String(255), nullable=False)
     description = Column(Text)
     list_type = Column(String(20), default="sequential")
@@ -80,7 +151,16 @@ class TodoListDB(Base):
     )
 
     # Indexes
-    __table_args__ = (Index("idx_todo_lists_list_key", "list_key"),)
+    __table_args__ = (
+        Index("idx_todo_lists_list_key", "list_key"),
+        Index("idx_todo_lists_sort_key", "sort_key"),
+    )
+
+    @validates("list_key")
+    def _update_sort_key(self, key, value):
+        """Keep sort_key in step with list_key on insert and rename"""
+        self.sort_key = natural_sort_value(value) if value is not None else None
+        return value
 
 
 class TodoItemDB(Base):
@@ -91,6 +171,7 @@ class TodoItemDB(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     list_id = Column(Integer, ForeignKey("todo_lists.id"), nullable=False)
     item_key = Column(String(100), nullable=False)
+    sort_key = Column(String(512), default=_sort_key_default("item_key"))
     content = Column(String(1000), nullable=False)
     position = Column(Integer, nullable=False)
     status = Column(String(20), default="pending")
@@ -127,8 +208,24 @@ class TodoItemDB(Base):
         Index(
             "idx_todo_items_list_parent_null", "list_id", "parent_item_id"
         ),  # For root items query
+        Index(
+            "idx_todo_items_list_parent_sort", "list_id", "parent_item_id", "sort_key"
+        ),  # For naturally ordered items/children
+        Index(
+            "idx_todo_items_pending_position",
+            "list_id",
+            "position",
+            "item_key",
+            sqlite_where=text("status = 'pending'"),
+        ),  # For next pending item lookups
     )
 
+    @validates("item_key")
+    def _update_sort_key(self, key, value):
+        """Keep sort_key in step with item_key on insert and rename"""
+        self.sort_key = natural_sort_value(value) if value is not None else None
+        return value
+
 
 class ListPropertyDB(Base):
     """SQLAlchemy model for list_properties table"""
@@ -268,25 +365,497 @@ class ItemDependencyDB(Base):
     )
 
 
+class ItemLeaseDB(Base):
+    """SQLAlchemy model for item_leases table - items claimed by workers"""
+
+    __tablename__ = "item_leases"
+
+    item_id = Column(
+        Integer, ForeignKey("todo_items.id", ondelete="CASCADE"), primary_key=True
+    )
+    worker_id = Column(String(100), nullable=False)
+    claimed_at = Column(DateTime, default=utc_now)
+    lease_expires_at = Column(DateTime, nullable=False)
+
+    # Indexes
+    __table_args__ = (Index("idx_item_leases_expires", "lease_expires_at"),)
+
+
+class DependencyChangeDB(Base):
+    """SQLAlchemy model for dependency_changes table.
+
+    Append-only log written by triggers whenever a dependency edge is added or
+    removed, or an item that other items depend on changes status. Process-local
+    dependency indexes replay it to stay coherent with other processes.
+    """
+
+    __tablename__ = "dependency_changes"
+
+    id = Column(Integer, primary_key=True)
+    change = Column(String(20), nullable=False)
+    item_id = Column(Integer, nullable=False)
+    other_item_id = Column(Integer)
+    status = Column(String(20))
+
+
+class ListCounterDB(Base):
+    """SQLAlchemy model for list_counters table.
+
+    One row per list with its item counts by status, root/subtask counts and
+    the latest item updated_at. Kept exact by triggers on todo_lists and
+    todo_items, inside the transaction that changes the items; `todoit db
+    recount` rebuilds it from todo_items.
+    """
+
+    __tablename__ = "list_counters"
+
+    list_id = Column(Integer, primary_key=True)
+    total = Column(Integer, nullable=False, default=0, server_default="0")
+    pending = Column(Integer, nullable=False, default=0, server_default="0")
+    in_progress = Column(Integer, nullable=False, default=0, server_default="0")
+    completed = Column(Integer, nullable=False, default=0, server_default="0")
+    failed = Column(Integer, nullable=False, default=0, server_default="0")
+    root_items = Column(Integer, nullable=False, default=0, server_default="0")
+    subtasks = Column(Integer, nullable=False, default=0, server_default="0")
+    last_item_update = Column(DateTime)
+
+
+class ItemClosureDB(Base):
+    """SQLAlchemy model for item_closure table - the item hierarchy closure.
+
+    One row per (ancestor, descendant) pair at any distance, including a
+    depth 0 row pairing every item with itself. Kept exact by triggers on
+    todo_items, so depth, path, subtree and ancestry checks are single
+    indexed lookups at any depth.
+    """
+
+    __tablename__ = "item_closure"
+
+    ancestor_id = Column(Integer, primary_key=True)
+    descendant_id = Column(Integer, primary_key=True)
+    depth = Column(Integer, nullable=False)
+
+    # Indexes
+    __table_args__ = (Index("idx_item_closure_descendant", "descendant_id", "depth"),)
+
+
+class ParentStatusDeferralDB(Base):
+    """SQLAlchemy model for parent_status_deferrals - a batch write marker.
+
+    While a row exists, child status changes do not re-derive their parent;
+    the batch re-derives every affected parent once instead. The row is
+    inserted and deleted inside the writing transaction, so other
+    connections never see it.
+    """
+
+    __tablename__ = "parent_status_deferrals"
+
+    id = Column(Integer, primary_key=True)
+
+
+# Number of dependency_changes rows kept; older rows are pruned every 1000 changes
+DEPENDENCY_CHANGES_RETAINED = 10000
+
+DEPENDENCY_CHANGE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_dependency_changes_added
+    AFTER INSERT ON item_dependencies
+    BEGIN
+        INSERT INTO dependency_changes (change, item_id, other_item_id, status)
+        VALUES (
+            'dependency_added', NEW.dependent_item_id, NEW.required_item_id,
+            (SELECT status FROM todo_items WHERE id = NEW.required_item_id)
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_dependency_changes_removed
+    AFTER DELETE ON item_dependencies
+    BEGIN
+        INSERT INTO dependency_changes (change, item_id, other_item_id)
+        VALUES ('dependency_removed', OLD.dependent_item_id, OLD.required_item_id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_dependency_changes_status
+    AFTER UPDATE OF status ON todo_items
+    WHEN OLD.status IS NOT NEW.status
+        AND EXISTS (
+            SELECT 1 FROM item_dependencies WHERE required_item_id = NEW.id
+        )
+    BEGIN
+        INSERT INTO dependency_changes (change, item_id, status)
+        VALUES ('status', NEW.id, NEW.status);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_dependency_changes_prune
+    AFTER INSERT ON dependency_changes
+    WHEN NEW.id % 1000 = 0
+    BEGIN
+        DELETE FROM dependency_changes
+        WHERE id <= NEW.id - {DEPENDENCY_CHANGES_RETAINED};
+    END
+    """,
+]
+
+# Counter columns of list_counters and the todo_items expression each one counts
+LIST_COUNTER_COLUMNS = {
+    "total": "1",
+    "pending": "{row}.status IS 'pending'",
+    "in_progress": "{row}.status IS 'in_progress'",
+    "completed": "{row}.status IS 'completed'",
+    "failed": "{row}.status IS 'failed'",
+    "root_items": "{row}.parent_item_id IS NULL",
+    "subtasks": "{row}.parent_item_id IS NOT NULL",
+}
+
+
+def _list_counter_delta(row: str, sign: str) -> str:
+    """SET clause adding (+) or removing (-) one item row from the counters"""
+    return ",\n        ".join(
+        f"{column} = {column} {sign} ({expression.format(row=row)})"
+        for column, expression in LIST_COUNTER_COLUMNS.items()
+    )
+
+
+_LIST_COUNT_AGGREGATES = ",\n        ".join(
+    f"COALESCE(SUM(todo_items.id IS NOT NULL AND "
+    f"({expression.format(row='todo_items')})), 0)"
+    for expression in LIST_COUNTER_COLUMNS.values()
+)
+
+# Recomputes list_counters rows from todo_items (migration backfill and recount)
+LIST_COUNTS_SELECT = f"""
+    SELECT todo_lists.id,
+        {_LIST_COUNT_AGGREGATES},
+        MAX(todo_items.updated_at)
+    FROM todo_lists
+    LEFT JOIN todo_items ON todo_items.list_id = todo_lists.id
+"""
+
+LIST_COUNTER_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_list_counters_list_added
+    AFTER INSERT ON todo_lists
+    BEGIN
+        INSERT OR IGNORE INTO list_counters (list_id) VALUES (NEW.id);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_list_counters_list_removed
+    AFTER DELETE ON todo_lists
+    BEGIN
+        DELETE FROM list_counters WHERE list_id = OLD.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_list_counters_item_added
+    AFTER INSERT ON todo_items
+    BEGIN
+        INSERT OR IGNORE INTO list_counters (list_id) VALUES (NEW.list_id);
+        UPDATE list_counters SET
+        {_list_counter_delta("NEW", "+")},
+        last_item_update = CASE
+            WHEN last_item_update IS NULL OR NEW.updated_at > last_item_update
+            THEN NEW.updated_at ELSE last_item_update END
+        WHERE list_id = NEW.list_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_list_counters_item_removed
+    AFTER DELETE ON todo_items
+    BEGIN
+        UPDATE list_counters SET
+        {_list_counter_delta("OLD", "-")},
+        last_item_update = CASE
+            WHEN OLD.updated_at IS NOT last_item_update THEN last_item_update
+            ELSE (SELECT MAX(updated_at) FROM todo_items
+                  WHERE list_id = OLD.list_id) END
+        WHERE list_id = OLD.list_id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_list_counters_item_changed
+    AFTER UPDATE OF list_id, status, parent_item_id ON todo_items
+    WHEN OLD.list_id IS NOT NEW.list_id
+        OR OLD.status IS NOT NEW.status
+        OR OLD.parent_item_id IS NOT NEW.parent_item_id
+    BEGIN
+        UPDATE list_counters SET
+        {_list_counter_delta("OLD", "-")}
+        WHERE list_id = OLD.list_id;
+        UPDATE list_counters SET
+        {_list_counter_delta("NEW", "+")}
+        WHERE list_id = NEW.list_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_list_counters_item_touched
+    AFTER UPDATE OF list_id, updated_at ON todo_items
+    WHEN OLD.list_id IS NOT NEW.list_id OR OLD.updated_at IS NOT NEW.updated_at
+    BEGIN
+        UPDATE list_counters SET last_item_update = CASE
+            WHEN last_item_update IS NULL OR NEW.updated_at >= last_item_update
+            THEN NEW.updated_at
+            WHEN OLD.list_id IS NOT NEW.list_id
+                OR OLD.updated_at IS NOT last_item_update
+            THEN last_item_update
+            ELSE (SELECT MAX(updated_at) FROM todo_items
+                  WHERE list_id = NEW.list_id) END
+        WHERE list_id = NEW.list_id;
+        UPDATE list_counters SET last_item_update = (
+            SELECT MAX(updated_at) FROM todo_items WHERE list_id = OLD.list_id
+        )
+        WHERE list_id = OLD.list_id
+            AND OLD.list_id IS NOT NEW.list_id
+            AND OLD.updated_at IS last_item_update;
+    END
+    """,
+]
+
+
+# Parent status derived from its direct children: any failed -> failed,
+# all pending -> pending, all completed -> completed, otherwise in_progress
+DERIVED_PARENT_STATUS = """
+        CASE
+            WHEN EXISTS (SELECT 1 FROM todo_items AS child
+                         WHERE child.parent_item_id = todo_items.id
+                             AND child.status = 'failed') THEN 'failed'
+            WHEN NOT EXISTS (SELECT 1 FROM todo_items AS child
+                             WHERE child.parent_item_id = todo_items.id
+                                 AND child.status IS NOT 'pending') THEN 'pending'
+            WHEN NOT EXISTS (SELECT 1 FROM todo_items AS child
+                             WHERE child.parent_item_id = todo_items.id
+                                 AND child.status IS NOT 'completed') THEN 'completed'
+            ELSE 'in_progress'
+        END"""
+
+
+def _parent_status_update(condition: str) -> str:
+    """UPDATE re-deriving the status of the parents matching condition.
+
+    Items without children keep their status. Every parent whose status
+    changes fires trg_parent_status_child_changed for its own parent, so with
+    recursive_triggers on the change propagates up to the root.
+    """
+    return f"""
+        UPDATE todo_items
+        SET status = {DERIVED_PARENT_STATUS},
+            updated_at = strftime('%Y-%m-%d %H:%M:%f', 'now') || '000'
+        WHERE {condition}
+            AND EXISTS (SELECT 1 FROM todo_items AS child
+                        WHERE child.parent_item_id = todo_items.id)
+            AND status IS NOT {DERIVED_PARENT_STATUS}"""
+
+
+PARENT_STATUS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_parent_status_child_added
+    AFTER INSERT ON todo_items
+    WHEN NEW.parent_item_id IS NOT NULL
+    BEGIN
+        {_parent_status_update("id = NEW.parent_item_id")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_parent_status_child_removed
+    AFTER DELETE ON todo_items
+    WHEN OLD.parent_item_id IS NOT NULL
+    BEGIN
+        {_parent_status_update("id = OLD.parent_item_id")};
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_parent_status_child_changed
+    AFTER UPDATE OF status, parent_item_id ON todo_items
+    WHEN (OLD.status IS NOT NEW.status
+            OR OLD.parent_item_id IS NOT NEW.parent_item_id)
+        AND NOT EXISTS (SELECT 1 FROM parent_status_deferrals)
+    BEGIN
+        {_parent_status_update("id = NEW.parent_item_id")};
+        {_parent_status_update(
+            "id = OLD.parent_item_id "
+            "AND OLD.parent_item_id IS NOT NEW.parent_item_id"
+        )};
+    END
+    """,
+]
+
+# Rebuilds item_closure from parent_item_id (migration backfill)
+ITEM_CLOSURE_SELECT = """
+    WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+        SELECT id, id, 0 FROM todo_items
+        UNION ALL
+        SELECT tree.ancestor_id, child.id, tree.depth + 1
+        FROM tree JOIN todo_items AS child ON child.parent_item_id = tree.descendant_id
+    )
+    SELECT ancestor_id, descendant_id, depth FROM tree
+"""
+
+ITEM_CLOSURE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_item_closure_added
+    AFTER INSERT ON todo_items
+    BEGIN
+        INSERT INTO item_closure (ancestor_id, descendant_id, depth)
+        SELECT NEW.id, NEW.id, 0
+        UNION ALL
+        SELECT ancestor_id, NEW.id, depth + 1 FROM item_closure
+        WHERE descendant_id = NEW.parent_item_id;
+    END
+    """,
+    # Items with children cannot be deleted (foreign key), so only the rows
+    # ending at the item itself remain
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_item_closure_removed
+    AFTER DELETE ON todo_items
+    BEGIN
+        DELETE FROM item_closure WHERE descendant_id = OLD.id;
+    END
+    """,
+    # Detach the moved subtree from its old ancestors, then attach it below
+    # every ancestor of the new parent. Moving an item under its own subtree
+    # would pair it with itself again and fails on the primary key.
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_item_closure_moved
+    AFTER UPDATE OF parent_item_id ON todo_items
+    WHEN OLD.parent_item_id IS NOT NEW.parent_item_id
+    BEGIN
+        DELETE FROM item_closure
+        WHERE descendant_id IN (
+                SELECT descendant_id FROM item_closure WHERE ancestor_id = NEW.id
+            )
+            AND ancestor_id IN (
+                SELECT ancestor_id FROM item_closure
+                WHERE descendant_id = NEW.id AND depth > 0
+            );
+        INSERT INTO item_closure (ancestor_id, descendant_id, depth)
+        SELECT above.ancestor_id, below.descendant_id, above.depth + below.depth + 1
+        FROM item_closure AS above, item_closure AS below
+        WHERE above.descendant_id = NEW.parent_item_id
+            AND below.ancestor_id = NEW.id;
+    END
+    """,
+]
+
+
+# Item columns that are part of a key cache entry
+KEY_CACHE_ITEM_FIELDS = frozenset({"item_key", "parent_item_id", "list_id"})
+
+
+# SQLite engine profiles, selected with Database(profile=...) or TODOIT_DB_PROFILE.
+# A value of None keeps the SQLite/SQLAlchemy default for that setting.
+# foreign_keys=ON, journal_mode=WAL and recursive_triggers=ON (parent status
+# propagation) are always applied.
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "synchronous": None,
+        "cache_size": None,
+        "mmap_size": None,
+        "temp_store": None,
+        "busy_timeout": 5000,  # ms to wait for a lock instead of failing at once
+        "pool_size": None,  # SQLAlchemy default pool
+        "max_overflow": None,
+        "statement_cache_size": None,  # pysqlite default (128)
+    },
+    "performance": {
+        "synchronous": "NORMAL",  # durable with WAL except on power loss
+        "cache_size": -65536,  # negative = KiB, i.e. 64 MiB page cache
+        "mmap_size": 268435456,  # 256 MiB memory-mapped I/O
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+        "pool_size": 5,  # thread-safe pool for multi-threaded servers
+        "max_overflow": 10,
+        "statement_cache_size": 256,
+    },
+}
+
+DEFAULT_SQLITE_PROFILE = "default"
+
+
+def resolve_sqlite_profile(
+    profile: Optional[str] = None, overrides: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Resolve SQLite engine settings from a profile name and overrides.
+
+    Profile name falls back to TODOIT_DB_PROFILE, then to "default".
+    Overrides replace single settings, which makes each one benchmarkable.
+    """
+    name = (profile or os.getenv("TODOIT_DB_PROFILE") or DEFAULT_SQLITE_PROFILE).lower()
+    if name not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown database profile '{name}'. "
+            f"Available: {', '.join(sorted(SQLITE_PROFILES))}"
+        )
+
+    settings = dict(SQLITE_PROFILES[name])
+    for key, value in (overrides or {}).items():
+        if key not in settings:
+            raise ValueError(f"Unknown database setting '{key}'")
+        settings[key] = value
+    return settings
+
+
+class AmbientSession:
+    """Session handle joined to an active unit of work.
+
+    Database methods treat it like their own session, but it is owned by the
+    unit of work: commit() only flushes and leaving a ``with`` block does not
+    close it. The unit of work commits once when it finishes.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def __enter__(self) -> "AmbientSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
+    def commit(self):
+        """Flush pending changes; the unit of work performs the real commit"""
+        self._session.flush()
+
+    def close(self):
+        """No-op; the unit of work closes the session"""
+
+
 class Database:
     """Database connection and operations manager"""
 
-    def __init__(self, db_path: str = "todoit.db"):
-        """Initialize database connection"""
+    def __init__(
+        self,
+        db_path: str = "todoit.db",
+        profile: Optional[str] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize database connection
+
+        Args:
+            db_path: Path to the SQLite database file
+            profile: Engine profile name from SQLITE_PROFILES (default from
+                TODOIT_DB_PROFILE, then "default")
+            settings: Overrides for single profile settings
+        """
         self.db_path = os.path.abspath(db_path)
-        self.engine = create_engine(f"sqlite:///{self.db_path}", echo=False)
+        self.settings = resolve_sqlite_profile(profile, settings)
+        self.engine = self._create_engine()
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
 
-        # Enable foreign key constraints for SQLite
-        @event.listens_for(Engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            if "sqlite" in str(dbapi_connection):
-                cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.execute("PRAGMA journal_mode=WAL")
-                cursor.close()
+        # Session of the unit of work active in the current thread/task, if any
+        self._ambient_session: ContextVar[Optional[AmbientSession]] = ContextVar(
+            f"todoit_ambient_session_{id(self)}", default=None
+        )
+
+        # Optional key -> ID cache, see TodoManager.enable_key_cache()
+        self.key_cache: Optional[KeyCache] = None
 
         # Create all tables
         self.create_tables()
@@ -294,9 +863,77 @@ class Database:
         # Run Phase 2 migration if needed
         self.run_phase2_migration()
 
+        # Add and backfill natural sort keys for databases created before them
+        self.run_sort_key_migration()
+
+        # Triggers feeding the dependency_changes log
+        self.run_dependency_change_log_migration()
+
+        # Partial index for next pending item lookups on existing databases
+        self.run_pending_items_index_migration()
+
+        # Trigger-maintained per-list status counters
+        self.run_list_counters_migration()
+
+        # Parent status derived from children by triggers
+        self.run_parent_status_triggers_migration()
+
+        # Trigger-maintained hierarchy closure table
+        self.run_item_closure_migration()
+
         # Note: Subtask flexibility migration is available via migrate_subtask_keys.py
         # It's not run automatically to give users full control over schema changes
 
+    def _create_engine(self) -> Engine:
+        """Create the SQLite engine for the resolved profile settings"""
+        connect_args: Dict[str, Any] = {}
+        engine_kwargs: Dict[str, Any] = {}
+
+        if self.settings["statement_cache_size"] is not None:
+            connect_args["cached_statements"] = self.settings["statement_cache_size"]
+        if self.settings["pool_size"] is not None:
+            # Pooled connections are handed between threads
+            connect_args["check_same_thread"] = False
+            engine_kwargs["poolclass"] = QueuePool
+            engine_kwargs["pool_size"] = self.settings["pool_size"]
+            engine_kwargs["max_overflow"] = self.settings["max_overflow"] or 0
+
+        engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            connect_args=connect_args,
+            **engine_kwargs,
+        )
+        # Scoped to this engine so listeners do not pile up per Database
+        event.listen(engine, "connect", self._set_sqlite_pragmas)
+        return engine
+
+    def _set_sqlite_pragmas(self, dbapi_connection, connection_record):
+        """Apply foreign keys, WAL, recursive triggers and profile pragmas to a new connection
+
+        Also registers the regexp_match_start and casefold SQL functions.
+        """
+        pragmas = [
+            "PRAGMA foreign_keys=ON",
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA recursive_triggers=ON",
+        ]
+        for name in ("synchronous", "cache_size", "mmap_size", "temp_store"):
+            if self.settings[name] is not None:
+                pragmas.append(f"PRAGMA {name}={self.settings[name]}")
+        busy_timeout = self.settings["busy_timeout"]
+        if busy_timeout is not None:
+            pragmas.append(f"PRAGMA busy_timeout={int(busy_timeout)}")
+
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+        dbapi_connection.create_function(
+            "regexp_match_start", 2, regexp_match_start, deterministic=True
+        )
+        dbapi_connection.create_function("casefold", 1, casefold, deterministic=True)
+
     @staticmethod
     def natural_sort_key(text: str) -> List[Union[int, str]]:
         """Convert a string to a list for natural sorting.
@@ -317,12 +954,63 @@ class Database:
         Base.metadata.create_all(bind=self.engine)
 
     def get_session(self) -> Session:
-        """Get database session"""
+        """Get database session (joins the active unit of work, if any)"""
+        ambient = self._ambient_session.get()
+        if ambient is not None:
+            return ambient
         return self.SessionLocal()
 
+    @contextmanager
+    def unit_of_work(self, immediate: bool = False):
+        """Run a series of operations in one session and one transaction.
+
+        Every Database method called inside the block joins the same session,
+        so the whole block costs a single commit and is atomic: any exception
+        rolls back all of it. Nested calls join the outermost unit of work.
+
+        With immediate=True the transaction starts with BEGIN IMMEDIATE, taking
+        the write lock up front so reads made in the block cannot be raced by
+        other writers (select-then-update patterns such as claiming items).
+
+        Example:
+            with db.unit_of_work():
+                item = db.create_item(item_data)
+                db.create_history_entry(history_data)
+        """
+        ambient = self._ambient_session.get()
+        if ambient is not None:
+            yield ambient
+            return
+
+        # Objects must stay usable after the session is closed
+        session = self.SessionLocal(expire_on_commit=False)
+        if immediate:
+            session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+        ambient = AmbientSession(session)
+        token = self._ambient_session.set(ambient)
+        try:
+            yield ambient
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._ambient_session.reset(token)
+            session.close()
+
+    def in_unit_of_work(self) -> bool:
+        """Whether a unit of work is active in the current thread/task"""
+        return self._ambient_session.get() is not None
+
     @contextmanager
     def transaction_scope(self):
         """Provide a transactional scope around a series of operations"""
+        if self._ambient_session.get() is not None:
+            with self.unit_of_work() as session:
+                yield session
+                session.flush()
+            return
+
         session = self.SessionLocal()
         try:
             yield session
@@ -382,6 +1070,147 @@ class Database:
             print(f"Warning: Could not run Phase 2 migration: {e}")
             # Continue anyway - table might already exist
 
+    def run_sort_key_migration(self):
+        """Add sort_key columns to todo_lists/todo_items and backfill them"""
+        from sqlalchemy import text
+
+        tables = {"todo_lists": "list_key", "todo_items": "item_key"}
+        indexes = {
+            "idx_todo_lists_sort_key": "todo_lists (sort_key)",
+            "idx_todo_items_list_parent_sort": (
+                "todo_items (list_id, parent_item_id, sort_key)"
+            ),
+        }
+        try:
+            with self.engine.begin() as conn:
+                for table, key_column in tables.items():
+                    columns = {
+                        row[1]
+                        for row in conn.execute(text(f"PRAGMA table_info({table})"))
+                    }
+                    if "sort_key" not in columns:
+                        conn.execute(
+                            text(
+                                f"ALTER TABLE {table} "
+                                "ADD COLUMN sort_key VARCHAR(512)"
+                            )
+                        )
+
+                    rows = conn.execute(
+                        text(
+                            f"SELECT id, {key_column} FROM {table} "
+                            "WHERE sort_key IS NULL"
+                        )
+                    ).fetchall()
+                    if rows:
+                        conn.execute(
+                            text(
+                                f"UPDATE {table} SET sort_key = :sort_key "
+                                "WHERE id = :id"
+                            ),
+                            [
+                                {"id": row[0], "sort_key": natural_sort_value(row[1])}
+                                for row in rows
+                            ],
+                        )
+
+                for name, target in indexes.items():
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}"))
+        except Exception as e:
+            print(f"Warning: Could not run sort key migration: {e}")
+
+    def run_dependency_change_log_migration(self):
+        """Install the triggers that record changes in dependency_changes"""
+        from sqlalchemy import text
+
+        try:
+            with self.engine.begin() as conn:
+                for trigger in DEPENDENCY_CHANGE_TRIGGERS:
+                    conn.execute(text(trigger))
+        except Exception as e:
+            print(f"Warning: Could not install dependency change triggers: {e}")
+
+    def run_pending_items_index_migration(self):
+        """Create the partial pending items index on databases created before it"""
+        from sqlalchemy import text
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(
+                    text(
+                        "CREATE INDEX IF NOT EXISTS idx_todo_items_pending_position "
+                        "ON todo_items (list_id, position, item_key) "
+                        "WHERE status = 'pending'"
+                    )
+                )
+        except Exception as e:
+            print(f"Warning: Could not create pending items index: {e}")
+
+    def run_list_counters_migration(self):
+        """Install the list_counters triggers and backfill lists without a row"""
+        from sqlalchemy import text
+
+        try:
+            with self.engine.begin() as conn:
+                for trigger in LIST_COUNTER_TRIGGERS:
+                    conn.execute(text(trigger))
+                conn.execute(
+                    text(
+                        "INSERT INTO list_counters "
+                        f"({', '.join(['list_id', *LIST_COUNTER_COLUMNS])}, "
+                        "last_item_update)"
+                        f"{LIST_COUNTS_SELECT}"
+                        "WHERE todo_lists.id NOT IN (SELECT list_id FROM list_counters) "
+                        "GROUP BY todo_lists.id"
+                    )
+                )
+        except Exception as e:
+            print(f"Warning: Could not install list counters: {e}")
+
+    def run_parent_status_triggers_migration(self):
+        """Install the triggers that derive parent status from children"""
+        from sqlalchemy import text
+
+        try:
+            with self.engine.begin() as conn:
+                # Replace a child_changed trigger installed before batch deferral
+                old_definition = conn.execute(
+                    text(
+                        "SELECT sql FROM sqlite_master WHERE type = 'trigger' "
+                        "AND name = 'trg_parent_status_child_changed'"
+                    )
+                ).scalar()
+                if old_definition and "parent_status_deferrals" not in old_definition:
+                    conn.execute(text("DROP TRIGGER trg_parent_status_child_changed"))
+                for trigger in PARENT_STATUS_TRIGGERS:
+                    conn.execute(text(trigger))
+        except Exception as e:
+            print(f"Warning: Could not install parent status triggers: {e}")
+
+    def run_item_closure_migration(self):
+        """Install the item_closure triggers and rebuild it when out of step"""
+        from sqlalchemy import text
+
+        try:
+            with self.engine.begin() as conn:
+                for trigger in ITEM_CLOSURE_TRIGGERS:
+                    conn.execute(text(trigger))
+                items = conn.execute(text("SELECT COUNT(*) FROM todo_items")).scalar()
+                closed = conn.execute(
+                    text("SELECT COUNT(*) FROM item_closure WHERE depth = 0")
+                ).scalar()
+                if items != closed:
+                    conn.execute(text("DELETE FROM item_closure"))
+                    conn.execute(
+                        text(
+                            "INSERT INTO item_closure "
+                            "(ancestor_id, descendant_id, depth)"
+                            f"{ITEM_CLOSURE_SELECT}"
+                        )
+                    )
+        except Exception as e:
+            print(f"Warning: Could not install item closure: {e}")
+
     def run_subtask_flexibility_migration(self):
         """Run migration to enable duplicate subtask keys across different parent tasks"""
         try:
@@ -435,31 +1264,204 @@ class Database:
     def get_list_by_key(self, list_key: str) -> Optional[TodoListDB]:
         """Get list by key"""
         with self.get_session() as session:
-            return (
-                session.query(TodoListDB)
-                .filter(TodoListDB.list_key == list_key)
-                .first()
+            return self._get_by_cached_key(
+                session,
+                TodoListDB,
+                KeyCache.list_entry(list_key),
+                lambda db_list: db_list.list_key == list_key,
+                session.query(TodoListDB).filter(TodoListDB.list_key == list_key),
+            )
+
+    def get_list_id(self, list_key: str) -> Optional[int]:
+        """Get a list ID by key, from the key cache when possible"""
+        return self._get_cached_id(
+            KeyCache.list_entry(list_key),
+            lambda session: session.query(TodoListDB.id).filter(
+                TodoListDB.list_key == list_key
+            ),
+        )
+
+    def get_item_id(
+        self,
+        list_id: int,
+        item_key: str,
+        parent_item_id: Union[int, None, str] = ANY_PARENT,
+    ) -> Optional[int]:
+        """Get an item ID by key, from the key cache when possible
+
+        Args:
+            list_id: The list ID
+            item_key: The item key
+            parent_item_id: Parent ID (None for root items); ANY_PARENT matches
+                the key under any parent, like get_item_by_key
+        """
+
+        def query(session):
+            query = session.query(TodoItemDB.id).filter(
+                TodoItemDB.list_id == list_id, TodoItemDB.item_key == item_key
             )
+            if parent_item_id != ANY_PARENT:
+                query = query.filter(TodoItemDB.parent_item_id == parent_item_id)
+            return query
+
+        return self._get_cached_id(
+            KeyCache.item_entry(list_id, parent_item_id, item_key), query
+        )
+
+    def _get_by_cached_key(self, session, model, entry, matches, query):
+        """Load a row through the key cache, verifying the cached ID.
+
+        A hit becomes a primary key load, answered from the session's
+        identity map when a unit of work has already loaded the row; rows
+        that no longer match the key (e.g. rolled back) are looked up again.
+        """
+        cache = self.key_cache
+        if cache is None:
+            return query.first()
+
+        row_id = cache.get(entry)
+        if row_id is not None:
+            row = session.get(model, row_id)
+            if row is not None and matches(row):
+                return row
+            cache.discard(entry)
+
+        generation = cache.generation()
+        row = query.first()
+        if row is not None:
+            cache.put(entry, row.id, generation)
+        return row
+
+    def _get_cached_id(self, entry, query) -> Optional[int]:
+        """Resolve an ID through the key cache without loading the row.
+
+        Unverified, so the cache is bypassed inside a unit of work where
+        uncommitted renames and deletes may not have reached it.
+        """
+        cache = self.key_cache
+        in_unit_of_work = self.in_unit_of_work()
+        if cache is not None and not in_unit_of_work:
+            row_id = cache.get(entry)
+            if row_id is not None:
+                return row_id
+            generation = cache.generation()
+
+        with self.get_session() as session:
+            row = query(session).first()
+        if row is None:
+            return None
+        if cache is not None and not in_unit_of_work:
+            cache.put(entry, row.id, generation)
+        return row.id
 
     def get_all_lists(self, limit: Optional[int] = None) -> List[TodoListDB]:
         """Get all lists with natural sorting"""
         with self.get_session() as session:
-            # Get all lists first, then sort naturally in Python
-            lists = session.query(TodoListDB).all()
+            query = session.query(TodoListDB).order_by(
+                TodoListDB.sort_key, TodoListDB.id
+            )
+            if limit:
+                query = query.limit(limit)
+            return query.all()
+
+    def get_lists_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        include_archived: bool = False,
+        tag_names: Optional[List[str]] = None,
+        match_all_tags: bool = False,
+        search: Optional[str] = None,
+        property_filters: Optional[Dict[str, str]] = None,
+        order_by_key: bool = False,
+    ) -> Tuple[List[TodoListDB], int]:
+        """Get one page of lists plus the total number of matching lists.
+
+        Filtering (archived status, tags, search, properties), ordering and
+        paging all happen in SQL, so only the rows of the requested page are
+        loaded.
+
+        Args:
+            limit: Maximum number of lists to return
+            offset: Number of lists to skip
+            include_archived: Whether archived lists are included
+            tag_names: Optional tag names to filter by
+            match_all_tags: If True list must have ALL tag_names (AND logic),
+                otherwise ANY of them (OR logic)
+            search: Optional substring of list_key or title, matched with
+                Unicode case folding
+            property_filters: Optional list property values the list must have
+            order_by_key: Order by plain list_key instead of natural order
+
+        Returns:
+            Tuple of (lists on the requested page, total matching lists)
+        """
+        with self.get_session() as session:
+            query = session.query(TodoListDB)
+
+            if not include_archived:
+                query = query.filter(TodoListDB.status != "archived")
+
+            if search:
+                folded = search.casefold()
+                query = query.filter(
+                    or_(
+                        func.casefold(TodoListDB.list_key).contains(
+                            folded, autoescape=True
+                        ),
+                        func.casefold(TodoListDB.title).contains(
+                            folded, autoescape=True
+                        ),
+                    )
+                )
+
+            for property_key, property_value in (property_filters or {}).items():
+                query = query.filter(
+                    select(ListPropertyDB.id)
+                    .where(
+                        ListPropertyDB.list_id == TodoListDB.id,
+                        ListPropertyDB.property_key == property_key,
+                        ListPropertyDB.property_value == property_value,
+                    )
+                    .exists()
+                )
 
-            # Sort using natural sort key
-            lists.sort(key=lambda lst: self.natural_sort_key(lst.list_key))
+            if tag_names:
+                query = query.filter(
+                    TodoListDB.id.in_(
+                        self._tagged_list_ids(session, tag_names, match_all_tags)
+                    )
+                )
 
-            # Apply limit after sorting
-            if limit and len(lists) > limit:
-                lists = lists[:limit]
+            total = query.count()
+            if order_by_key:
+                query = query.order_by(TodoListDB.list_key)
+            else:
+                query = query.order_by(TodoListDB.sort_key, TodoListDB.id)
+            return query.offset(offset).limit(limit).all(), total
 
-            return lists
+    @staticmethod
+    def _tagged_list_ids(session, tag_names: List[str], match_all_tags: bool):
+        """Subquery of list IDs tagged with ANY (or ALL) of tag_names"""
+        normalized_names = [name.lower() for name in tag_names]
+        tagged_lists = (
+            session.query(ListTagAssignmentDB.list_id)
+            .join(ListTagDB, ListTagAssignmentDB.tag_id == ListTagDB.id)
+            .filter(ListTagDB.name.in_(normalized_names))
+            .group_by(ListTagAssignmentDB.list_id)
+        )
+        if match_all_tags:
+            tagged_lists = tagged_lists.having(
+                func.count(ListTagDB.id.distinct()) == len(normalized_names)
+            )
+        return tagged_lists
 
     def update_list(
         self, list_id: int, updates: Dict[str, Any]
     ) -> Optional[TodoListDB]:
         """Update list"""
+        if self.key_cache is not None and "list_key" in updates:
+            self.key_cache.invalidate_list(list_id)
         with self.get_session() as session:
             db_list = session.query(TodoListDB).filter(TodoListDB.id == list_id).first()
             if db_list:
@@ -472,6 +1474,8 @@ class Database:
 
     def delete_list(self, list_id: int) -> bool:
         """Delete list"""
+        if self.key_cache is not None:
+            self.key_cache.invalidate_list(list_id)
         with self.get_session() as session:
             db_list = session.query(TodoListDB).filter(TodoListDB.id == list_id).first()
             if db_list:
@@ -498,10 +1502,15 @@ class Database:
     def get_item_by_key(self, list_id: int, item_key: str) -> Optional[TodoItemDB]:
         """Get item by list_id and item_key"""
         with self.get_session() as session:
-            return (
-                session.query(TodoItemDB)
-                .filter(TodoItemDB.list_id == list_id, TodoItemDB.item_key == item_key)
-                .first()
+            return self._get_by_cached_key(
+                session,
+                TodoItemDB,
+                KeyCache.item_entry(list_id, ANY_PARENT, item_key),
+                lambda db_item: db_item.list_id == list_id
+                and db_item.item_key == item_key,
+                session.query(TodoItemDB).filter(
+                    TodoItemDB.list_id == list_id, TodoItemDB.item_key == item_key
+                ),
             )
 
     def get_item_by_key_and_parent(
@@ -514,7 +1523,15 @@ class Database:
                 TodoItemDB.item_key == item_key,
                 TodoItemDB.parent_item_id == parent_item_id,
             )
-            return query.first()
+            return self._get_by_cached_key(
+                session,
+                TodoItemDB,
+                KeyCache.item_entry(list_id, parent_item_id, item_key),
+                lambda db_item: db_item.list_id == list_id
+                and db_item.item_key == item_key
+                and db_item.parent_item_id == parent_item_id,
+                query,
+            )
 
     def get_list_items(
         self, list_id: int, status: Optional[str] = None, limit: Optional[int] = None
@@ -525,97 +1542,44 @@ class Database:
             if status:
                 query = query.filter(TodoItemDB.status == status)
 
-            # Get all items first, then sort naturally in Python
-            items = query.all()
-
-            # Separate main items and subitems
-            main_items = [item for item in items if item.parent_item_id is None]
-            subitems = [item for item in items if item.parent_item_id is not None]
-
-            # Sort main items naturally by item_key
-            main_items.sort(key=lambda item: self.natural_sort_key(item.item_key))
-
-            # Group subitems by parent and sort each group naturally
-            subitems_by_parent = {}
-            for subitem in subitems:
-                parent_id = subitem.parent_item_id
-                if parent_id not in subitems_by_parent:
-                    subitems_by_parent[parent_id] = []
-                subitems_by_parent[parent_id].append(subitem)
-
-            # Sort each subitem group naturally
-            for parent_id in subitems_by_parent:
-                subitems_by_parent[parent_id].sort(
-                    key=lambda item: self.natural_sort_key(item.item_key)
-                )
-
-            # Combine: main items first, then subitems grouped by parent
-            result = []
-            for main_item in main_items:
-                result.append(main_item)
-                # Add subitems for this parent
-                if main_item.id in subitems_by_parent:
-                    result.extend(subitems_by_parent[main_item.id])
-
-            # Add any orphaned subitems at the end
-            for parent_id, orphaned_subitems in subitems_by_parent.items():
-                # Check if this parent was already processed
-                if not any(item.id == parent_id for item in main_items):
-                    result.extend(orphaned_subitems)
-
-            # Apply limit after sorting
+            query = self._order_items_hierarchically(query, status)
             if limit is not None and limit >= 0:
-                result = result[:limit]
-
-            return result
-
-    def get_items_by_status(self, list_id: int, status: str) -> List[TodoItemDB]:
-        """Get items by status with natural sorting"""
-        with self.get_session() as session:
-            items = (
-                session.query(TodoItemDB)
-                .filter(TodoItemDB.list_id == list_id, TodoItemDB.status == status)
-                .all()
-            )
-
-            # Use same natural sorting logic as get_list_items
-            main_items = [item for item in items if item.parent_item_id is None]
-            subitems = [item for item in items if item.parent_item_id is not None]
-
-            # Sort main items naturally by item_key
-            main_items.sort(key=lambda item: self.natural_sort_key(item.item_key))
-
-            # Group and sort subitems
-            subitems_by_parent = {}
-            for subitem in subitems:
-                parent_id = subitem.parent_item_id
-                if parent_id not in subitems_by_parent:
-                    subitems_by_parent[parent_id] = []
-                subitems_by_parent[parent_id].append(subitem)
-
-            for parent_id in subitems_by_parent:
-                subitems_by_parent[parent_id].sort(
-                    key=lambda item: self.natural_sort_key(item.item_key)
-                )
-
-            # Combine results
-            result = []
-            for main_item in main_items:
-                result.append(main_item)
-                if main_item.id in subitems_by_parent:
-                    result.extend(subitems_by_parent[main_item.id])
+                query = query.limit(limit)
+            return query.all()
 
-            # Add orphaned subitems
-            for parent_id, orphaned_subitems in subitems_by_parent.items():
-                if not any(item.id == parent_id for item in main_items):
-                    result.extend(orphaned_subitems)
+    @staticmethod
+    def _order_items_hierarchically(query, status: Optional[str] = None):
+        """Order an item query as main items, each followed by its subitems.
 
-            return result
+        Main items and each subitem group are in natural order (sort_key).
+        Subitems whose parent is not a main item in the result (deeper levels,
+        or a parent excluded by the status filter) come last, grouped by parent.
+        """
+        parent = aliased(TodoItemDB)
+        is_main = TodoItemDB.parent_item_id.is_(None)
+        parent_in_result = parent.parent_item_id.is_(None)
+        if status:
+            parent_in_result = and_(parent_in_result, parent.status == status)
+
+        query = query.outerjoin(parent, TodoItemDB.parent_item_id == parent.id)
+        return query.order_by(
+            # Main items and their subitems first, other subitems last
+            case((is_main, 0), (parent_in_result, 0), else_=1),
+            # Group = main item (by natural key, then id for equal keys)
+            case((is_main, TodoItemDB.sort_key), (parent_in_result, parent.sort_key)),
+            case((is_main, TodoItemDB.id), else_=TodoItemDB.parent_item_id),
+            # Main item before its subitems, subitems in natural order
+            case((is_main, 0), else_=1),
+            TodoItemDB.sort_key,
+            TodoItemDB.id,
+        )
 
     def update_item(
         self, item_id: int, updates: Dict[str, Any]
     ) -> Optional[TodoItemDB]:
         """Update item"""
+        if self.key_cache is not None and KEY_CACHE_ITEM_FIELDS.intersection(updates):
+            self.key_cache.invalidate_item(item_id)
         with self.get_session() as session:
             db_item = session.query(TodoItemDB).filter(TodoItemDB.id == item_id).first()
             if db_item:
@@ -652,6 +1616,8 @@ class Database:
 
     def delete_item(self, item_id: int) -> bool:
         """Delete item (and related records)"""
+        if self.key_cache is not None:
+            self.key_cache.invalidate_item(item_id)
         with self.get_session() as session:
             db_item = session.query(TodoItemDB).filter(TodoItemDB.id == item_id).first()
             if db_item:
@@ -739,39 +1705,219 @@ class Database:
     # Statistics and progress
     def get_list_stats(self, list_id: int) -> Dict[str, int]:
         """Get statistics for a list"""
-        with self.get_session() as session:
-            items = (
-                session.query(TodoItemDB).filter(TodoItemDB.list_id == list_id).all()
-            )
+        counters = self.get_counters_for_lists([list_id])[list_id]
+        return {
+            status: counters[status]
+            for status in ("total", "pending", "in_progress", "completed", "failed")
+        }
 
-            stats = {
-                "total": len(items),
-                "pending": 0,
-                "in_progress": 0,
-                "completed": 0,
-                "failed": 0,
-            }
+    def get_counters_for_lists(self, list_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Read the trigger-maintained list_counters rows of several lists.
 
-            for item in items:
-                if item.status in stats:
-                    stats[item.status] += 1
+        Returns:
+            Dict mapping list_id to dict with keys total, pending, in_progress,
+            completed, failed, root_items, subtasks and last_item_update
+        """
+        counters = {
+            list_id: {
+                **{column: 0 for column in LIST_COUNTER_COLUMNS},
+                "last_item_update": None,
+            }
+            for list_id in list_ids
+        }
+        columns = [
+            getattr(ListCounterDB, column)
+            for column in [*LIST_COUNTER_COLUMNS, "last_item_update"]
+        ]
+        with self.get_session() as session:
+            for start in range(0, len(list_ids), 900):
+                chunk = list_ids[start : start + 900]
+                for list_id, *values in (
+                    session.query(ListCounterDB.list_id, *columns)
+                    .filter(ListCounterDB.list_id.in_(chunk))
+                    .all()
+                ):
+                    counters[list_id] = dict(
+                        zip([*LIST_COUNTER_COLUMNS, "last_item_update"], values)
+                    )
+        return counters
 
-            return stats
+    def recount_list_counters(
+        self, list_ids: Optional[List[int]] = None
+    ) -> Dict[str, int]:
+        """Rebuild list_counters from todo_items.
 
-    # History operations
-    def create_history_entry(self, history_data: Dict[str, Any]) -> TodoHistoryDB:
-        """Create history entry"""
-        with self.get_session() as session:
-            db_history = TodoHistoryDB(**history_data)
-            session.add(db_history)
-            session.commit()
-            session.refresh(db_history)
-            return db_history
+        Args:
+            list_ids: Lists to recount (None = every list)
 
-    def get_item_history(
-        self, item_id: int, limit: Optional[int] = None
-    ) -> List[TodoHistoryDB]:
-        """Get history for an item"""
+        Returns:
+            Dict with 'lists' (lists checked) and 'corrected' (counter rows
+            that were missing, wrong or orphaned)
+        """
+        columns = ["list_id", *LIST_COUNTER_COLUMNS, "last_item_update"]
+        list_filter = ""
+        params: Dict[str, Any] = {}
+        if list_ids is not None:
+            list_filter = "WHERE {column} IN :list_ids "
+            params["list_ids"] = list(list_ids)
+
+        def query(sql: str, column: str):
+            statement = text(sql.format(column=column))
+            if list_ids is not None:
+                statement = statement.bindparams(bindparam("list_ids", expanding=True))
+            return session.execute(statement, params).all()
+
+        with self.get_session() as session:
+            fresh = {
+                row[0]: tuple(row)
+                for row in query(
+                    f"{LIST_COUNTS_SELECT}{list_filter}GROUP BY todo_lists.id",
+                    "todo_lists.id",
+                )
+            }
+            stored = {
+                row[0]: tuple(row)
+                for row in query(
+                    f"SELECT {', '.join(columns)} FROM list_counters {list_filter}",
+                    "list_id",
+                )
+            }
+
+            changed = [
+                row for list_id, row in fresh.items() if stored.get(list_id) != row
+            ]
+            orphaned = [list_id for list_id in stored if list_id not in fresh]
+            if changed:
+                session.execute(
+                    text(
+                        f"INSERT OR REPLACE INTO list_counters ({', '.join(columns)}) "
+                        f"VALUES ({', '.join(':' + column for column in columns)})"
+                    ),
+                    [dict(zip(columns, row)) for row in changed],
+                )
+            if orphaned:
+                session.query(ListCounterDB).filter(
+                    ListCounterDB.list_id.in_(orphaned)
+                ).delete(synchronize_session=False)
+            session.commit()
+
+        return {"lists": len(fresh), "corrected": len(changed) + len(orphaned)}
+
+    def get_list_progress_stats(self, list_id: int) -> Dict[str, int]:
+        """Get full progress statistics for a list in a constant number of queries"""
+        return self.get_progress_stats_for_lists([list_id])[list_id]
+
+    def get_progress_stats_for_lists(
+        self, list_ids: List[int]
+    ) -> Dict[int, Dict[str, int]]:
+        """Get full progress statistics for multiple lists in a constant number of queries.
+
+        Computes status counts, root/subtask counts, maximum hierarchy depth
+        (recursive CTE) and blocked/available pending items (single join against
+        item_dependencies) without loading items into Python.
+
+        Args:
+            list_ids: List of list IDs to get statistics for
+
+        Returns:
+            Dict mapping list_id to dict with keys total, pending, in_progress,
+            completed, failed, root_items, subtasks, hierarchy_depth, blocked,
+            available and dependency_count
+        """
+        stats_by_list = {
+            list_id: {
+                "total": 0,
+                "pending": 0,
+                "in_progress": 0,
+                "completed": 0,
+                "failed": 0,
+                "root_items": 0,
+                "subtasks": 0,
+                "hierarchy_depth": 0,
+                "blocked": 0,
+                "available": 0,
+                "dependency_count": 0,
+            }
+            for list_id in list_ids
+        }
+        if not list_ids:
+            return stats_by_list
+
+        with self.get_session() as session:
+            # Status and hierarchy counts from the maintained counters
+            for list_id, counters in self.get_counters_for_lists(list_ids).items():
+                stats = stats_by_list[list_id]
+                for column in LIST_COUNTER_COLUMNS:
+                    stats[column] = counters[column]
+
+            # Maximum depth from the closure rows ending at each list item
+            depths = session.execute(
+                select(TodoItemDB.list_id, func.max(ItemClosureDB.depth))
+                .join(ItemClosureDB, ItemClosureDB.descendant_id == TodoItemDB.id)
+                .where(TodoItemDB.list_id.in_(list_ids))
+                .group_by(TodoItemDB.list_id)
+            ).all()
+            for list_id, max_depth in depths:
+                stats_by_list[list_id]["hierarchy_depth"] = max_depth or 0
+
+            # Pending items blocked by at least one uncompleted required item
+            required = aliased(TodoItemDB)
+            blocked = (
+                session.query(
+                    TodoItemDB.list_id, func.count(func.distinct(TodoItemDB.id))
+                )
+                .join(
+                    ItemDependencyDB,
+                    ItemDependencyDB.dependent_item_id == TodoItemDB.id,
+                )
+                .join(required, ItemDependencyDB.required_item_id == required.id)
+                .filter(
+                    TodoItemDB.list_id.in_(list_ids),
+                    TodoItemDB.status == "pending",
+                    required.status != "completed",
+                )
+                .group_by(TodoItemDB.list_id)
+                .all()
+            )
+            for list_id, blocked_count in blocked:
+                stats_by_list[list_id]["blocked"] = blocked_count
+            for stats in stats_by_list.values():
+                stats["available"] = stats["pending"] - stats["blocked"]
+
+            # Dependencies touching each list on either side (counted once per list)
+            touching = union(
+                select(
+                    ItemDependencyDB.id.label("dependency_id"),
+                    TodoItemDB.list_id.label("list_id"),
+                ).join(TodoItemDB, ItemDependencyDB.dependent_item_id == TodoItemDB.id),
+                select(ItemDependencyDB.id, TodoItemDB.list_id).join(
+                    TodoItemDB, ItemDependencyDB.required_item_id == TodoItemDB.id
+                ),
+            ).subquery()
+            dependency_counts = session.execute(
+                select(touching.c.list_id, func.count(touching.c.dependency_id))
+                .where(touching.c.list_id.in_(list_ids))
+                .group_by(touching.c.list_id)
+            ).all()
+            for list_id, dependency_count in dependency_counts:
+                stats_by_list[list_id]["dependency_count"] = dependency_count
+
+            return stats_by_list
+
+    # History operations
+    def create_history_entry(self, history_data: Dict[str, Any]) -> TodoHistoryDB:
+        """Create history entry"""
+        with self.get_session() as session:
+            db_history = TodoHistoryDB(**history_data)
+            session.add(db_history)
+            session.commit()
+            session.refresh(db_history)
+            return db_history
+
+    def get_item_history(
+        self, item_id: int, limit: Optional[int] = None
+    ) -> List[TodoHistoryDB]:
+        """Get history for an item"""
         with self.get_session() as session:
             query = (
                 session.query(TodoHistoryDB)
@@ -820,8 +1966,175 @@ class Database:
             session.commit()
             return items
 
+    def get_items_by_key_pairs(
+        self, list_id: int, key_pairs: List[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], TodoItemDB]:
+        """Resolve (item_key, parent_item_key) pairs of a list in one query
+
+        Parent keys resolve like get_item_by_key (first item with that key).
+        Pairs that cannot be resolved are missing from the result.
+        """
+        keys = {key for pair in key_pairs for key in pair if key}
+        if not keys:
+            return {}
+
+        with self.get_session() as session:
+            rows = (
+                session.query(TodoItemDB)
+                .filter(TodoItemDB.list_id == list_id, TodoItemDB.item_key.in_(keys))
+                .order_by(TodoItemDB.id)
+                .all()
+            )
+
+        first_by_key: Dict[str, TodoItemDB] = {}
+        for row in rows:
+            first_by_key.setdefault(row.item_key, row)
+        by_key_and_parent = {(row.item_key, row.parent_item_id): row for row in rows}
+
+        resolved = {}
+        for item_key, parent_key in key_pairs:
+            parent_id = None
+            if parent_key:
+                parent = first_by_key.get(parent_key)
+                if parent is None:
+                    continue
+                parent_id = parent.id
+            item = by_key_and_parent.get((item_key, parent_id))
+            if item is not None:
+                resolved[(item_key, parent_key)] = item
+        return resolved
+
+    def get_item_ids_with_children(self, item_ids: List[int]) -> Set[int]:
+        """Return the subset of item_ids that have at least one child"""
+        if not item_ids:
+            return set()
+
+        with self.get_session() as session:
+            rows = (
+                session.query(TodoItemDB.parent_item_id)
+                .filter(TodoItemDB.parent_item_id.in_(item_ids))
+                .distinct()
+                .all()
+            )
+            return {row[0] for row in rows}
+
+    def recompute_parent_statuses(self, list_id: Optional[int] = None) -> int:
+        """Re-derive the status of every parent item in one UPDATE.
+
+        Triggers keep parent statuses in step with their children; this
+        repairs parents that drifted (e.g. databases written before the
+        triggers). Each corrected parent propagates to its own ancestors.
+
+        Args:
+            list_id: Only recompute parents in this list (default: all lists)
+
+        Returns:
+            Number of items whose status changed
+        """
+        condition = "1"
+        params: Dict[str, Any] = {}
+        if list_id is not None:
+            condition = "list_id = :list_id"
+            params["list_id"] = list_id
+        snapshot = text(
+            "SELECT id, status FROM todo_items "
+            f"WHERE {condition} AND id IN "
+            "(SELECT parent_item_id FROM todo_items WHERE parent_item_id IS NOT NULL)"
+        )
+
+        with self.get_session() as session:
+            before = dict(session.execute(snapshot, params).all())
+            session.execute(text(_parent_status_update(condition)), params)
+            after = dict(session.execute(snapshot, params).all())
+            session.commit()
+
+        return sum(
+            1 for item_id, status in after.items() if before.get(item_id) != status
+        )
+
+    def update_items_by_id(
+        self,
+        item_updates: Dict[int, Dict[str, Any]],
+        defer_parent_status: bool = False,
+    ) -> Dict[int, TodoItemDB]:
+        """Apply per-item updates with executemany and return the updated items
+
+        Items sharing the same set of updated columns are written with a single
+        executemany UPDATE, so callers should pass the same keys for every item.
+
+        With defer_parent_status, the parent status trigger is suspended for
+        the batch and every affected parent is re-derived once afterwards,
+        instead of once per updated child.
+        """
+        if not item_updates:
+            return {}
+
+        table = TodoItemDB.__table__
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for item_id, fields in item_updates.items():
+            columns = tuple(sorted(fields))
+            groups.setdefault(columns, []).append({"_id": item_id, **fields})
+
+        with self.get_session() as session:
+            if defer_parent_status:
+                session.execute(ParentStatusDeferralDB.__table__.insert())
+                parent_ids = self._parent_ids_of(session, item_updates)
+            for columns, rows in groups.items():
+                statement = (
+                    table.update()
+                    .where(table.c.id == bindparam("_id"))
+                    .values({column: bindparam(column) for column in columns})
+                )
+                session.execute(statement, rows)
+            if defer_parent_status:
+                session.execute(ParentStatusDeferralDB.__table__.delete())
+                if any("parent_item_id" in fields for fields in item_updates.values()):
+                    parent_ids |= self._parent_ids_of(session, item_updates)
+                if parent_ids:
+                    # Changed parents propagate to their ancestors via the trigger
+                    session.execute(
+                        text(_parent_status_update("id IN :parent_ids")).bindparams(
+                            bindparam("parent_ids", expanding=True)
+                        ),
+                        {"parent_ids": sorted(parent_ids)},
+                    )
+            session.commit()
+
+            # Reload in one query, refreshing objects already in the session
+            items = (
+                session.query(TodoItemDB)
+                .filter(TodoItemDB.id.in_(list(item_updates)))
+                .populate_existing()
+                .all()
+            )
+            return {item.id: item for item in items}
+
+    @staticmethod
+    def _parent_ids_of(session, item_ids) -> Set[int]:
+        """IDs of the parents of the given items"""
+        return set(
+            session.execute(
+                select(TodoItemDB.parent_item_id).where(
+                    TodoItemDB.id.in_(list(item_ids)),
+                    TodoItemDB.parent_item_id.isnot(None),
+                )
+            ).scalars()
+        )
+
+    def create_history_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """Create many history entries in one executemany INSERT"""
+        if not entries:
+            return
+
+        with self.get_session() as session:
+            rows = [{"timestamp": utc_now(), **entry} for entry in entries]
+            session.execute(insert(TodoHistoryDB), rows)
+            session.commit()
+
     def delete_list_items(self, list_id: int):
         """Delete all items in a list"""
+        if self.key_cache is not None:
+            self.key_cache.invalidate_list(list_id)
         with self.get_session() as session:
             items = (
                 session.query(TodoItemDB).filter(TodoItemDB.list_id == list_id).all()
@@ -962,6 +2275,126 @@ class Database:
             )
             return {prop.property_key: prop.property_value for prop in properties}
 
+    def get_item_properties_for_list(
+        self,
+        list_id: int,
+        status: Optional[str] = None,
+        item_ids: Optional[List[int]] = None,
+    ) -> Dict[int, Dict[str, str]]:
+        """Properties of the items of a list in one query, keyed by item ID
+
+        Args:
+            list_id: List whose item properties are loaded
+            status: Only items with this status
+            item_ids: Only these items (keep it below SQLite's variable limit)
+        """
+        with self.get_session() as session:
+            query = (
+                session.query(
+                    ItemPropertyDB.item_id,
+                    ItemPropertyDB.property_key,
+                    ItemPropertyDB.property_value,
+                )
+                .join(TodoItemDB, ItemPropertyDB.item_id == TodoItemDB.id)
+                .filter(TodoItemDB.list_id == list_id)
+            )
+            if status is not None:
+                query = query.filter(TodoItemDB.status == status)
+            if item_ids is not None:
+                query = query.filter(ItemPropertyDB.item_id.in_(item_ids))
+
+            properties: Dict[int, Dict[str, str]] = {}
+            for item_id, key, value in query.order_by(ItemPropertyDB.id):
+                properties.setdefault(item_id, {})[key] = value
+            return properties
+
+    def iter_failed_items(
+        self,
+        list_key_pattern: Optional[str] = None,
+        tag_names: Optional[List[str]] = None,
+        match_all_tags: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream failed items of active lists with their properties
+
+        Lists, failed items and item properties come from one joined query;
+        rows are fetched in batches of batch_size and yielded one item at a
+        time, ordered by list_key and position.
+
+        Args:
+            list_key_pattern: Optional regular expression list keys must match
+                from their start (re.match semantics, see regexp_match_start)
+            tag_names: Optional tag names to filter lists by
+            match_all_tags: If True list must have ALL tag_names (AND logic),
+                otherwise ANY of them (OR logic)
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            One dict per failed item with list context and a properties dict
+        """
+        with self.get_session() as session:
+            query = (
+                session.query(
+                    TodoListDB.list_key,
+                    TodoListDB.title,
+                    TodoListDB.list_type,
+                    TodoItemDB.id,
+                    TodoItemDB.item_key,
+                    TodoItemDB.content,
+                    TodoItemDB.position,
+                    TodoItemDB.parent_item_id,
+                    TodoItemDB.updated_at,
+                    TodoItemDB.created_at,
+                    ItemPropertyDB.property_key,
+                    ItemPropertyDB.property_value,
+                )
+                .join(TodoItemDB, TodoItemDB.list_id == TodoListDB.id)
+                .outerjoin(ItemPropertyDB, ItemPropertyDB.item_id == TodoItemDB.id)
+                .filter(TodoListDB.status != "archived")
+                .filter(TodoItemDB.status == "failed")
+            )
+
+            if list_key_pattern:
+                query = query.filter(
+                    func.regexp_match_start(list_key_pattern, TodoListDB.list_key)
+                )
+            if tag_names:
+                query = query.filter(
+                    TodoListDB.id.in_(
+                        self._tagged_list_ids(session, tag_names, match_all_tags)
+                    )
+                )
+
+            query = query.order_by(
+                TodoListDB.list_key,
+                TodoItemDB.position,
+                TodoItemDB.id,
+                ItemPropertyDB.id,
+            ).yield_per(batch_size)
+
+            current, current_id = None, None
+            for row in query:
+                if current_id != row.id:
+                    if current is not None:
+                        yield current
+                    current_id = row.id
+                    current = {
+                        "list_key": row.list_key,
+                        "list_title": row.title,
+                        "list_type": (row.list_type or "sequential").lower(),
+                        "item_key": row.item_key,
+                        "content": row.content,
+                        "position": row.position,
+                        "parent_item_id": row.parent_item_id,
+                        "updated_at": row.updated_at,
+                        "created_at": row.created_at,
+                        "properties": {},
+                    }
+                if row.property_key is not None:
+                    current["properties"][row.property_key] = row.property_value
+            if current is not None:
+                yield current
+
     def delete_item_property(self, item_id: int, property_key: str) -> bool:
         """Delete item property"""
         with self.get_session() as session:
@@ -1010,16 +2443,62 @@ class Database:
             if list_id is not None:
                 query = query.filter(TodoItemDB.list_id == list_id)
 
-            items = query.all()
+            query = query.order_by(TodoItemDB.sort_key, TodoItemDB.id)
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
 
-            # Sort naturally by item_key
-            items.sort(key=lambda item: self.natural_sort_key(item.item_key))
+    def find_items_by_property_with_context(
+        self,
+        list_id: Optional[int],
+        property_key: str,
+        property_value: str,
+        limit: Optional[int] = None,
+        cursor: Optional[int] = None,
+    ) -> List[Tuple[TodoItemDB, str, Optional[str]]]:
+        """Find items by property value together with their list and parent keys
 
-            # Apply limit after sorting
-            if limit is not None:
-                items = items[:limit]
+        Joins todo_lists and the parent item in the same query, so callers do
+        not need a lookup per result. Results are ordered by (sort_key, id);
+        passing the ID of the last item of a page as cursor continues after it.
 
-            return items
+        Args:
+            list_id: List ID to search in (None = search all lists)
+            property_key: Property name to match
+            property_value: Property value to match
+            limit: Maximum number of results (None = all)
+            cursor: ID of the item to continue after (None = from the start)
+
+        Returns:
+            List of (TodoItemDB, list_key, parent_item_key) tuples
+        """
+        parent = aliased(TodoItemDB)
+        with self.get_session() as session:
+            query = (
+                session.query(TodoItemDB, TodoListDB.list_key, parent.item_key)
+                .join(ItemPropertyDB, TodoItemDB.id == ItemPropertyDB.item_id)
+                .join(TodoListDB, TodoListDB.id == TodoItemDB.list_id)
+                .outerjoin(parent, parent.id == TodoItemDB.parent_item_id)
+                .filter(ItemPropertyDB.property_key == property_key)
+                .filter(ItemPropertyDB.property_value == property_value)
+            )
+
+            if list_id is not None:
+                query = query.filter(TodoItemDB.list_id == list_id)
+
+            if cursor is not None:
+                after = aliased(TodoItemDB)
+                query = query.filter(
+                    tuple_(TodoItemDB.sort_key, TodoItemDB.id)
+                    > select(after.sort_key, after.id)
+                    .where(after.id == cursor)
+                    .scalar_subquery()
+                )
+
+            query = query.order_by(TodoItemDB.sort_key, TodoItemDB.id)
+            if limit is not None:
+                query = query.limit(limit)
+            return [tuple(row) for row in query.all()]
 
     def find_subitems_by_status(
         self,
@@ -1045,66 +2524,82 @@ class Database:
             ]
         """
         with self.get_session() as session:
-            matches = []
-
-            # Find all unique parent_item_id values in the list
-            parents_query = (
-                session.query(TodoItemDB.parent_item_id)
+            parents = (
+                session.query(TodoItemDB)
                 .filter(
-                    TodoItemDB.list_id == list_id,
-                    TodoItemDB.parent_item_id.isnot(None),
+                    TodoItemDB.id.in_(
+                        self._parents_matching_subitems(conditions, list_id)
+                    )
                 )
-                .distinct()
+                .order_by(TodoItemDB.id)
+                .limit(limit)
+                .all()
             )
+            subitems = self._get_subitems_by_keys(
+                session,
+                [parent.id for parent in parents],
+                list(conditions),
+                order_by=(TodoItemDB.sort_key, TodoItemDB.id),
+            )
+            return [
+                {"parent": parent, "matching_subitems": subitems.get(parent.id, [])}
+                for parent in parents
+            ]
 
-            for (parent_id,) in parents_query:
-                # Get parent item
-                parent_item = (
-                    session.query(TodoItemDB).filter(TodoItemDB.id == parent_id).first()
-                )
-                if not parent_item:
-                    continue
-
-                # Get all subitems for this parent
-                siblings = (
-                    session.query(TodoItemDB)
-                    .filter(TodoItemDB.parent_item_id == parent_id)
-                    .all()
-                )
-                # Sort naturally by item_key
-                siblings.sort(key=lambda item: self.natural_sort_key(item.item_key))
-
-                # Create a dict of sibling statuses
-                sibling_dict = {s.item_key: s.status for s in siblings}
+    @staticmethod
+    def _parents_matching_subitems(
+        conditions: Dict[str, str], list_id: Optional[int] = None
+    ):
+        """Select IDs of parents whose subitems meet every {item_key: status}.
 
-                # Check if this sibling group satisfies all conditions
-                all_conditions_met = all(
-                    sibling_dict.get(key) == status
+        Subitem keys are unique per parent, so a parent matches when the number
+        of its subitems meeting one of the conditions equals the condition count.
+        """
+        query = select(TodoItemDB.parent_item_id).where(
+            TodoItemDB.parent_item_id.isnot(None)
+        )
+        if list_id is not None:
+            query = query.where(TodoItemDB.list_id == list_id)
+        if conditions:
+            met = or_(
+                *[
+                    and_(TodoItemDB.item_key == key, TodoItemDB.status == status)
                     for key, status in conditions.items()
-                )
-
-                if all_conditions_met:
-                    # Collect subitems that are mentioned in conditions
-                    matching_subitems = []
-                    for sibling in siblings:
-                        if sibling.item_key in conditions:
-                            matching_subitems.append(sibling)
-
-                    # Add this match to results
-                    matches.append(
-                        {"parent": parent_item, "matching_subitems": matching_subitems}
-                    )
-
-                    # Check limit on number of matches (parent groups)
-                    if len(matches) >= limit:
-                        return matches
+                ]
+            )
+            query = query.where(TodoItemDB.item_key.in_(list(conditions))).having(
+                func.sum(case((met, 1), else_=0)) == len(conditions)
+            )
+        return query.group_by(TodoItemDB.parent_item_id)
 
-            return matches
+    @staticmethod
+    def _get_subitems_by_keys(
+        session, parent_ids: List[int], item_keys: List[str], order_by
+    ) -> Dict[int, List[TodoItemDB]]:
+        """Subitems with the given keys of many parents, in one query"""
+        if not parent_ids or not item_keys:
+            return {}
+        subitems: Dict[int, List[TodoItemDB]] = {}
+        for subitem in (
+            session.query(TodoItemDB)
+            .filter(
+                TodoItemDB.parent_item_id.in_(parent_ids),
+                TodoItemDB.item_key.in_(item_keys),
+            )
+            .order_by(*order_by)
+        ):
+            subitems.setdefault(subitem.parent_item_id, []).append(subitem)
+        return subitems
 
     def get_items_by_status(
         self, list_id: int, status: str, limit: Optional[int] = None
     ) -> List[TodoItemDB]:
-        """Find items by single status within a list."""
+        """Find items by single status within a list, in position order.
+
+        Like the other get_items_by_status* queries this follows position
+        (the order items were added or moved to), not natural key order; use
+        get_list_items(list_id, status=...) for the natural hierarchical view.
+        """
         with self.get_session() as session:
             query = (
                 session.query(TodoItemDB)
@@ -1115,6 +2610,66 @@ class Database:
                 query = query.limit(limit)
             return query.all()
 
+    def get_next_unblocked_pending_item(
+        self, list_id: int, leaf_only: bool = False
+    ) -> Optional[TodoItemDB]:
+        """First pending item (by position) that nothing prevents from starting.
+
+        Items with a required dependency that is not completed are skipped.
+        Subitems qualify only once their parent is completed. With leaf_only,
+        items that have subitems are skipped and their subitems are the work
+        instead: those qualify unless the parent is completed or failed, or is
+        a pending parent blocked by a requirement. Leaves are then ordered
+        under their parent's position. Runs as a single statement backed by
+        the partial pending items index.
+        """
+        parent = aliased(TodoItemDB)
+        required = aliased(TodoItemDB)
+        child = aliased(TodoItemDB)
+
+        def incomplete_requirement(item):
+            return exists().where(
+                ItemDependencyDB.dependent_item_id == item.id,
+                required.id == ItemDependencyDB.required_item_id,
+                required.status != "completed",
+            )
+
+        if leaf_only:
+            parent_allows = parent.id.is_(None) | (
+                parent.status.notin_(["completed", "failed"])
+                & ~((parent.status == "pending") & incomplete_requirement(parent))
+            )
+            order = (
+                func.coalesce(parent.position, TodoItemDB.position),
+                TodoItemDB.position,
+                TodoItemDB.item_key,
+            )
+        else:
+            parent_allows = (
+                (TodoItemDB.parent_item_id.is_(None))
+                | (parent.id.is_(None))
+                | (parent.status == "completed")
+            )
+            order = (TodoItemDB.position, TodoItemDB.item_key)
+
+        with self.get_session() as session:
+            query = (
+                session.query(TodoItemDB)
+                .outerjoin(parent, TodoItemDB.parent_item_id == parent.id)
+                .filter(
+                    TodoItemDB.list_id == list_id,
+                    # Literal so SQLite can match the partial index predicate
+                    TodoItemDB.status == literal_column("'pending'"),
+                    parent_allows,
+                    ~incomplete_requirement(TodoItemDB),
+                )
+            )
+            if leaf_only:
+                query = query.filter(
+                    ~exists().where(child.parent_item_id == TodoItemDB.id)
+                )
+            return query.order_by(*order).limit(1).first()
+
     def get_items_by_status_all_lists(
         self, status: str, limit: Optional[int] = None
     ) -> List[TodoItemDB]:
@@ -1168,68 +2723,9 @@ class Database:
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """Find items matching complex item+subitem conditions within a list."""
-        with self.get_session() as session:
-            matches = []
-
-            # Build query for parent items based on item_conditions
-            parent_query = session.query(TodoItemDB).filter(
-                TodoItemDB.list_id == list_id,
-                TodoItemDB.parent_item_id.is_(None)  # Only root items
-            )
-
-            # Apply item conditions
-            if "status" in item_conditions:
-                status_value = item_conditions["status"]
-                if isinstance(status_value, list):
-                    parent_query = parent_query.filter(TodoItemDB.status.in_(status_value))
-                else:
-                    parent_query = parent_query.filter(TodoItemDB.status == status_value)
-
-            # Order by position
-            parent_query = parent_query.order_by(TodoItemDB.position, TodoItemDB.item_key)
-
-            # Check each parent for subitem conditions
-            for parent_item in parent_query:
-                if not subitem_conditions:
-                    # No subitem conditions, just return the parent
-                    matches.append({
-                        "parent": parent_item,
-                        "matching_subitems": []
-                    })
-                else:
-                    # Get all subitems for this parent
-                    siblings = (
-                        session.query(TodoItemDB)
-                        .filter(TodoItemDB.parent_item_id == parent_item.id)
-                        .all()
-                    )
-
-                    # Create dict of sibling statuses
-                    sibling_dict = {s.item_key: s.status for s in siblings}
-
-                    # Check if all subitem conditions are met
-                    all_conditions_met = all(
-                        sibling_dict.get(key) == status
-                        for key, status in subitem_conditions.items()
-                    )
-
-                    if all_conditions_met:
-                        # Collect matching subitems
-                        matching_subitems = [
-                            s for s in siblings
-                            if s.item_key in subitem_conditions
-                        ]
-
-                        matches.append({
-                            "parent": parent_item,
-                            "matching_subitems": matching_subitems
-                        })
-
-                # Check limit
-                if len(matches) >= limit:
-                    break
-
-            return matches
+        return self._find_by_item_and_subitem_conditions(
+            item_conditions, subitem_conditions, limit, list_id
+        )
 
     def find_items_by_complex_conditions_all_lists(
         self,
@@ -1238,13 +2734,29 @@ class Database:
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
         """Find items matching complex conditions across all lists."""
-        with self.get_session() as session:
-            matches = []
+        return self._find_by_item_and_subitem_conditions(
+            item_conditions, subitem_conditions, limit
+        )
+
+    def _find_by_item_and_subitem_conditions(
+        self,
+        item_conditions: Dict[str, Any],
+        subitem_conditions: Dict[str, str],
+        limit: int,
+        list_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Root items matching item_conditions whose subitems meet subitem_conditions.
 
-            # Build query for parent items across all lists
+        Matching parents are selected with one grouped query and their
+        subitems loaded with one more, whatever the number of candidates.
+        """
+        with self.get_session() as session:
+            # Root items only
             parent_query = session.query(TodoItemDB).filter(
-                TodoItemDB.parent_item_id.is_(None)  # Only root items
+                TodoItemDB.parent_item_id.is_(None)
             )
+            if list_id is not None:
+                parent_query = parent_query.filter(TodoItemDB.list_id == list_id)
 
             # Apply item conditions
             if "status" in item_conditions:
@@ -1254,66 +2766,43 @@ class Database:
                 else:
                     parent_query = parent_query.filter(TodoItemDB.status == status_value)
 
-            # Order by list, then position
-            parent_query = parent_query.order_by(
-                TodoItemDB.list_id, TodoItemDB.position, TodoItemDB.item_key
-            )
-
-            # Check each parent for subitem conditions
-            for parent_item in parent_query:
-                if not subitem_conditions:
-                    # No subitem conditions, just return the parent
-                    matches.append({
-                        "parent": parent_item,
-                        "matching_subitems": []
-                    })
-                else:
-                    # Get all subitems for this parent
-                    siblings = (
-                        session.query(TodoItemDB)
-                        .filter(TodoItemDB.parent_item_id == parent_item.id)
-                        .all()
-                    )
-
-                    # Create dict of sibling statuses
-                    sibling_dict = {s.item_key: s.status for s in siblings}
-
-                    # Check if all subitem conditions are met
-                    all_conditions_met = all(
-                        sibling_dict.get(key) == status
-                        for key, status in subitem_conditions.items()
+            if subitem_conditions:
+                parent_query = parent_query.filter(
+                    TodoItemDB.id.in_(
+                        self._parents_matching_subitems(subitem_conditions, list_id)
                     )
+                )
 
-                    if all_conditions_met:
-                        # Collect matching subitems
-                        matching_subitems = [
-                            s for s in siblings
-                            if s.item_key in subitem_conditions
-                        ]
-
-                        matches.append({
-                            "parent": parent_item,
-                            "matching_subitems": matching_subitems
-                        })
-
-                # Check limit
-                if len(matches) >= limit:
-                    break
+            # Order by list (across lists), then position
+            if list_id is None:
+                parent_query = parent_query.order_by(TodoItemDB.list_id)
+            parents = (
+                parent_query.order_by(TodoItemDB.position, TodoItemDB.item_key)
+                .limit(limit)
+                .all()
+            )
 
-            return matches
+            subitems = self._get_subitems_by_keys(
+                session,
+                [parent.id for parent in parents],
+                list(subitem_conditions),
+                order_by=(TodoItemDB.id,),
+            )
+            return [
+                {"parent": parent, "matching_subitems": subitems.get(parent.id, [])}
+                for parent in parents
+            ]
 
     # Hierarchical item operations (for subtasks)
     def get_item_children(self, item_id: int) -> List[TodoItemDB]:
         """Get all direct children (subtasks) of an item"""
         with self.get_session() as session:
-            items = (
+            return (
                 session.query(TodoItemDB)
                 .filter(TodoItemDB.parent_item_id == item_id)
+                .order_by(TodoItemDB.sort_key, TodoItemDB.id)
                 .all()
             )
-            # Sort naturally by item_key
-            items.sort(key=lambda item: self.natural_sort_key(item.item_key))
-            return items
 
     def get_item_with_hierarchy(self, item_id: int) -> Optional[TodoItemDB]:
         """Get item with all its children recursively"""
@@ -1327,10 +2816,9 @@ class Database:
                 children = (
                     session.query(TodoItemDB)
                     .filter(TodoItemDB.parent_item_id == parent_item.id)
+                    .order_by(TodoItemDB.sort_key, TodoItemDB.id)
                     .all()
                 )
-                # Sort naturally by item_key
-                children.sort(key=lambda item: self.natural_sort_key(item.item_key))
 
                 for child in children:
                     load_children(child)  # Recursive loading
@@ -1340,6 +2828,62 @@ class Database:
             load_children(item)
             return item
 
+    def get_item_subtree(
+        self, list_id: int, root_item_id: Optional[int] = None
+    ) -> List[Tuple[TodoItemDB, int]]:
+        """Load an item with all descendants (or every tree of a list) in one query
+
+        A recursive CTE walks down from the root(s) building a path of
+        (sort_key, id) segments, so ordering by path yields depth-first order
+        with siblings in natural order, like get_item_children.
+
+        Args:
+            list_id: The list ID
+            root_item_id: Root of the subtree; None loads all root items of the list
+
+        Returns:
+            (item, depth) pairs in depth-first order, depth 0 for the root(s)
+        """
+
+        def path_segment(item):
+            # ' ' sorts below the digits that may follow a key whose sort_key is
+            # a prefix of a sibling's; the padded id breaks ties between equal keys
+            return (
+                func.coalesce(item.sort_key, "")
+                + " "
+                + func.printf("%010d", item.id, type_=String)
+            )
+
+        root_filter = (
+            TodoItemDB.id == root_item_id
+            if root_item_id is not None
+            else TodoItemDB.parent_item_id.is_(None)
+        )
+        tree = (
+            select(
+                TodoItemDB.id.label("id"),
+                literal(0).label("depth"),
+                path_segment(TodoItemDB).label("path"),
+            )
+            .where(TodoItemDB.list_id == list_id, root_filter)
+            .cte("item_subtree", recursive=True)
+        )
+        child = aliased(TodoItemDB)
+        tree = tree.union_all(
+            select(
+                child.id, tree.c.depth + 1, tree.c.path + "/" + path_segment(child)
+            ).join(tree, child.parent_item_id == tree.c.id)
+        )
+
+        with self.get_session() as session:
+            rows = (
+                session.query(TodoItemDB, tree.c.depth)
+                .join(tree, TodoItemDB.id == tree.c.id)
+                .order_by(tree.c.path)
+                .all()
+            )
+            return [(item, depth) for item, depth in rows]
+
     def has_subtasks(self, item_id: int) -> bool:
         """Check if an item has any subtasks"""
         with self.get_session() as session:
@@ -1406,16 +2950,68 @@ class Database:
     def get_root_items(self, list_id: int) -> List[TodoItemDB]:
         """Get all root items (items without parent) in a list"""
         with self.get_session() as session:
-            items = (
+            return (
                 session.query(TodoItemDB)
                 .filter(
                     TodoItemDB.list_id == list_id, TodoItemDB.parent_item_id.is_(None)
                 )
+                .order_by(TodoItemDB.sort_key, TodoItemDB.id)
                 .all()
             )
-            # Sort naturally by item_key
-            items.sort(key=lambda item: self.natural_sort_key(item.item_key))
-            return items
+
+    def get_root_items_page(
+        self, list_id: int, limit: int = 100, offset: int = 0
+    ) -> Tuple[List[TodoItemDB], int]:
+        """Get one page of root items ordered by position plus the root total"""
+        with self.get_session() as session:
+            query = session.query(TodoItemDB).filter(
+                TodoItemDB.list_id == list_id, TodoItemDB.parent_item_id.is_(None)
+            )
+            total = query.count()
+            page_items = (
+                query.order_by(TodoItemDB.position, TodoItemDB.id)
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+            return page_items, total
+
+    def get_children_for_items(
+        self, parent_ids: List[int]
+    ) -> Dict[int, List[TodoItemDB]]:
+        """Direct children of several items in one query, ordered by position"""
+        children: Dict[int, List[TodoItemDB]] = {
+            parent_id: [] for parent_id in parent_ids
+        }
+        if not parent_ids:
+            return children
+
+        with self.get_session() as session:
+            rows = (
+                session.query(TodoItemDB)
+                .filter(TodoItemDB.parent_item_id.in_(parent_ids))
+                .order_by(TodoItemDB.parent_item_id, TodoItemDB.position, TodoItemDB.id)
+                .all()
+            )
+            for child in rows:
+                children[child.parent_item_id].append(child)
+            return children
+
+    def get_child_counts(self, parent_ids: List[int]) -> Dict[int, int]:
+        """Number of direct children per item, for several items in one query"""
+        counts = {parent_id: 0 for parent_id in parent_ids}
+        if not parent_ids:
+            return counts
+
+        with self.get_session() as session:
+            rows = (
+                session.query(TodoItemDB.parent_item_id, func.count(TodoItemDB.id))
+                .filter(TodoItemDB.parent_item_id.in_(parent_ids))
+                .group_by(TodoItemDB.parent_item_id)
+                .all()
+            )
+            counts.update(dict(rows))
+            return counts
 
     def get_root_items_with_children_optimized(self, list_id: int) -> List[TodoItemDB]:
         """Get all root items with their children preloaded (optimized for N+1 prevention)"""
@@ -1428,58 +3024,62 @@ class Database:
                 .filter(
                     TodoItemDB.list_id == list_id, TodoItemDB.parent_item_id.is_(None)
                 )
+                .order_by(TodoItemDB.sort_key, TodoItemDB.id)
                 .all()
             )
-            # Sort naturally by item_key
-            items.sort(key=lambda item: self.natural_sort_key(item.item_key))
             return items
 
     def get_item_depth(self, item_id: int) -> int:
         """Get the depth level of an item in hierarchy (0 = root, 1 = first level, etc.)"""
         with self.get_session() as session:
-            depth = 0
-            current_item = (
-                session.query(TodoItemDB).filter(TodoItemDB.id == item_id).first()
+            depth = (
+                session.query(func.max(ItemClosureDB.depth))
+                .filter(ItemClosureDB.descendant_id == item_id)
+                .scalar()
             )
-
-            while current_item and current_item.parent_item_id:
-                depth += 1
-                current_item = (
-                    session.query(TodoItemDB)
-                    .filter(TodoItemDB.id == current_item.parent_item_id)
-                    .first()
-                )
-
-                # Prevent infinite loops
-                if depth > 10:  # Max 10 levels deep
-                    break
-
-            return depth
+            return depth or 0
 
     def get_item_path(self, item_id: int) -> List[TodoItemDB]:
         """Get the full path from root to item (including the item itself)"""
         with self.get_session() as session:
-            path = []
-            current_item = (
-                session.query(TodoItemDB).filter(TodoItemDB.id == item_id).first()
+            return (
+                session.query(TodoItemDB)
+                .join(ItemClosureDB, ItemClosureDB.ancestor_id == TodoItemDB.id)
+                .filter(ItemClosureDB.descendant_id == item_id)
+                .order_by(ItemClosureDB.depth.desc())
+                .all()
             )
 
-            while current_item:
-                path.insert(0, current_item)  # Insert at beginning to maintain order
-                if current_item.parent_item_id:
-                    current_item = (
-                        session.query(TodoItemDB)
-                        .filter(TodoItemDB.id == current_item.parent_item_id)
-                        .first()
-                    )
-                else:
-                    break
+    def get_item_descendants(
+        self, item_id: int, include_self: bool = False
+    ) -> List[TodoItemDB]:
+        """Get all descendants of an item at any depth, shallowest first
 
-                # Prevent infinite loops
-                if len(path) > 10:
-                    break
+        Args:
+            item_id: Root of the subtree
+            include_self: Also return the item itself (first)
+        """
+        with self.get_session() as session:
+            query = (
+                session.query(TodoItemDB)
+                .join(ItemClosureDB, ItemClosureDB.descendant_id == TodoItemDB.id)
+                .filter(ItemClosureDB.ancestor_id == item_id)
+            )
+            if not include_self:
+                query = query.filter(ItemClosureDB.depth > 0)
+            return query.order_by(
+                ItemClosureDB.depth, TodoItemDB.sort_key, TodoItemDB.id
+            ).all()
 
-            return path
+    def is_item_ancestor(self, ancestor_id: int, item_id: int) -> bool:
+        """Check if ancestor_id is item_id itself or one of its ancestors"""
+        with self.get_session() as session:
+            return session.query(
+                exists().where(
+                    ItemClosureDB.ancestor_id == ancestor_id,
+                    ItemClosureDB.descendant_id == item_id,
+                )
+            ).scalar()
 
     def has_pending_children(self, item_id: int) -> bool:
         """Check if item has any pending children (subtasks)"""
@@ -1582,50 +3182,63 @@ class Database:
     def get_item_blockers(self, item_id: int) -> List[TodoItemDB]:
         """Get all items that block this item (not completed required items)"""
         with self.get_session() as session:
-            # Get dependencies where this item is dependent
-            dependencies = (
-                session.query(ItemDependencyDB)
-                .filter(ItemDependencyDB.dependent_item_id == item_id)
+            return (
+                session.query(TodoItemDB)
+                .join(
+                    ItemDependencyDB,
+                    ItemDependencyDB.required_item_id == TodoItemDB.id,
+                )
+                .filter(
+                    ItemDependencyDB.dependent_item_id == item_id,
+                    TodoItemDB.status != "completed",
+                )
+                .order_by(ItemDependencyDB.id)
                 .all()
             )
 
-            blockers = []
-            for dep in dependencies:
-                required_item = (
-                    session.query(TodoItemDB)
-                    .filter(TodoItemDB.id == dep.required_item_id)
-                    .first()
-                )
-
-                # Only include if required item is not completed
-                if required_item and required_item.status != "completed":
-                    blockers.append(required_item)
+    def get_item_blockers_bulk(
+        self, item_ids: List[int]
+    ) -> Dict[int, List[TodoItemDB]]:
+        """Not completed required items for several items, in dependency order.
 
-            return blockers
+        Chunked to stay below SQLite's variable limit; items without blockers
+        map to an empty list.
+        """
+        blockers: Dict[int, List[TodoItemDB]] = {item_id: [] for item_id in item_ids}
+        with self.get_session() as session:
+            for start in range(0, len(item_ids), 900):
+                chunk = item_ids[start : start + 900]
+                rows = (
+                    session.query(ItemDependencyDB.dependent_item_id, TodoItemDB)
+                    .join(
+                        TodoItemDB,
+                        ItemDependencyDB.required_item_id == TodoItemDB.id,
+                    )
+                    .filter(
+                        ItemDependencyDB.dependent_item_id.in_(chunk),
+                        TodoItemDB.status != "completed",
+                    )
+                    .order_by(ItemDependencyDB.id)
+                    .all()
+                )
+                for dependent_id, required in rows:
+                    blockers[dependent_id].append(required)
+        return blockers
 
     def get_items_blocked_by(self, item_id: int) -> List[TodoItemDB]:
         """Get all items blocked by this item"""
         with self.get_session() as session:
-            # Get dependencies where this item is required
-            dependencies = (
-                session.query(ItemDependencyDB)
+            return (
+                session.query(TodoItemDB)
+                .join(
+                    ItemDependencyDB,
+                    ItemDependencyDB.dependent_item_id == TodoItemDB.id,
+                )
                 .filter(ItemDependencyDB.required_item_id == item_id)
+                .order_by(ItemDependencyDB.id)
                 .all()
             )
 
-            blocked_items = []
-            for dep in dependencies:
-                dependent_item = (
-                    session.query(TodoItemDB)
-                    .filter(TodoItemDB.id == dep.dependent_item_id)
-                    .first()
-                )
-
-                if dependent_item:
-                    blocked_items.append(dependent_item)
-
-            return blocked_items
-
     def is_item_blocked(self, item_id: int) -> bool:
         """Check if item is blocked by uncompleted dependencies"""
         blockers = self.get_item_blockers(item_id)
@@ -1686,6 +3299,230 @@ class Database:
 
             return db_items
 
+    def insert_items_bulk(self, items_data: List[Dict[str, Any]]) -> List[int]:
+        """Insert many items with one executemany INSERT
+
+        Bypasses the ORM unit of work, so sort_key is computed here. Items must
+        have distinct (parent_item_id, item_key) pairs, which is how their new
+        IDs are matched back.
+
+        Returns:
+            IDs of the inserted items, in the order of items_data
+        """
+        if not items_data:
+            return []
+
+        rows = [
+            {"sort_key": natural_sort_value(item_data["item_key"]), **item_data}
+            for item_data in items_data
+        ]
+        with self.get_session() as session:
+            # RETURNING would force SQLite back to one INSERT per row when the
+            # parameter order must be kept, so look the new IDs up instead
+            max_id = session.query(func.max(TodoItemDB.id)).scalar() or 0
+            session.execute(insert(TodoItemDB), rows)
+            created = (
+                session.query(
+                    TodoItemDB.id, TodoItemDB.parent_item_id, TodoItemDB.item_key
+                )
+                .filter(TodoItemDB.id > max_id)
+                .all()
+            )
+            session.commit()
+
+        ids_by_key = {(row.parent_item_id, row.item_key): row.id for row in created}
+        return [
+            ids_by_key[(item_data.get("parent_item_id"), item_data["item_key"])]
+            for item_data in items_data
+        ]
+
+    def create_item_properties_bulk(self, properties_data: List[Dict[str, Any]]):
+        """Insert many new item properties with one executemany INSERT"""
+        if not properties_data:
+            return
+
+        with self.get_session() as session:
+            session.execute(insert(ItemPropertyDB), properties_data)
+            session.commit()
+
+    def create_item_dependencies_bulk(
+        self, dependencies_data: List[Dict[str, Any]]
+    ) -> List[ItemDependencyDB]:
+        """Insert many dependencies with one executemany INSERT
+
+        Unlike create_item_dependency, items and cycles are not checked here.
+
+        Returns:
+            The created dependencies, in the order of dependencies_data
+        """
+        if not dependencies_data:
+            return []
+
+        dependent_ids = list(
+            {dependency["dependent_item_id"] for dependency in dependencies_data}
+        )
+        with self.get_session() as session:
+            session.execute(insert(ItemDependencyDB), dependencies_data)
+            session.commit()
+
+            created = {}
+            for start in range(0, len(dependent_ids), 900):
+                for dependency in session.query(ItemDependencyDB).filter(
+                    ItemDependencyDB.dependent_item_id.in_(
+                        dependent_ids[start : start + 900]
+                    )
+                ):
+                    key = (dependency.dependent_item_id, dependency.required_item_id)
+                    created[key] = dependency
+
+        return [
+            created[(dependency["dependent_item_id"], dependency["required_item_id"])]
+            for dependency in dependencies_data
+        ]
+
+    def get_first_items_by_keys(
+        self, list_id: int, item_keys: List[str]
+    ) -> Dict[str, TodoItemDB]:
+        """Map each key to the item get_item_by_key would return, in one query"""
+        if not item_keys:
+            return {}
+
+        with self.get_session() as session:
+            rows = (
+                session.query(TodoItemDB)
+                .filter(
+                    TodoItemDB.list_id == list_id,
+                    TodoItemDB.item_key.in_(set(item_keys)),
+                )
+                .order_by(TodoItemDB.id)
+                .all()
+            )
+
+        first_by_key: Dict[str, TodoItemDB] = {}
+        for row in rows:
+            first_by_key.setdefault(row.item_key, row)
+        return first_by_key
+
+    def get_items_by_ids(self, item_ids: List[int]) -> Dict[int, TodoItemDB]:
+        """Load many items by ID, chunked to stay below SQLite's variable limit"""
+        items: Dict[int, TodoItemDB] = {}
+        with self.get_session() as session:
+            for start in range(0, len(item_ids), 900):
+                chunk = item_ids[start : start + 900]
+                for item in (
+                    session.query(TodoItemDB).filter(TodoItemDB.id.in_(chunk)).all()
+                ):
+                    items[item.id] = item
+        return items
+
+    # ===== ITEM LEASES =====
+
+    def upsert_item_leases(
+        self,
+        item_ids: List[int],
+        worker_id: str,
+        claimed_at: datetime,
+        lease_expires_at: datetime,
+    ) -> None:
+        """Record (or take over) the lease of many items in one statement"""
+        if not item_ids:
+            return
+
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        statement = sqlite_insert(ItemLeaseDB)
+        statement = statement.on_conflict_do_update(
+            index_elements=[ItemLeaseDB.item_id],
+            set_={
+                "worker_id": statement.excluded.worker_id,
+                "claimed_at": statement.excluded.claimed_at,
+                "lease_expires_at": statement.excluded.lease_expires_at,
+            },
+        )
+        with self.get_session() as session:
+            session.execute(
+                statement,
+                [
+                    {
+                        "item_id": item_id,
+                        "worker_id": worker_id,
+                        "claimed_at": claimed_at,
+                        "lease_expires_at": lease_expires_at,
+                    }
+                    for item_id in item_ids
+                ],
+            )
+            session.commit()
+
+    def get_item_leases(self, item_ids: List[int]) -> Dict[int, ItemLeaseDB]:
+        """Leases of the given items, keyed by item ID"""
+        if not item_ids:
+            return {}
+        with self.get_session() as session:
+            leases = (
+                session.query(ItemLeaseDB)
+                .filter(ItemLeaseDB.item_id.in_(item_ids))
+                .all()
+            )
+            return {lease.item_id: lease for lease in leases}
+
+    def get_expired_item_leases(
+        self, now: datetime, list_id: Optional[int] = None
+    ) -> List[Tuple[ItemLeaseDB, TodoItemDB]]:
+        """Leases that expired before now, with their items"""
+        with self.get_session() as session:
+            query = (
+                session.query(ItemLeaseDB, TodoItemDB)
+                .join(TodoItemDB, ItemLeaseDB.item_id == TodoItemDB.id)
+                .filter(ItemLeaseDB.lease_expires_at < now)
+            )
+            if list_id is not None:
+                query = query.filter(TodoItemDB.list_id == list_id)
+            return [tuple(row) for row in query.order_by(ItemLeaseDB.item_id).all()]
+
+    def delete_item_leases(self, item_ids: List[int]) -> int:
+        """Delete the leases of the given items"""
+        if not item_ids:
+            return 0
+        with self.get_session() as session:
+            count = (
+                session.query(ItemLeaseDB)
+                .filter(ItemLeaseDB.item_id.in_(item_ids))
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+            return count
+
+    def get_dependency_change_version(self) -> int:
+        """ID of the latest dependency_changes row (0 when the log is empty)"""
+        with self.get_session() as session:
+            return session.query(func.max(DependencyChangeDB.id)).scalar() or 0
+
+    def get_dependency_changes_since(self, version: int) -> List[DependencyChangeDB]:
+        """Dependency changes recorded after the given version, oldest first"""
+        with self.get_session() as session:
+            return (
+                session.query(DependencyChangeDB)
+                .filter(DependencyChangeDB.id > version)
+                .order_by(DependencyChangeDB.id)
+                .all()
+            )
+
+    def get_dependency_edges_with_status(self) -> List[Tuple[int, int, str]]:
+        """All (dependent_item_id, required_item_id, required status) edges"""
+        with self.get_session() as session:
+            rows = (
+                session.query(
+                    ItemDependencyDB.dependent_item_id,
+                    ItemDependencyDB.required_item_id,
+                    TodoItemDB.status,
+                )
+                .join(TodoItemDB, ItemDependencyDB.required_item_id == TodoItemDB.id)
+                .order_by(ItemDependencyDB.id)
+                .all()
+            )
+            return [tuple(row) for row in rows]
+
     def get_all_dependencies_for_list(self, list_id: int) -> List[ItemDependencyDB]:
         """Get all dependencies involving items from a specific list"""
         with self.get_session() as session:
@@ -1710,37 +3547,88 @@ class Database:
 
             return dependencies
 
+    def get_dependency_summary_for_list(self, list_id: int) -> Dict[str, int]:
+        """Count dependencies touching a list's items in one query.
+
+        Returns total_dependencies, as_dependent (dependent item in this list)
+        and as_required (required item in this list).
+        """
+        dependent = aliased(TodoItemDB)
+        required = aliased(TodoItemDB)
+        with self.get_session() as session:
+            total, as_dependent, as_required = (
+                session.query(
+                    func.count(ItemDependencyDB.id),
+                    func.sum(case((dependent.list_id == list_id, 1), else_=0)),
+                    func.sum(case((required.list_id == list_id, 1), else_=0)),
+                )
+                .join(dependent, ItemDependencyDB.dependent_item_id == dependent.id)
+                .join(required, ItemDependencyDB.required_item_id == required.id)
+                .filter(or_(dependent.list_id == list_id, required.list_id == list_id))
+                .one()
+            )
+            return {
+                "total_dependencies": total,
+                "as_dependent": as_dependent or 0,
+                "as_required": as_required or 0,
+            }
+
     def _would_create_circular_dependency(
         self, dependent_item_id: int, required_item_id: int
     ) -> bool:
-        """Check if adding this dependency would create a circular reference"""
-        with self.get_session() as session:
-            # Check if required_item depends on dependent_item (directly or indirectly)
-            visited = set()
+        """Check if adding this dependency would create a circular reference
 
-            def has_dependency_path(from_item: int, to_item: int) -> bool:
-                if from_item in visited:
-                    return False  # Prevent infinite recursion
-                visited.add(from_item)
+        One recursive query walks everything the required item depends on,
+        directly or indirectly; the new dependency closes a loop if the
+        dependent item is among them (including depending on itself).
+        """
+        reach = self._dependency_reach_cte([required_item_id])
+        with self.get_session() as session:
+            found = session.execute(
+                select(reach.c.id).where(reach.c.id == dependent_item_id).limit(1)
+            ).first()
+            return found is not None
 
-                # Direct dependency check
-                direct_deps = (
-                    session.query(ItemDependencyDB)
-                    .filter(ItemDependencyDB.dependent_item_id == from_item)
-                    .all()
-                )
+    def get_dependency_edges_from(self, item_ids: List[int]) -> Dict[int, Set[int]]:
+        """Load every dependency reachable from the given items in one query
 
-                for dep in direct_deps:
-                    if dep.required_item_id == to_item:
-                        return True  # Direct circular dependency
+        Returns:
+            Adjacency dict: dependent item ID -> set of required item IDs, for
+            the given items and everything they depend on transitively
+        """
+        if not item_ids:
+            return {}
 
-                    # Recursive check
-                    if has_dependency_path(dep.required_item_id, to_item):
-                        return True
+        reach = self._dependency_reach_cte(item_ids)
+        with self.get_session() as session:
+            rows = (
+                session.query(
+                    ItemDependencyDB.dependent_item_id,
+                    ItemDependencyDB.required_item_id,
+                )
+                .join(reach, ItemDependencyDB.dependent_item_id == reach.c.id)
+                .all()
+            )
 
-                return False
+        edges: Dict[int, Set[int]] = {}
+        for dependent_id, required_id in rows:
+            edges.setdefault(dependent_id, set()).add(required_id)
+        return edges
 
-            return has_dependency_path(required_item_id, dependent_item_id)
+    @staticmethod
+    def _dependency_reach_cte(item_ids: List[int]):
+        """Recursive CTE of the given items and all items they depend on"""
+        reach = (
+            select(TodoItemDB.id.label("id"))
+            .where(TodoItemDB.id.in_(item_ids))
+            .cte("dependency_reach", recursive=True)
+        )
+        # UNION (not UNION ALL) drops visited items, so existing loops terminate
+        return reach.union(
+            select(ItemDependencyDB.required_item_id).join(
+                reach, ItemDependencyDB.dependent_item_id == reach.c.id
+            )
+        )
 
     def get_dependency_graph_for_project(self, project_key: str) -> Dict[str, Any]:
         """Get complete dependency graph for a project (related lists)"""
@@ -1921,7 +3809,7 @@ class Database:
     def get_status_counts_for_lists(
         self, list_ids: List[int]
     ) -> Dict[int, Dict[str, int]]:
-        """Get status counts for multiple lists in one query.
+        """Get status counts for multiple lists from the maintained counters.
 
         Args:
             list_ids: List of list IDs to get status counts for
@@ -1932,35 +3820,64 @@ class Database:
         if not list_ids:
             return {}
 
+        return {
+            list_id: {
+                status: counters[status]
+                for status in ("pending", "in_progress", "completed", "failed")
+            }
+            for list_id, counters in self.get_counters_for_lists(list_ids).items()
+        }
+
+    def get_item_summary_for_lists(
+        self, list_ids: List[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get item status counts and latest item update for lists from list_counters.
+
+        Args:
+            list_ids: List of list IDs to summarize
+
+        Returns:
+            Dict mapping list_id to dict with keys total, pending, in_progress,
+            completed, failed and last_item_update (None for empty lists)
+        """
+        keys = ("total", "pending", "in_progress", "completed", "failed")
+        return {
+            list_id: {
+                **{key: counters[key] for key in keys},
+                "last_item_update": counters["last_item_update"],
+            }
+            for list_id, counters in self.get_counters_for_lists(list_ids).items()
+        }
+
+    def get_list_properties_for_lists(
+        self, list_ids: List[int], property_keys: Optional[List[str]] = None
+    ) -> Dict[int, Dict[str, str]]:
+        """Get properties of multiple lists in one query.
+
+        Args:
+            list_ids: List of list IDs to get properties for
+            property_keys: Only these property keys (None = all)
+
+        Returns:
+            Dict mapping list_id to {property_key: property_value}
+        """
+        properties: Dict[int, Dict[str, str]] = {list_id: {} for list_id in list_ids}
+        if not list_ids:
+            return properties
+
         with self.get_session() as session:
-            # Get status counts grouped by list_id and status
-            result = (
-                session.query(
-                    TodoItemDB.list_id,
-                    TodoItemDB.status,
-                    func.count(TodoItemDB.id).label("count"),
-                )
-                .filter(TodoItemDB.list_id.in_(list_ids))
-                .group_by(TodoItemDB.list_id, TodoItemDB.status)
-                .all()
-            )
+            query = session.query(
+                ListPropertyDB.list_id,
+                ListPropertyDB.property_key,
+                ListPropertyDB.property_value,
+            ).filter(ListPropertyDB.list_id.in_(list_ids))
+            if property_keys is not None:
+                query = query.filter(ListPropertyDB.property_key.in_(property_keys))
 
-            # Initialize result dict with empty counts for all lists
-            status_counts = {}
-            for list_id in list_ids:
-                status_counts[list_id] = {
-                    "pending": 0,
-                    "in_progress": 0,
-                    "completed": 0,
-                    "failed": 0,
-                }
-
-            # Fill in actual counts
-            for list_id, status, count in result:
-                if list_id in status_counts and status in status_counts[list_id]:
-                    status_counts[list_id][status] = count
-
-            return status_counts
+            for list_id, key, value in query.order_by(ListPropertyDB.property_key):
+                properties[list_id][key] = value
+
+            return properties
 
     def get_tags_for_lists(self, list_ids: List[int]) -> Dict[int, List[ListTagDB]]:
         """Get tags for multiple lists in one query.
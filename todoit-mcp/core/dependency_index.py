@@ -0,0 +1,131 @@
+"""
+TODOIT MCP - Process-local dependency index
+In-memory forward/reverse dependency adjacency with required item statuses
+"""
+
+import threading
+from typing import Dict, List, Optional
+
+from .database import Database
+
+
+class DependencyIndex:
+    """In-memory copy of the dependency graph for blocker lookups.
+
+    Holds, for every dependency edge, the dependent -> required adjacency, the
+    reverse adjacency and the status of each required item. Each lookup first
+    replays the dependency_changes log written by database triggers since the
+    last seen version, so changes made by this process, other processes and
+    raw SQL are all picked up with one indexed query. When the log has been
+    pruned past that version the index is reloaded from scratch.
+
+    Inside an active unit of work the index cannot see uncommitted changes, so
+    lookups return None there and callers fall back to SQL.
+    """
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.version: Optional[int] = None
+        # Ordered dicts used as ordered sets (dependency creation order)
+        self.required_by: Dict[int, Dict[int, None]] = {}
+        self.dependents_of: Dict[int, Dict[int, None]] = {}
+        self.status: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def blocker_ids(self, item_id: int) -> Optional[List[int]]:
+        """IDs of required items of item_id that are not completed"""
+        with self._lock:
+            if not self._refresh():
+                return None
+            return [
+                required_id
+                for required_id in self.required_by.get(item_id, ())
+                if self.status.get(required_id) != "completed"
+            ]
+
+    def blocker_ids_bulk(self, item_ids: List[int]) -> Optional[Dict[int, List[int]]]:
+        """blocker_ids for several items after a single refresh"""
+        with self._lock:
+            if not self._refresh():
+                return None
+            return {
+                item_id: [
+                    required_id
+                    for required_id in self.required_by.get(item_id, ())
+                    if self.status.get(required_id) != "completed"
+                ]
+                for item_id in item_ids
+            }
+
+    def dependent_ids(self, item_id: int) -> Optional[List[int]]:
+        """IDs of items that depend on item_id"""
+        with self._lock:
+            if not self._refresh():
+                return None
+            return list(self.dependents_of.get(item_id, ()))
+
+    def is_blocked(self, item_id: int) -> Optional[bool]:
+        """Whether item_id has any required item that is not completed"""
+        blockers = self.blocker_ids(item_id)
+        return None if blockers is None else len(blockers) > 0
+
+    def invalidate(self):
+        """Drop the cached graph; the next lookup reloads it"""
+        with self._lock:
+            self.version = None
+
+    def _refresh(self) -> bool:
+        """Bring the index up to date; False when it must not be used"""
+        if self.db.in_unit_of_work():
+            return False
+        if self.version is None:
+            self._load()
+            return True
+
+        changes = self.db.get_dependency_changes_since(self.version)
+        if changes and changes[0].id != self.version + 1:
+            # Log was pruned past our version
+            self._load()
+            return True
+        for change in changes:
+            self._apply(
+                change.change, change.item_id, change.other_item_id, change.status
+            )
+            self.version = change.id
+        return True
+
+    def _load(self):
+        """Rebuild the whole index from item_dependencies"""
+        # Version is read first: changes committed in between are replayed
+        # again on the next refresh, which is harmless as replay is idempotent
+        version = self.db.get_dependency_change_version()
+        self.required_by = {}
+        self.dependents_of = {}
+        self.status = {}
+        edges = self.db.get_dependency_edges_with_status()
+        for dependent_id, required_id, status in edges:
+            self._apply("dependency_added", dependent_id, required_id, status)
+        self.version = version
+
+    def _apply(
+        self,
+        change: str,
+        item_id: int,
+        other_item_id: Optional[int],
+        status: Optional[str],
+    ):
+        """Apply one dependency_changes entry"""
+        if change == "dependency_added":
+            self.required_by.setdefault(item_id, {})[other_item_id] = None
+            self.dependents_of.setdefault(other_item_id, {})[item_id] = None
+            self.status[other_item_id] = status
+        elif change == "dependency_removed":
+            self.required_by.get(item_id, {}).pop(other_item_id, None)
+            if not self.required_by.get(item_id, True):
+                del self.required_by[item_id]
+            self.dependents_of.get(other_item_id, {}).pop(item_id, None)
+            if not self.dependents_of.get(other_item_id, True):
+                del self.dependents_of[other_item_id]
+                self.status.pop(other_item_id, None)
+        elif change == "status" and item_id in self.dependents_of:
+            self.status[item_id] = status
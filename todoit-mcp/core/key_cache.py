@@ -0,0 +1,147 @@
+"""
+TODOIT MCP - Process-local key resolution cache
+LRU mapping of list keys and item keys to row IDs
+"""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# Parent slot of item entries resolved by key alone (first match in the list)
+ANY_PARENT = "*"
+
+
+class KeyCache:
+    """LRU cache of list_key -> list_id and (list_id, parent_id, item_key) -> item_id.
+
+    Keys rarely change, so a long-lived process can skip the key lookups that
+    start nearly every manager call. Entries are dropped explicitly when this
+    process renames, moves or deletes lists and items. Every lookup also reads
+    SQLite's PRAGMA data_version on a private connection: it changes whenever
+    any other connection commits, including other processes and raw SQL, and
+    the whole cache is then discarded. Commits made by this process through
+    its pooled connections count too, so hits come from runs of reads
+    between writes.
+
+    Entries found inside a unit of work may be uncommitted; Database verifies
+    them against the row it loads, and callers that only need an ID do not
+    use the cache there.
+    """
+
+    def __init__(self, db_path: str, max_size: int = 4096):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.clears = 0
+        self._entries: "OrderedDict[Hashable, int]" = OrderedDict()
+        # Bumped on every invalidation, so reads racing one are not stored
+        self._generation = 0
+        self._data_version: Optional[int] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def list_entry(list_key: str) -> Hashable:
+        return ("list", list_key)
+
+    @staticmethod
+    def item_entry(list_id: int, parent_item_id: Any, item_key: str) -> Hashable:
+        return ("item", list_id, parent_item_id, item_key)
+
+    def get(self, entry: Hashable) -> Optional[int]:
+        """Cached row ID for entry, or None (counted as a miss)"""
+        with self._lock:
+            self._check_data_version()
+            row_id = self._entries.get(entry)
+            if row_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry)
+            self.hits += 1
+            return row_id
+
+    def generation(self) -> int:
+        """Token to take before reading the database for a later put()"""
+        with self._lock:
+            self._check_data_version()
+            return self._generation
+
+    def put(self, entry: Hashable, row_id: int, generation: int):
+        """Store a row ID read after generation() unless invalidated since"""
+        with self._lock:
+            self._check_data_version()
+            if generation != self._generation:
+                return
+            self._entries[entry] = row_id
+            self._entries.move_to_end(entry)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, entry: Hashable):
+        """Drop a single entry found to be stale"""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(entry, None)
+
+    def invalidate_list(self, list_id: int):
+        """Drop the list's key and every item entry of the list"""
+        with self._lock:
+            self._generation += 1
+            for entry in [
+                entry
+                for entry, row_id in self._entries.items()
+                if (entry[0] == "list" and row_id == list_id)
+                or (entry[0] == "item" and entry[1] == list_id)
+            ]:
+                del self._entries[entry]
+
+    def invalidate_item(self, item_id: int):
+        """Drop every entry resolving to the item"""
+        with self._lock:
+            self._generation += 1
+            for entry in [
+                entry
+                for entry, row_id in self._entries.items()
+                if entry[0] == "item" and row_id == item_id
+            ]:
+                del self._entries[entry]
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, current size and data_version clears"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "clears": self.clears,
+            }
+
+    def reset_stats(self):
+        """Zero the hit/miss and clear counters"""
+        with self._lock:
+            self.hits = self.misses = self.clears = 0
+
+    def _clear(self):
+        self._generation += 1
+        self._entries.clear()
+
+    def _check_data_version(self):
+        """Discard everything when another connection has committed"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        data_version = self._connection.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            if self._data_version is not None:
+                self.clears += 1
+            self._data_version = data_version
+            self._clear()
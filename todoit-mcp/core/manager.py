@@ -4,8 +4,9 @@ Programmatic API for TODO list management - core business logic
 """
 
 import os
+import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from .database import (
     Database,
@@ -19,11 +20,12 @@ from .database import (
     TodoListDB,
     utc_now,
 )
-from .manager_base import ManagerBase
+from .manager_base import ManagerBase, unit_of_work
 from .manager_dependencies import DependenciesMixin
 from .manager_helpers import HelpersMixin
 from .manager_io import IOMixin
 from .manager_items import ItemsMixin
+from .manager_leases import LeasesMixin
 from .manager_lists import ListsMixin
 from .manager_properties import PropertiesMixin
 from .manager_subtasks import SubtasksMixin
@@ -60,6 +62,7 @@ class TodoManager(
     ItemsMixin,
     DependenciesMixin,
     SubtasksMixin,
+    LeasesMixin,
 ):
     """Programmatic API for TODO management - core business logic"""
 
@@ -69,6 +72,7 @@ class TodoManager(
 
     # === STAGE 1: 10 key functions ===
 
+    @unit_of_work
     def delete_list(self, key: Union[str, int]) -> bool:
         """3. Deletes a list (with relationship validation)"""
         # Get the list
@@ -80,6 +84,9 @@ class TodoManager(
         if not db_list:
             raise ValueError(f"List '{key}' does not exist")
 
+        if self.db.key_cache is not None:
+            self.db.key_cache.invalidate_list(db_list.id)
+
         with self.db.get_session() as session:
             # Re-fetch the list in the current session to ensure it's attached
             db_list_in_session = (
@@ -152,12 +159,12 @@ class TodoManager(
 
         # Check if all tasks are completed unless force=True
         if not force:
-            progress = self.get_progress(db_list.list_key)
-            if progress.total > 0 and progress.completed < progress.total:
-                incomplete_count = progress.total - progress.completed
+            stats = self.db.get_list_stats(db_list.id)
+            if stats["total"] > 0 and stats["completed"] < stats["total"]:
+                incomplete_count = stats["total"] - stats["completed"]
                 raise ValueError(
                     f"Cannot archive list with incomplete tasks. "
-                    f"Incomplete: {incomplete_count}/{progress.total} tasks. "
+                    f"Incomplete: {incomplete_count}/{stats['total']} tasks. "
                     f"Use force=True to archive anyway."
                 )
 
@@ -227,6 +234,7 @@ class TodoManager(
                 updated_at=db_list_in_session.updated_at,
             )
 
+    @unit_of_work
     def rename_list(
         self,
         current_key: str,
@@ -340,6 +348,129 @@ class TodoManager(
 
         return lists
 
+    def list_all_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        include_archived: bool = False,
+        filter_tags: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get one page of lists with progress and tags resolved for that page only.
+
+        Uses the same tag filtering rules as list_all (FORCE_TAGS with AND logic
+        takes precedence over filter_tags with OR logic).
+
+        Args:
+            limit: Maximum number of lists to return
+            offset: Number of lists to skip
+            include_archived: Whether to include archived lists
+            filter_tags: Optional tag names - list must have ANY of them
+
+        Returns:
+            Dict with 'lists' (TodoList models), 'total' (matching lists count),
+            'progress' (list_key -> ProgressStats) and 'tags' (list_key -> ListTag list)
+        """
+        if self.force_tags:
+            tag_names, match_all_tags = self.force_tags, True
+        else:
+            tag_names, match_all_tags = filter_tags, False
+
+        db_lists, total = self.db.get_lists_page(
+            limit=limit,
+            offset=offset,
+            include_archived=include_archived,
+            tag_names=tag_names,
+            match_all_tags=match_all_tags,
+        )
+
+        list_ids = [db_list.id for db_list in db_lists]
+        stats_by_id = self.db.get_progress_stats_for_lists(list_ids)
+        tags_by_id = self.db.get_tags_for_lists(list_ids)
+        tag_colors = self._get_tag_color_map() if any(tags_by_id.values()) else {}
+
+        lists = []
+        progress = {}
+        tags = {}
+        for db_list in db_lists:
+            lists.append(self._db_to_model(db_list, TodoList))
+
+            progress[db_list.list_key] = self._progress_from_stats(
+                stats_by_id[db_list.id]
+            )
+
+            list_tags = []
+            for db_tag in tags_by_id.get(db_list.id, []):
+                tag_model = self._db_to_model(db_tag, ListTag)
+                tag_model.color = tag_colors.get(tag_model.name, tag_model.color)
+                list_tags.append(tag_model)
+            tags[db_list.list_key] = sorted(list_tags, key=lambda t: t.name)
+
+        return {"lists": lists, "total": total, "progress": progress, "tags": tags}
+
+    def list_overview_page(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        search: str = "",
+        property_filters: Optional[Dict[str, str]] = None,
+        tag: str = "",
+        property_keys: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Get one page of active lists with item counts, properties and tags.
+
+        Search, property, tag and FORCE_TAGS filters plus paging run in SQL
+        (ordered by list_key); counts, properties and tags are then loaded
+        for the page only, one grouped query each.
+
+        Args:
+            limit: Maximum number of lists to return
+            offset: Number of lists to skip
+            search: Case-insensitive substring of list_key or title
+            property_filters: List property values the list must have
+            tag: Tag name the list must have
+            property_keys: List properties to load (None = all)
+
+        Returns:
+            Dict with 'lists' (TodoList models), 'total' (matching lists count),
+            'summaries' (list_key -> counts and last_item_update),
+            'properties' (list_key -> dict) and 'tags' (list_key -> tag names)
+        """
+        # FORCE_TAGS (AND) still applies; the requested tag narrows it further
+        tag_names = list(self.force_tags or [])
+        if tag:
+            tag_names.append(tag)
+
+        db_lists, total = self.db.get_lists_page(
+            limit=limit,
+            offset=offset,
+            tag_names=tag_names,
+            match_all_tags=True,
+            search=search,
+            property_filters=property_filters,
+            order_by_key=True,
+        )
+
+        list_ids = [db_list.id for db_list in db_lists]
+        summaries = self.db.get_item_summary_for_lists(list_ids)
+        properties = self.db.get_list_properties_for_lists(list_ids, property_keys)
+        tags = self.db.get_tags_for_lists(list_ids)
+
+        page = {
+            "lists": [],
+            "total": total,
+            "summaries": {},
+            "properties": {},
+            "tags": {},
+        }
+        for db_list in db_lists:
+            page["lists"].append(self._db_to_model(db_list, TodoList))
+            page["summaries"][db_list.list_key] = summaries[db_list.id]
+            page["properties"][db_list.list_key] = properties[db_list.id]
+            page["tags"][db_list.list_key] = [
+                db_tag.name for db_tag in tags.get(db_list.id, [])
+            ]
+        return page
+
     def get_archived_lists(self, limit: Optional[int] = None) -> List[TodoList]:
         """Retrieves all lists that have been archived.
 
@@ -371,29 +502,15 @@ class TodoManager(
         if not db_list:
             return None
 
-        # Get pending tasks
-        pending_items = self.db.get_items_by_status(db_list.id, "pending")
-
         if not respect_dependencies:
+            pending_items = self.db.get_items_by_status(db_list.id, "pending", limit=1)
             return (
                 self._db_to_model(pending_items[0], TodoItem) if pending_items else None
             )
 
-        # Check dependencies
-        for db_item in pending_items:
-            # Phase 1: Check parent/child dependencies (subtasks)
-            if db_item.parent_item_id:
-                parent = self.db.get_item_by_id(db_item.parent_item_id)
-                if parent and parent.status != "completed":
-                    continue
-
-            # Phase 2: Check cross-list dependencies (item blocked by other items)
-            if self.db.is_item_blocked(db_item.id):
-                continue  # Skip blocked items
-
-            return self._db_to_model(db_item, TodoItem)
-
-        return None
+        # Skip subitems of unfinished parents and items blocked by other items
+        db_item = self.db.get_next_unblocked_pending_item(db_list.id)
+        return self._db_to_model(db_item, TodoItem) if db_item else None
 
     def get_progress(self, list_key: str) -> ProgressStats:
         """8. Phase 3: Enhanced progress tracking with hierarchies and dependencies"""
@@ -402,40 +519,62 @@ class TodoManager(
         if not db_list:
             raise ValueError(f"List '{list_key}' does not exist")
 
-        # Basic stats
-        stats = self.db.get_list_stats(db_list.id)
+        # All counters (status, hierarchy, blocking) come from one aggregate pass
+        stats = self.db.get_list_progress_stats(db_list.id)
+        return self._progress_from_stats(stats)
+
+    def recount_list_counters(self, list_key: Optional[str] = None) -> Dict[str, int]:
+        """Rebuild the maintained per-list counters from the items.
+
+        Counters are kept exact by database triggers; this repairs them after
+        writes made with the triggers missing (e.g. by an older version).
+
+        Args:
+            list_key: Only recount this list (default: every list)
+
+        Returns:
+            Dict with 'lists' (lists checked) and 'corrected' (counter rows fixed)
+
+        Raises:
+            ValueError: If the list is not found.
+        """
+        list_ids = None
+        if list_key is not None:
+            db_list = self.db.get_list_by_key(list_key)
+            if not db_list:
+                raise ValueError(f"List '{list_key}' does not exist")
+            list_ids = [db_list.id]
+        return self.db.recount_list_counters(list_ids)
+
+    def recompute_parent_statuses(self, list_key: Optional[str] = None) -> int:
+        """Re-derive every parent item's status from its subtasks.
 
-        # Calculate completion percentage
+        Parent statuses follow their subtasks through database triggers; this
+        repairs parents that drifted, with one set-based UPDATE.
+
+        Args:
+            list_key: Only recompute parents in this list (default: every list)
+
+        Returns:
+            Number of items whose status changed
+
+        Raises:
+            ValueError: If the list is not found.
+        """
+        list_id = None
+        if list_key is not None:
+            db_list = self.db.get_list_by_key(list_key)
+            if not db_list:
+                raise ValueError(f"List '{list_key}' does not exist")
+            list_id = db_list.id
+        return self.db.recompute_parent_statuses(list_id)
+
+    def _progress_from_stats(self, stats: Dict[str, int]) -> ProgressStats:
+        """Build ProgressStats from a Database progress statistics dict"""
         completion_percentage = 0.0
         if stats["total"] > 0:
             completion_percentage = (stats["completed"] / stats["total"]) * 100
 
-        # Phase 3: Enhanced statistics
-        all_items = self.db.get_list_items(db_list.id)
-
-        # Count hierarchy structure
-        root_items = [item for item in all_items if item.parent_item_id is None]
-        subtasks = [item for item in all_items if item.parent_item_id is not None]
-
-        # Calculate maximum hierarchy depth
-        max_depth = 0
-        for item in all_items:
-            depth = self.db.get_item_depth(item.id)
-            max_depth = max(max_depth, depth)
-
-        # Count blocked items (Phase 2 cross-list dependencies)
-        blocked_count = 0
-        available_count = 0
-        for item in all_items:
-            if item.status in ["pending"]:
-                if self.db.is_item_blocked(item.id):
-                    blocked_count += 1
-                else:
-                    available_count += 1
-
-        # Count cross-list dependencies involving this list
-        dependencies = self.db.get_all_dependencies_for_list(db_list.id)
-
         return ProgressStats(
             total=stats["total"],
             completed=stats["completed"],
@@ -443,12 +582,12 @@ class TodoManager(
             pending=stats["pending"],
             failed=stats["failed"],
             completion_percentage=completion_percentage,
-            blocked=blocked_count,
-            available=available_count,
-            root_items=len(root_items),
-            subtasks=len(subtasks),
-            hierarchy_depth=max_depth,
-            dependency_count=len(dependencies),
+            blocked=stats["blocked"],
+            available=stats["available"],
+            root_items=stats["root_items"],
+            subtasks=stats["subtasks"],
+            hierarchy_depth=stats["hierarchy_depth"],
+            dependency_count=stats["dependency_count"],
         )
 
     def get_progress_bulk_minimal(
@@ -694,51 +833,44 @@ class TodoManager(
         Returns:
             List of dictionaries containing failed item details with list context and properties
         """
-        import re
-        from typing import Any, Dict
+        return list(self.iter_failed_items(list_filter, tag_filter))
+
+    def iter_failed_items(
+        self, list_filter: Optional[str] = None, tag_filter: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream failed items from active lists, sorted by list_key and position
+
+        Lists, items and properties are read with one joined query and the
+        list_key regex and tag filters are applied in SQL, so rows can be
+        emitted as they arrive (e.g. as JSON Lines).
+
+        Args:
+            list_filter: Optional regex pattern list_key must match from its start
+            tag_filter: Optional list of tag names to filter lists by
 
-        # Get only active lists (not archived) with optional tag filtering
-        all_lists = self.list_all(include_archived=False, filter_tags=tag_filter)
-        failed_reports = []
+        Yields:
+            Dictionaries containing failed item details with list context and properties
 
-        # Apply regex filter if provided
+        Raises:
+            ValueError: If list_filter is not a valid regular expression.
+        """
         if list_filter:
             try:
-                pattern = re.compile(list_filter)
-                all_lists = [
-                    todo_list
-                    for todo_list in all_lists
-                    if pattern.match(todo_list.list_key)
-                ]
+                re.compile(list_filter)
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern '{list_filter}': {e}")
 
-        # Collect failed items from all matching lists
-        for todo_list in all_lists:
-            failed_items = self.get_list_items(todo_list.list_key, status="failed")
-
-            for item in failed_items:
-                # Get properties for each failed item
-                properties = self.get_item_properties(todo_list.list_key, item.item_key)
-
-                failed_reports.append(
-                    {
-                        "list_key": todo_list.list_key,
-                        "list_title": todo_list.title,
-                        "list_type": str(todo_list.list_type)
-                        .replace("ListType.", "")
-                        .lower(),
-                        "item_key": item.item_key,
-                        "content": item.content,
-                        "position": item.position,
-                        "updated_at": item.updated_at,
-                        "created_at": item.created_at,
-                        "properties": properties,
-                    }
-                )
+        # Same tag rules as list_all: FORCE_TAGS (AND) override tag_filter (OR)
+        if self.force_tags:
+            tag_names, match_all_tags = self.force_tags, True
+        else:
+            tag_names, match_all_tags = tag_filter, False
 
-        # Sort by list_key first, then by position within each list
-        return sorted(failed_reports, key=lambda x: (x["list_key"], x["position"]))
+        return self.db.iter_failed_items(
+            list_key_pattern=list_filter or None,
+            tag_names=tag_names,
+            match_all_tags=match_all_tags,
+        )
 
     # === List Properties Methods ===
 
@@ -759,14 +891,11 @@ class TodoManager(
             ValueError: If the specified list is not found.
         """
 
-        # Get list
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
+        list_id = self._resolve_list_id(list_key)
 
         # Create or update property
         db_property = self.db.create_list_property(
-            db_list.id, property_key, property_value
+            list_id, property_key, property_value
         )
         return self._db_to_model(db_property, ListProperty)
 
@@ -783,13 +912,10 @@ class TodoManager(
         Raises:
             ValueError: If the specified list is not found.
         """
-        # Get list
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
+        list_id = self._resolve_list_id(list_key)
 
         # Get property
-        db_property = self.db.get_list_property(db_list.id, property_key)
+        db_property = self.db.get_list_property(list_id, property_key)
         return db_property.property_value if db_property else None
 
     def get_list_properties(self, list_key: str) -> Dict[str, str]:
@@ -804,13 +930,10 @@ class TodoManager(
         Raises:
             ValueError: If the specified list is not found.
         """
-        # Get list
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
+        list_id = self._resolve_list_id(list_key)
 
         # Get all properties
-        db_properties = self.db.get_list_properties(db_list.id)
+        db_properties = self.db.get_list_properties(list_id)
         return {prop.property_key: prop.property_value for prop in db_properties}
 
     def delete_list_property(self, list_key: str, property_key: str) -> bool:
@@ -826,13 +949,10 @@ class TodoManager(
         Raises:
             ValueError: If the specified list is not found.
         """
-        # Get list
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
+        list_id = self._resolve_list_id(list_key)
 
         # Delete property
-        return self.db.delete_list_property(db_list.id, property_key)
+        return self.db.delete_list_property(list_id, property_key)
 
     # ===== ITEM PROPERTIES METHODS =====
 
@@ -859,37 +979,11 @@ class TodoManager(
         Raises:
             ValueError: If the list, item, or parent item is not found.
         """
-        # Get list
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
-
-        # Get item (handling subitems)
-        if parent_item_key:
-            # Get parent item first
-            parent_item = self.db.get_item_by_key(db_list.id, parent_item_key)
-            if not parent_item:
-                raise ValueError(
-                    f"Parent item '{parent_item_key}' not found in list '{list_key}'"
-                )
-
-            # Get subitem
-            db_item = self.db.get_item_by_key_and_parent(
-                db_list.id, item_key, parent_item.id
-            )
-            if not db_item:
-                raise ValueError(
-                    f"Subitem '{item_key}' not found under parent '{parent_item_key}' in list '{list_key}'"
-                )
-        else:
-            # Get main item
-            db_item = self.db.get_item_by_key(db_list.id, item_key)
-            if not db_item:
-                raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
+        item_id = self._resolve_item_id(list_key, item_key, parent_item_key)
 
         # Create/update property
         db_property = self.db.create_item_property(
-            db_item.id, property_key, property_value
+            item_id, property_key, property_value
         )
         return self._db_to_model(db_property, ItemProperty)
 
@@ -914,34 +1008,9 @@ class TodoManager(
         Raises:
             ValueError: If the list, item, or parent item is not found.
         """
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
+        item_id = self._resolve_item_id(list_key, item_key, parent_item_key)
 
-        # Get item (handling subitems)
-        if parent_item_key:
-            # Get parent item first
-            parent_item = self.db.get_item_by_key(db_list.id, parent_item_key)
-            if not parent_item:
-                raise ValueError(
-                    f"Parent item '{parent_item_key}' not found in list '{list_key}'"
-                )
-
-            # Get subitem
-            db_item = self.db.get_item_by_key_and_parent(
-                db_list.id, item_key, parent_item.id
-            )
-            if not db_item:
-                raise ValueError(
-                    f"Subitem '{item_key}' not found under parent '{parent_item_key}' in list '{list_key}'"
-                )
-        else:
-            # Get main item
-            db_item = self.db.get_item_by_key(db_list.id, item_key)
-            if not db_item:
-                raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
-
-        return self.db.get_item_property(db_item.id, property_key)
+        return self.db.get_item_property(item_id, property_key)
 
     def get_item_properties(
         self, list_key: str, item_key: str, parent_item_key: Optional[str] = None
@@ -959,34 +1028,9 @@ class TodoManager(
         Raises:
             ValueError: If the list, item, or parent item is not found.
         """
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
-
-        # Get item (handling subitems)
-        if parent_item_key:
-            # Get parent item first
-            parent_item = self.db.get_item_by_key(db_list.id, parent_item_key)
-            if not parent_item:
-                raise ValueError(
-                    f"Parent item '{parent_item_key}' not found in list '{list_key}'"
-                )
+        item_id = self._resolve_item_id(list_key, item_key, parent_item_key)
 
-            # Get subitem
-            db_item = self.db.get_item_by_key_and_parent(
-                db_list.id, item_key, parent_item.id
-            )
-            if not db_item:
-                raise ValueError(
-                    f"Subitem '{item_key}' not found under parent '{parent_item_key}' in list '{list_key}'"
-                )
-        else:
-            # Get main item
-            db_item = self.db.get_item_by_key(db_list.id, item_key)
-            if not db_item:
-                raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
-
-        return self.db.get_item_properties(db_item.id)
+        return self.db.get_item_properties(item_id)
 
     def get_all_items_properties(
         self, list_key: str, status: Optional[str] = None, limit: Optional[int] = None
@@ -1020,57 +1064,35 @@ class TodoManager(
 
         # Get items filtered by status if specified
         if status is not None:
-            items = self.db.get_items_by_status(db_list.id, status)
+            items = self.db.get_items_by_status(db_list.id, status, limit)
         else:
-            items = self.db.get_list_items(db_list.id)
-
-        # Apply limit to items if specified
-        if limit is not None:
-            items = items[:limit]
-
-        # Create lookup for parent item keys
-        parent_id_to_key = {}
-        for item in items:
-            if item.parent_item_id is not None:
-                # Find parent item key
-                parent_item = next(
-                    (i for i in items if i.id == item.parent_item_id), None
-                )
-                if parent_item:
-                    parent_id_to_key[item.parent_item_id] = parent_item.item_key
+            items = self.db.get_list_items(db_list.id, limit=limit)
 
+        if not items:
+            return []
+
+        # Properties of all items in one query (by ID when the selection is small)
+        item_ids = [item.id for item in items]
+        properties_by_item = self.db.get_item_properties_for_list(
+            db_list.id,
+            status=status,
+            item_ids=item_ids if limit is not None and len(item_ids) <= 900 else None,
+        )
+
+        items_by_id = {item.id: item for item in items}
         result = []
         for item_order, item in enumerate(items):
-            # Get all properties for this item
-            properties = self.db.get_item_properties(item.id)
-            parent_item_key = (
-                parent_id_to_key.get(item.parent_item_id)
-                if item.parent_item_id
-                else None
-            )
+            parent_item = items_by_id.get(item.parent_item_id)
+            parent_item_key = parent_item.item_key if parent_item else None
+            properties = properties_by_item.get(item.id) or {"—": "—"}
 
-            if properties:
-                # Item has properties - add each property
-                for prop_key, prop_value in properties.items():
-                    result.append(
-                        {
-                            "item_key": item.item_key,
-                            "property_key": prop_key,
-                            "property_value": prop_value,
-                            "status": item.status,
-                            "item_order": item_order,
-                            "parent_item_id": item.parent_item_id,
-                            "parent_item_key": parent_item_key,
-                            "position": item.position,
-                        }
-                    )
-            else:
-                # Item has no properties - add placeholder entry to show hierarchy
+            # Properties-less items get a placeholder entry to show hierarchy
+            for prop_key, prop_value in properties.items():
                 result.append(
                     {
                         "item_key": item.item_key,
-                        "property_key": "—",
-                        "property_value": "—",
+                        "property_key": prop_key,
+                        "property_value": prop_value,
                         "status": item.status,
                         "item_order": item_order,
                         "parent_item_id": item.parent_item_id,
@@ -1084,14 +1106,10 @@ class TodoManager(
             if x["parent_item_id"] is None:
                 # Main item: sort by position, then property_key
                 return (x["position"], 0, x["property_key"])
-            else:
-                # Subitem: find parent's position to group subitems under their parents
-                parent_key = x.get("parent_item_key", "")
-                parent_item = next(
-                    (item for item in items if item.item_key == parent_key), None
-                )
-                parent_position = parent_item.position if parent_item else 999
-                return (parent_position, 1, x["position"], x["property_key"])
+            # Subitem: use parent's position to group subitems under their parents
+            parent_item = items_by_id.get(x["parent_item_id"])
+            parent_position = parent_item.position if parent_item else 999
+            return (parent_position, 1, x["position"], x["property_key"])
 
         result.sort(key=sort_key)
         return result
@@ -1102,6 +1120,7 @@ class TodoManager(
         property_key: str,
         property_value: str,
         limit: Optional[int] = None,
+        cursor: Optional[int] = None,
     ) -> List[TodoItem]:
         """Find items by property value with optional limit.
 
@@ -1110,6 +1129,8 @@ class TodoManager(
             property_key: The property name to match.
             property_value: The property value to match.
             limit: Maximum number of results to return (None = all).
+            cursor: ID of the last item of the previous page; results continue
+                after it (None = start from the beginning).
 
         Returns:
             List of TodoItem objects matching the criteria, ordered by position.
@@ -1124,29 +1145,20 @@ class TodoManager(
                 raise ValueError(f"List '{list_key}' not found")
             list_id = db_list.id
 
-        # Use database layer for efficient search
-        db_items = self.db.find_items_by_property(
-            list_id, property_key, property_value, limit
+        # List and parent keys come back from the same joined query
+        rows = self.db.find_items_by_property_with_context(
+            list_id, property_key, property_value, limit, cursor
         )
 
-        # Convert to Pydantic models and enrich with hierarchy context
         items = []
-        for db_item in db_items:
+        for db_item, item_list_key, parent_item_key in rows:
             item = self._db_to_model(db_item, TodoItem)
-            
-            # Add list_key
-            list_db = self.db.get_list_by_id(db_item.list_id)
-            item.list_key = list_db.list_key if list_db else None
-            
-            # Add parent_item_key if this is a subitem
+            item.list_key = item_list_key
             if db_item.parent_item_id:
-                parent_db = self.db.get_item_by_id(db_item.parent_item_id)
-                item.parent_item_key = parent_db.item_key if parent_db else None
-            
+                item.parent_item_key = parent_item_key
             items.append(item)
-        
-        return items
 
+        return items
 
     def find_items_by_status(
         self,
@@ -1346,34 +1358,9 @@ class TodoManager(
         Raises:
             ValueError: If the list, item, or parent item is not found.
         """
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' not found")
-
-        # Get item (handling subitems)
-        if parent_item_key:
-            # Get parent item first
-            parent_item = self.db.get_item_by_key(db_list.id, parent_item_key)
-            if not parent_item:
-                raise ValueError(
-                    f"Parent item '{parent_item_key}' not found in list '{list_key}'"
-                )
-
-            # Get subitem
-            db_item = self.db.get_item_by_key_and_parent(
-                db_list.id, item_key, parent_item.id
-            )
-            if not db_item:
-                raise ValueError(
-                    f"Subitem '{item_key}' not found under parent '{parent_item_key}' in list '{list_key}'"
-                )
-        else:
-            # Get main item
-            db_item = self.db.get_item_by_key(db_list.id, item_key)
-            if not db_item:
-                raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
+        item_id = self._resolve_item_id(list_key, item_key, parent_item_key)
 
-        return self.db.delete_item_property(db_item.id, property_key)
+        return self.db.delete_item_property(item_id, property_key)
 
         """Get all direct subitems for a given parent item.
 
@@ -1403,43 +1390,6 @@ class TodoManager(
         children = self.db.get_item_children(parent_item.id)
         return [self._db_to_model(child, TodoItem) for child in children]
 
-    def get_item_hierarchy(self, list_key: str, item_key: str) -> Dict[str, Any]:
-        """Get the full hierarchy for an item, including all its subitems recursively.
-
-        Args:
-            list_key: The key of the list containing the item.
-            item_key: The key of the root item of the hierarchy.
-
-        Returns:
-            A dictionary representing the item and its nested subitems.
-
-        Raises:
-            ValueError: If the list or item is not found.
-        """
-        # Get list
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' does not exist")
-
-        # Get item
-        db_item = self.db.get_item_by_key(db_list.id, item_key)
-        if not db_item:
-            raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
-
-        def build_hierarchy(item_db) -> Dict[str, Any]:
-            """Recursively build hierarchy structure"""
-            item_model = self._db_to_model(item_db, TodoItem)
-            children = self.db.get_item_children(item_db.id)
-
-            hierarchy = {
-                "item": item_model.to_dict(),
-                "subitems": [build_hierarchy(child) for child in children],
-            }
-
-            return hierarchy
-
-        return build_hierarchy(db_item)
-
     def get_next_pending_with_subtasks(self, list_key: str) -> Optional[TodoItem]:
         """
         Phase 3: Smart next task algorithm combining Phase 1 + Phase 2
@@ -1751,6 +1701,7 @@ class TodoManager(
 
         return False
 
+    @unit_of_work
     def move_to_subitem(
         self, list_key: str, item_key: str, new_parent_key: str
     ) -> TodoItem:
@@ -1789,8 +1740,7 @@ class TodoManager(
             raise ValueError("Cannot make item a subitem of itself")
 
         # Check if new parent is not already a descendant of this item
-        parent_path = self.db.get_item_path(parent_item.id)
-        if any(path_item.id == db_item.id for path_item in parent_path):
+        if self.db.is_item_ancestor(db_item.id, parent_item.id):
             raise ValueError("Cannot create circular reference in subitem hierarchy")
 
         # Update the item to have the new parent
@@ -1853,6 +1803,7 @@ class TodoManager(
 
         return self._db_to_model(db_dependency, ItemDependency)
 
+    @unit_of_work
     def remove_item_dependency(
         self,
         dependent_list: str,
@@ -1941,7 +1892,7 @@ class TodoManager(
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
         # Get blocking items
-        blockers = self.db.get_item_blockers(db_item.id)
+        blockers = self._get_blocker_db_items(db_item.id)
         return [self._db_to_model(blocker, TodoItem) for blocker in blockers]
 
     def get_items_blocked_by(self, list_key: str, item_key: str) -> List["TodoItem"]:
@@ -1967,7 +1918,7 @@ class TodoManager(
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
         # Get blocked items
-        blocked = self.db.get_items_blocked_by(db_item.id)
+        blocked = self._get_blocked_db_items(db_item.id)
         return [self._db_to_model(item, TodoItem) for item in blocked]
 
     def is_item_blocked(self, list_key: str, item_key: str) -> bool:
@@ -1992,7 +1943,7 @@ class TodoManager(
         if not db_item:
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
-        return self.db.is_item_blocked(db_item.id)
+        return self._is_db_item_blocked(db_item.id)
 
     def can_start_item(self, list_key: str, item_key: str) -> Dict[str, Any]:
         """
@@ -2019,50 +1970,132 @@ class TodoManager(
         if not db_item:
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
-        # Check if item is already completed or in progress
-        if db_item.status in ["completed", "in_progress"]:
-            return {
-                "can_start": False,
-                "reason": f"Item is already {db_item.status}",
-                "blocked_by_dependencies": False,
-                "blocked_by_subtasks": False,
-                "blockers": [],
-                "pending_subtasks": [],
-            }
+        children_by_parent = (
+            self.db.get_children_for_items([db_item.id])
+            if db_item.parent_item_id is None
+            else {}
+        )
+        return self._analyze_readiness([db_item], children_by_parent)[db_item.id]
 
-        # Check cross-list dependencies
-        blockers = self.db.get_item_blockers(db_item.id)
-        is_blocked_by_deps = len(blockers) > 0
-
-        # Check subtasks (if this is a parent with pending subtasks)
-        pending_children = []
-        if db_item.parent_item_id is None:  # Only check for root items
-            children = self.db.get_item_children(db_item.id)
-            pending_children = [
-                child
-                for child in children
-                if child.status in ["pending", "in_progress"]
-            ]
+    def get_list_readiness(self, list_key: str) -> Dict[int, Dict[str, Any]]:
+        """Bulk can_start_item for every item of a list.
 
-        is_blocked_by_subtasks = len(pending_children) > 0
+        Loads the list's items once, derives pending subtasks from that load
+        and fetches incomplete blockers for all not-started items together, so
+        the number of queries does not grow with the size of the list.
 
-        can_start = not (is_blocked_by_deps or is_blocked_by_subtasks)
+        Args:
+            list_key: The key of the list to analyze.
 
-        return {
-            "can_start": can_start,
-            "blocked_by_dependencies": is_blocked_by_deps,
-            "blocked_by_subtasks": is_blocked_by_subtasks,
-            "blockers": [
-                {"id": b.id, "key": b.item_key, "content": b.content} for b in blockers
-            ],
-            "pending_subtasks": [
-                {"id": s.id, "key": s.item_key, "content": s.content}
-                for s in pending_children
-            ],
-            "reason": self._get_blocking_reason(
-                is_blocked_by_deps, is_blocked_by_subtasks, blockers, pending_children
-            ),
-        }
+        Returns:
+            A dictionary mapping item ID to the can_start_item result for it.
+
+        Raises:
+            ValueError: If the list is not found.
+        """
+        return self._list_readiness(self._get_list_db_items(list_key))
+
+    def get_list_items_with_readiness(
+        self, list_key: str
+    ) -> Tuple[List[TodoItem], Dict[int, Dict[str, Any]]]:
+        """Items of a list together with get_list_readiness for them.
+
+        For callers that need both: the items are loaded once and serve as
+        the result and as the input of the readiness analysis.
+
+        Args:
+            list_key: The key of the list to analyze.
+
+        Returns:
+            The list's items (as get_list_items) and a dictionary mapping
+            item ID to the can_start_item result for it.
+
+        Raises:
+            ValueError: If the list is not found.
+        """
+        db_items = self._get_list_db_items(list_key)
+        items = [self._db_to_model(db_item, TodoItem) for db_item in db_items]
+        return items, self._list_readiness(db_items)
+
+    def _get_list_db_items(self, list_key: str) -> List[Any]:
+        db_list = self.db.get_list_by_key(list_key)
+        if not db_list:
+            raise ValueError(f"List '{list_key}' not found")
+        return self.db.get_list_items(db_list.id)
+
+    def _list_readiness(self, db_items: List[Any]) -> Dict[int, Dict[str, Any]]:
+        """Readiness of all of a list's items, children grouped from the same load"""
+        children_by_parent: Dict[int, List[Any]] = {}
+        for db_item in db_items:
+            if db_item.parent_item_id is not None:
+                children_by_parent.setdefault(db_item.parent_item_id, []).append(
+                    db_item
+                )
+        return self._analyze_readiness(db_items, children_by_parent)
+
+    def _analyze_readiness(
+        self, db_items: List[Any], children_by_parent: Dict[int, List[Any]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """can_start_item results for db_items keyed by item ID.
+
+        Pending subtasks are only checked for root items, as in the single
+        item check; children_by_parent must hold their direct children.
+        """
+        not_started = [
+            db_item.id
+            for db_item in db_items
+            if db_item.status not in ["completed", "in_progress"]
+        ]
+        blockers_by_item = (
+            self._get_blocker_db_items_bulk(not_started) if not_started else {}
+        )
+
+        readiness = {}
+        for db_item in db_items:
+            # Check if item is already completed or in progress
+            if db_item.status in ["completed", "in_progress"]:
+                readiness[db_item.id] = {
+                    "can_start": False,
+                    "reason": f"Item is already {db_item.status}",
+                    "blocked_by_dependencies": False,
+                    "blocked_by_subtasks": False,
+                    "blockers": [],
+                    "pending_subtasks": [],
+                }
+                continue
+
+            blockers = blockers_by_item.get(db_item.id, [])
+            pending_children = []
+            if db_item.parent_item_id is None:  # Only check for root items
+                pending_children = [
+                    child
+                    for child in children_by_parent.get(db_item.id, [])
+                    if child.status in ["pending", "in_progress"]
+                ]
+
+            is_blocked_by_deps = len(blockers) > 0
+            is_blocked_by_subtasks = len(pending_children) > 0
+
+            readiness[db_item.id] = {
+                "can_start": not (is_blocked_by_deps or is_blocked_by_subtasks),
+                "blocked_by_dependencies": is_blocked_by_deps,
+                "blocked_by_subtasks": is_blocked_by_subtasks,
+                "blockers": [
+                    {"id": b.id, "key": b.item_key, "content": b.content}
+                    for b in blockers
+                ],
+                "pending_subtasks": [
+                    {"id": s.id, "key": s.item_key, "content": s.content}
+                    for s in pending_children
+                ],
+                "reason": self._get_blocking_reason(
+                    is_blocked_by_deps,
+                    is_blocked_by_subtasks,
+                    blockers,
+                    pending_children,
+                ),
+            }
+        return readiness
 
     def get_cross_list_progress(self, project_key: str) -> Dict[str, Any]:
         """Get aggregated progress - returns empty since list relations were removed.
@@ -4,7 +4,23 @@ Base class with core initialization and helper methods
 """
 
 import os
-from typing import Any, Dict, List, Optional
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+
+def unit_of_work(method: Callable) -> Callable:
+    """Decorator running a manager operation in a single database unit of work.
+
+    All Database calls made by the operation share one session and are
+    committed once at the end (or rolled back together on error).
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.db.unit_of_work():
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class ManagerBase:
@@ -47,6 +63,9 @@ class ManagerBase:
         # Initialize environment variables
         self.force_tags = self._get_force_tags()
 
+        # Optional in-memory dependency index, see enable_dependency_index()
+        self.dependency_index = None
+
         # Validate database path before creating Database instance
         try:
             import pathlib
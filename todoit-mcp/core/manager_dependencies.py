@@ -3,14 +3,17 @@ TODOIT MCP - Dependencies Management Mixin
 Collection of dependency and blocking logic for TodoManager
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
+from .dependency_index import DependencyIndex
+from .manager_base import unit_of_work
 from .models import DependencyType, ItemDependency, TodoItem
 
 
 class DependenciesMixin:
     """Mixin containing dependency management methods for TodoManager"""
 
+    @unit_of_work
     def add_item_dependency(
         self,
         dependent_list: str,
@@ -94,6 +97,127 @@ class DependenciesMixin:
 
         return self._db_to_model(db_dependency, ItemDependency)
 
+    @unit_of_work
+    def add_item_dependencies(
+        self, dependencies: List[Dict[str, Any]]
+    ) -> List["ItemDependency"]:
+        """Add many dependencies between items in one transaction.
+
+        Items are resolved with one query per list and the dependency graph
+        reachable from the batch is loaded with one query, so the whole batch
+        is checked for loops in memory. Either all dependencies are added or none.
+
+        Args:
+            dependencies: List of dicts with dependent_list, dependent_item,
+                required_list and required_item, plus optional dependency_type
+                (default 'blocks') and metadata.
+
+        Returns:
+            The created ItemDependency objects, in input order.
+
+        Raises:
+            ValueError: If any list or item is not found, a dependency already
+                exists or is repeated, or the batch would create a circular loop.
+        """
+        required_fields = (
+            "dependent_list",
+            "dependent_item",
+            "required_list",
+            "required_item",
+        )
+        for dependency in dependencies:
+            missing = [field for field in required_fields if not dependency.get(field)]
+            if missing:
+                raise ValueError(
+                    f"Dependency {dependency!r} is missing: {', '.join(missing)}"
+                )
+
+        # Resolve items with one query per list
+        keys_by_list: Dict[str, Set[str]] = {}
+        for dependency in dependencies:
+            for role in ("dependent", "required"):
+                keys_by_list.setdefault(dependency[f"{role}_list"], set()).add(
+                    dependency[f"{role}_item"]
+                )
+
+        db_lists = {}
+        items_by_list = {}
+        for list_key, item_keys in keys_by_list.items():
+            db_list = self.db.get_list_by_key(list_key)
+            if not db_list:
+                raise ValueError(f"List '{list_key}' not found")
+            db_lists[list_key] = db_list
+            items_by_list[list_key] = self.db.get_first_items_by_keys(
+                db_list.id, list(item_keys)
+            )
+
+        edges = []
+        for dependency in dependencies:
+            ids = []
+            for role in ("dependent", "required"):
+                list_key = dependency[f"{role}_list"]
+                item_key = dependency[f"{role}_item"]
+                db_item = items_by_list[list_key].get(item_key)
+                if not db_item:
+                    raise ValueError(
+                        f"{role.capitalize()} item '{item_key}' not found in list '{list_key}'"
+                    )
+                ids.append(db_item.id)
+            edges.append((dependency, ids[0], ids[1]))
+
+        # Combine the existing graph reachable from the batch with the new edges
+        batch_item_ids = {item_id for _, *ids in edges for item_id in ids}
+        graph = self.db.get_dependency_edges_from(list(batch_item_ids))
+        for dependency, dependent_id, required_id in edges:
+            label = (
+                f"{dependency['dependent_list']}:{dependency['dependent_item']} → "
+                f"{dependency['required_list']}:{dependency['required_item']}"
+            )
+            if required_id in graph.get(dependent_id, set()):
+                raise ValueError(f"Dependency {label} already exists or is repeated")
+            graph.setdefault(dependent_id, set()).add(required_id)
+
+        # The existing graph has no loops, so any loop runs through a new edge
+        dependent_ids = [dependent_id for _, dependent_id, _ in edges]
+        if self._find_dependency_cycle(graph, dependent_ids):
+            raise ValueError(
+                "Adding these dependencies would create a circular dependency loop"
+            )
+
+        db_dependencies = self.db.create_item_dependencies_bulk(
+            [
+                {
+                    "dependent_item_id": dependent_id,
+                    "required_item_id": required_id,
+                    "dependency_type": dependency.get("dependency_type", "blocks"),
+                    "meta_data": dependency.get("metadata") or {},
+                }
+                for dependency, dependent_id, required_id in edges
+            ]
+        )
+
+        self.db.create_history_entries(
+            [
+                {
+                    "item_id": dependent_id,
+                    "list_id": db_lists[dependency["dependent_list"]].id,
+                    "action": "dependency_added",
+                    "new_value": {
+                        "required_list": dependency["required_list"],
+                        "required_item": dependency["required_item"],
+                        "dependency_type": dependency.get("dependency_type", "blocks"),
+                    },
+                    "user_context": "programmatic_api",
+                }
+                for dependency, dependent_id, _ in edges
+            ]
+        )
+
+        return [
+            self._db_to_model(db_dependency, ItemDependency)
+            for db_dependency in db_dependencies
+        ]
+
     def remove_item_dependency(
         self,
         dependent_list: str,
@@ -158,6 +282,68 @@ class DependenciesMixin:
 
         return success
 
+    def enable_dependency_index(self) -> DependencyIndex:
+        """Keep an in-memory dependency index for blocker lookups.
+
+        Meant for long-lived processes such as the MCP server: blocker checks
+        then read adjacency and statuses from memory after one query against
+        the dependency change log, instead of querying item_dependencies.
+
+        Returns:
+            The DependencyIndex now used by this manager.
+        """
+        if self.dependency_index is None:
+            self.dependency_index = DependencyIndex(self.db)
+        return self.dependency_index
+
+    def _get_blocker_db_items(self, item_id: int) -> List[Any]:
+        """Required items of item_id that are not completed"""
+        blocker_ids = (
+            self.dependency_index.blocker_ids(item_id)
+            if self.dependency_index is not None
+            else None
+        )
+        if blocker_ids is None:
+            return self.db.get_item_blockers(item_id)
+        items = self.db.get_items_by_ids(blocker_ids) if blocker_ids else {}
+        return [items[blocker_id] for blocker_id in blocker_ids if blocker_id in items]
+
+    def _get_blocker_db_items_bulk(self, item_ids: List[int]) -> Dict[int, List[Any]]:
+        """_get_blocker_db_items for several items in a few queries"""
+        blocker_ids = (
+            self.dependency_index.blocker_ids_bulk(item_ids)
+            if self.dependency_index is not None
+            else None
+        )
+        if blocker_ids is None:
+            return self.db.get_item_blockers_bulk(item_ids)
+        wanted = sorted({b for ids in blocker_ids.values() for b in ids})
+        items = self.db.get_items_by_ids(wanted) if wanted else {}
+        return {
+            item_id: [items[b] for b in ids if b in items]
+            for item_id, ids in blocker_ids.items()
+        }
+
+    def _get_blocked_db_items(self, item_id: int) -> List[Any]:
+        """Items that depend on item_id"""
+        dependent_ids = (
+            self.dependency_index.dependent_ids(item_id)
+            if self.dependency_index is not None
+            else None
+        )
+        if dependent_ids is None:
+            return self.db.get_items_blocked_by(item_id)
+        items = self.db.get_items_by_ids(dependent_ids) if dependent_ids else {}
+        return [items[item] for item in dependent_ids if item in items]
+
+    def _is_db_item_blocked(self, item_id: int) -> bool:
+        """Whether item_id has incomplete required items"""
+        if self.dependency_index is not None:
+            blocked = self.dependency_index.is_blocked(item_id)
+            if blocked is not None:
+                return blocked
+        return self.db.is_item_blocked(item_id)
+
     def get_item_blockers(self, list_key: str, item_key: str) -> List["TodoItem"]:
         """Get all items that are blocking the given item.
 
@@ -181,7 +367,7 @@ class DependenciesMixin:
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
         # Get blockers
-        blocker_items = self.db.get_item_blockers(db_item.id)
+        blocker_items = self._get_blocker_db_items(db_item.id)
 
         # Convert to Pydantic models
         blockers = []
@@ -213,7 +399,7 @@ class DependenciesMixin:
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
         # Get blocked items
-        blocked_items = self.db.get_items_blocked_by(db_item.id)
+        blocked_items = self._get_blocked_db_items(db_item.id)
 
         # Convert to Pydantic models
         blocked = []
@@ -244,71 +430,7 @@ class DependenciesMixin:
         if not db_item:
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
-        return self.db.is_item_blocked(db_item.id)
-
-    def can_start_item(self, list_key: str, item_key: str) -> Dict[str, Any]:
-        """Check if an item can be started and provide detailed blocking information.
-
-        Args:
-            list_key: The list key containing the item.
-            item_key: The item key to check.
-
-        Returns:
-            A dictionary with 'can_start' (bool), 'reason' (str), and detailed blocking info.
-
-        Raises:
-            ValueError: If the list or item is not found.
-        """
-        # Get the item
-        db_list = self.db.get_list_by_key(list_key)
-        if not db_list:
-            raise ValueError(f"List '{list_key}' does not exist")
-
-        db_item = self.db.get_item_by_key(db_list.id, item_key)
-        if not db_item:
-            raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
-
-        # Check if already in progress or completed
-        if db_item.status in ["in_progress", "completed"]:
-            return {
-                "can_start": False,
-                "reason": f"Item is already {db_item.status}",
-                "current_status": db_item.status,
-                "blockers": [],
-                "pending_subtasks": [],
-            }
-
-        # Check for pending subtasks
-        pending_children = self.db.get_items_by_status(db_list.id, "pending")
-        pending_subtasks = [
-            self._db_to_model(child, TodoItem)
-            for child in pending_children
-            if child.parent_item_id == db_item.id
-        ]
-
-        # Check cross-list dependencies
-        blockers = self.get_item_blockers(list_key, item_key)
-        incomplete_blockers = [b for b in blockers if b.status != "completed"]
-
-        # Determine blocking status
-        is_blocked_by_deps = len(incomplete_blockers) > 0
-        is_blocked_by_subtasks = len(pending_subtasks) > 0
-
-        can_start = not (is_blocked_by_deps or is_blocked_by_subtasks)
-
-        return {
-            "can_start": can_start,
-            "blocked_by_dependencies": is_blocked_by_deps,
-            "blocked_by_subtasks": is_blocked_by_subtasks,
-            "blockers": incomplete_blockers,
-            "pending_subtasks": pending_subtasks,
-            "reason": self._get_blocking_reason(
-                is_blocked_by_deps,
-                is_blocked_by_subtasks,
-                incomplete_blockers,
-                pending_subtasks,
-            ),
-        }
+        return self._is_db_item_blocked(db_item.id)
 
     def can_complete_item(self, list_key: str, item_key: str) -> Dict[str, Any]:
         """Check if an item can be completed and provide detailed blocking information.
@@ -3,109 +3,66 @@ TODOIT MCP - Helper Methods Mixin
 Collection of helper methods for TodoManager
 """
 
-from datetime import datetime, timezone
-from typing import List
-
-from sqlalchemy import text
-
-from .database import TodoItemDB
+from typing import Dict, Iterable, List, Optional
+
+from .database import ItemClosureDB, TodoItemDB
+from .key_cache import KeyCache
+
+# Tag colors in assignment order: the n-th tag by name gets the n-th color
+TAG_COLORS = [
+    "red",
+    "green",
+    "blue",
+    "yellow",
+    "orange",
+    "purple",
+    "cyan",
+    "magenta",
+    "pink",
+    "grey",
+    "bright_green",
+    "bright_red",
+]
 
 
 class HelpersMixin:
     """Mixin containing helper methods for TodoManager"""
 
-    def _sync_parent_status(
-        self, parent_item_id: int, session=None, visited=None
-    ) -> bool:
+    @staticmethod
+    def _find_dependency_cycle(
+        edges: Dict[int, Iterable[int]], starts: Iterable[int]
+    ) -> Optional[List[int]]:
         """
-        Synchronize parent status based on children statuses with optimal performance
+        Find a dependency loop reachable from the start nodes
+
+        Iterative depth-first search, so long chains cannot hit the recursion limit.
 
         Args:
-            parent_item_id: ID of parent item to synchronize
-            session: Optional SQLAlchemy session (creates new if None)
-            visited: Set of visited item IDs to prevent circular dependencies
+            edges: Adjacency dict of dependent node -> required nodes
+            starts: Nodes to search from
 
         Returns:
-            True if status was changed, False otherwise
+            Nodes of the first loop found (first node repeated at the end), or None
         """
-        if visited is None:
-            visited = set()
-
-        if parent_item_id in visited:
-            return False  # Circular dependency detected
-
-        visited.add(parent_item_id)
-
-        # Use provided session or create new one
-        if session:
-            return self._sync_parent_status_with_session(
-                parent_item_id, session, visited
-            )
-        else:
-            with self.db.get_session() as new_session:
-                result = self._sync_parent_status_with_session(
-                    parent_item_id, new_session, visited
-                )
-                new_session.commit()
-                return result
-
-    def _sync_parent_status_with_session(
-        self, parent_item_id: int, session, visited: set
-    ) -> bool:
-        """Internal method to sync parent status within existing session"""
-
-        # Get children status summary
-        summary = self.db.get_children_status_summary(parent_item_id, session)
-
-        if not summary:
-            return False  # No children, no sync needed
-
-        # Calculate new parent status based on rules:
-        # 1. Any failed -> failed
-        # 2. All pending -> pending
-        # 3. All completed -> completed
-        # 4. Any other combination -> in_progress
-        if summary["failed"] > 0:
-            new_status = "failed"
-        elif summary["pending"] == summary["total"]:
-            new_status = "pending"
-        elif summary["completed"] == summary["total"]:
-            new_status = "completed"
-        else:
-            new_status = "in_progress"
-
-        # Get current parent status
-        result = session.execute(
-            text("SELECT status, parent_item_id FROM todo_items WHERE id = :id"),
-            {"id": parent_item_id},
-        ).fetchone()
-
-        if not result:
-            return False
-
-        current_status = result[0]
-        grandparent_id = result[1]
-
-        # Only update if status actually changed
-        if current_status != new_status:
-            session.execute(
-                text(
-                    "UPDATE todo_items SET status = :status, updated_at = :updated_at WHERE id = :id"
-                ),
-                {
-                    "status": new_status,
-                    "updated_at": datetime.now(timezone.utc),
-                    "id": parent_item_id,
-                },
-            )
-
-            # Recursively sync grandparent if exists and not visited
-            if grandparent_id and grandparent_id not in visited:
-                self._sync_parent_status_with_session(grandparent_id, session, visited)
-
-            return True
-
-        return False
+        state: Dict[int, int] = {}  # 1 = on the current path, 2 = done
+        for start in starts:
+            if start in state:
+                continue
+            state[start] = 1
+            path = [start]
+            pending = [iter(edges.get(start, ()))]
+            while pending:
+                target = next(pending[-1], None)
+                if target is None:
+                    state[path.pop()] = 2
+                    pending.pop()
+                elif state.get(target) == 1:
+                    return path[path.index(target) :] + [target]
+                elif target not in state:
+                    state[target] = 1
+                    path.append(target)
+                    pending.append(iter(edges.get(target, ())))
+        return None
 
     def _get_blocking_reason(
         self,
@@ -136,69 +93,77 @@ class HelpersMixin:
 
         return "; ".join(reasons)
 
-    def _get_all_subtasks_recursive(self, item_id: int) -> List:
-        """Get all subtasks of an item recursively"""
-        all_subtasks = []
-        children = self.db.get_item_children(item_id)
+    def enable_key_cache(self, max_size: int = 4096) -> KeyCache:
+        """Cache list and item key lookups in memory.
 
-        for child in children:
-            all_subtasks.append(child)
-            # Get subtasks of this child recursively
-            all_subtasks.extend(self._get_all_subtasks_recursive(child.id))
+        Meant for long-lived processes such as the MCP server, where the same
+        keys are resolved on every tool call. The cache lives on the Database,
+        so all mixins share it.
 
-        return all_subtasks
+        Returns:
+            The KeyCache now used by this manager.
+        """
+        if self.db.key_cache is None:
+            self.db.key_cache = KeyCache(self.db.db_path, max_size)
+        return self.db.key_cache
+
+    def _resolve_list_id(self, list_key: str) -> int:
+        """ID of a list, for methods that need nothing else from it"""
+        list_id = self.db.get_list_id(list_key)
+        if list_id is None:
+            raise ValueError(f"List '{list_key}' not found")
+        return list_id
+
+    def _resolve_item_id(
+        self, list_key: str, item_key: str, parent_item_key: Optional[str] = None
+    ) -> int:
+        """ID of an item or subitem, for methods that need nothing else from it"""
+        list_id = self._resolve_list_id(list_key)
+
+        if parent_item_key:
+            parent_item_id = self.db.get_item_id(list_id, parent_item_key)
+            if parent_item_id is None:
+                raise ValueError(
+                    f"Parent item '{parent_item_key}' not found in list '{list_key}'"
+                )
+            item_id = self.db.get_item_id(list_id, item_key, parent_item_id)
+            if item_id is None:
+                raise ValueError(
+                    f"Subitem '{item_key}' not found under parent '{parent_item_key}' in list '{list_key}'"
+                )
+        else:
+            item_id = self.db.get_item_id(list_id, item_key)
+            if item_id is None:
+                raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
+        return item_id
 
-    def _get_item_and_subtasks_recursive(self, session, item_id: int) -> List:
-        """Helper method to get item and all its subtasks recursively"""
-        items = []
-
-        # Get the item itself
-        item = session.query(TodoItemDB).filter(TodoItemDB.id == item_id).first()
-        if item:
-            items.append(item)
-
-            # Get all children recursively
-            children = (
-                session.query(TodoItemDB)
-                .filter(TodoItemDB.parent_item_id == item_id)
-                .all()
-            )
-            for child in children:
-                items.extend(self._get_item_and_subtasks_recursive(session, child.id))
+    def _get_all_subtasks_recursive(self, item_id: int) -> List:
+        """Get all subtasks of an item at any depth"""
+        return self.db.get_item_descendants(item_id)
 
-        return items
+    def _get_item_and_subtasks_recursive(self, session, item_id: int) -> List:
+        """Helper method to get item and all its subtasks in one closure query"""
+        return (
+            session.query(TodoItemDB)
+            .join(ItemClosureDB, ItemClosureDB.descendant_id == TodoItemDB.id)
+            .filter(ItemClosureDB.ancestor_id == item_id)
+            .order_by(ItemClosureDB.depth, TodoItemDB.sort_key, TodoItemDB.id)
+            .all()
+        )
 
     def _get_item_depth(self, session, item_id: int) -> int:
         """Helper method to get the depth of an item in the hierarchy"""
-        depth = 0
-        current_id = item_id
-
-        while current_id:
-            item = session.query(TodoItemDB).filter(TodoItemDB.id == current_id).first()
-            if not item or not item.parent_item_id:
-                break
-            current_id = item.parent_item_id
-            depth += 1
-
-        return depth
+        depth = (
+            session.query(ItemClosureDB.depth)
+            .filter(ItemClosureDB.descendant_id == item_id)
+            .order_by(ItemClosureDB.depth.desc())
+            .limit(1)
+            .scalar()
+        )
+        return depth or 0
 
     def _get_tag_color_by_index(self, tag_name: str) -> str:
         """Get tag color based on its position in sorted tag list (dynamic assignment)"""
-        available_colors = [
-            "red",
-            "green",
-            "blue",
-            "yellow",
-            "orange",
-            "purple",
-            "cyan",
-            "magenta",
-            "pink",
-            "grey",
-            "bright_green",
-            "bright_red",
-        ]
-
         # Get all existing tags from database (avoid recursion)
         db_tags = self.db.get_all_tags()
         sorted_tag_names = sorted([tag.name for tag in db_tags])
@@ -208,34 +173,27 @@ class HelpersMixin:
             tag_index = sorted_tag_names.index(tag_name)
         except ValueError:
             # Tag not found, return default
-            return available_colors[0]
+            return TAG_COLORS[0]
 
         # Return color by index (cycle if more than 12 tags)
-        return available_colors[tag_index % len(available_colors)]
+        return TAG_COLORS[tag_index % len(TAG_COLORS)]
+
+    def _get_tag_color_map(self) -> Dict[str, str]:
+        """Get dynamic colors for all tags at once (single tag query)"""
+        sorted_tag_names = sorted(tag.name for tag in self.db.get_all_tags())
+        return {
+            tag_name: TAG_COLORS[index % len(TAG_COLORS)]
+            for index, tag_name in enumerate(sorted_tag_names)
+        }
 
     def _get_next_available_color(self) -> str:
         """Get next available color for new tags (checks 12 tag limit)"""
-        available_colors = [
-            "red",
-            "green",
-            "blue",
-            "yellow",
-            "orange",
-            "purple",
-            "cyan",
-            "magenta",
-            "pink",
-            "grey",
-            "bright_green",
-            "bright_red",
-        ]
-
         # Check if we exceed the 12 color limit
         db_tags = self.db.get_all_tags()
-        if len(db_tags) >= len(available_colors):
+        if len(db_tags) >= len(TAG_COLORS):
             raise ValueError(
-                f"Maximum number of tags reached ({len(available_colors)}). Cannot create more tags with distinct colors."
+                f"Maximum number of tags reached ({len(TAG_COLORS)}). Cannot create more tags with distinct colors."
             )
 
         # Return placeholder - actual color will be determined dynamically
-        return available_colors[0]
+        return TAG_COLORS[0]
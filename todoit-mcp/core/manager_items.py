@@ -3,14 +3,16 @@ TODOIT MCP - Item Operations Mixin
 Collection of basic item management methods for TodoManager
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
-from .models import ProgressStats, TodoHistory, TodoItem
+from .manager_base import unit_of_work
+from .models import ItemStatus, ProgressStats, TodoHistory, TodoItem
 
 
 class ItemsMixin:
     """Mixin containing basic item management methods for TodoManager"""
 
+    @unit_of_work
     def add_item(
         self,
         list_key: str,
@@ -56,6 +58,287 @@ class ItemsMixin:
 
         return self._db_to_model(db_item, TodoItem)
 
+    @unit_of_work
+    def add_items_bulk(
+        self,
+        list_key: str,
+        items: List[Dict[str, Any]],
+        parent_key: Optional[str] = None,
+    ) -> List[TodoItem]:
+        """Add a tree of items, subitems, properties and dependencies in one transaction
+
+        Each hierarchy level is inserted with one executemany INSERT, positions
+        are assigned in memory and properties, dependencies and history are
+        inserted in one batch each. Either the whole tree is added or nothing.
+
+        Args:
+            list_key: Key of the list to add items to
+            items: Item specs, each a dict with:
+                - item_key: Key of the item (required)
+                - content: Item description (required; "title" is accepted too)
+                - metadata: Optional dict of custom metadata
+                - properties: Optional dict of property key -> value
+                - dependencies: Optional list of items this one requires, as
+                  "item_key" in this list or "list_key:item_key"; items created
+                  in the same call can be referenced
+                - subitems: Optional list of nested item specs
+            parent_key: Optional existing item to add the top-level specs under
+
+        Returns:
+            Created items, each parent followed by its subitems (input order)
+
+        Raises:
+            ValueError: If the list, parent or a required item does not exist, a
+                spec is invalid, a key is duplicated or dependencies form a cycle
+        """
+        db_list = self.db.get_list_by_key(list_key)
+        if not db_list:
+            raise ValueError(f"List '{list_key}' does not exist")
+
+        parent_item = None
+        if parent_key:
+            parent_item = self.db.get_item_by_key(db_list.id, parent_key)
+            if not parent_item:
+                raise ValueError(
+                    f"Parent item '{parent_key}' not found in list '{list_key}'"
+                )
+
+        # Flatten the tree: nodes in input (pre)order, grouped by depth for
+        # inserting one level at a time once parent IDs are known
+        nodes: List[Dict[str, Any]] = []
+        levels: List[List[Dict[str, Any]]] = []
+        stack = [(spec, None, 0) for spec in reversed(items)]
+        sibling_keys: Dict[Optional[int], Set[str]] = {}
+        next_position: Dict[Optional[int], int] = {
+            None: self.db.get_next_position(
+                db_list.id, parent_item.id if parent_item else None
+            )
+        }
+        while stack:
+            spec, parent_node, depth = stack.pop()
+            if not isinstance(spec, dict):
+                raise ValueError(f"Item spec must be an object, got {spec!r}")
+            item_key = spec.get("item_key")
+            content = spec.get("content", spec.get("title"))
+            if not item_key or not content:
+                raise ValueError(
+                    f"Each item requires 'item_key' and 'content': {spec!r}"
+                )
+
+            parent_index = parent_node["index"] if parent_node else None
+            keys = sibling_keys.setdefault(parent_index, set())
+            if item_key in keys:
+                if parent_node:
+                    raise ValueError(
+                        f"Subitem key '{item_key}' is duplicated under parent '{parent_node['item_key']}'"
+                    )
+                raise ValueError(f"Item key '{item_key}' is duplicated")
+            keys.add(item_key)
+
+            position = next_position.get(parent_index, 1)
+            next_position[parent_index] = position + 1
+
+            node = {
+                "index": len(nodes),
+                "item_key": item_key,
+                "content": content,
+                "metadata": spec.get("metadata") or {},
+                "properties": spec.get("properties") or {},
+                "dependencies": spec.get("dependencies") or [],
+                "parent": parent_node,
+                "position": position,
+            }
+            nodes.append(node)
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append(node)
+
+            for subspec in reversed(spec.get("subitems") or []):
+                stack.append((subspec, node, depth + 1))
+
+        if not nodes:
+            return []
+
+        # Top-level keys must be free like in add_item / add_subitem
+        top_keys = [node["item_key"] for node in levels[0]]
+        if parent_item:
+            taken = {
+                child.item_key for child in self.db.get_item_children(parent_item.id)
+            }
+            for item_key in top_keys:
+                if item_key in taken:
+                    raise ValueError(
+                        f"Subitem key '{item_key}' already exists for parent '{parent_key}'"
+                    )
+        else:
+            taken = self.db.get_first_items_by_keys(db_list.id, top_keys)
+            for item_key in top_keys:
+                if item_key in taken:
+                    raise ValueError(
+                        f"Item '{item_key}' already exists in list '{list_key}'"
+                    )
+
+        # Resolve dependency references: existing items win (like get_item_by_key,
+        # which returns the lowest ID), then the first new item with that key
+        first_new: Dict[str, Dict[str, Any]] = {}
+        for level in levels:
+            for node in level:
+                first_new.setdefault(node["item_key"], node)
+
+        refs_by_list: Dict[str, Set[str]] = {}
+        for node in nodes:
+            parsed = []
+            for ref in node["dependencies"]:
+                if not isinstance(ref, str):
+                    raise ValueError(
+                        f"Dependency of '{node['item_key']}' must be 'item_key' or 'list_key:item_key', got {ref!r}"
+                    )
+                ref_list, _, ref_item = ref.rpartition(":")
+                parsed.append((ref_list or list_key, ref_item))
+                refs_by_list.setdefault(ref_list or list_key, set()).add(ref_item)
+            node["dependencies"] = parsed
+
+        existing_refs: Dict[Tuple[str, str], Any] = {}
+        for ref_list, ref_items in refs_by_list.items():
+            ref_db_list = (
+                db_list if ref_list == list_key else self.db.get_list_by_key(ref_list)
+            )
+            if not ref_db_list:
+                raise ValueError(f"Required list '{ref_list}' not found")
+            found = self.db.get_first_items_by_keys(ref_db_list.id, list(ref_items))
+            for ref_item, db_item in found.items():
+                existing_refs[(ref_list, ref_item)] = db_item
+
+        # edges: (dependent node, required existing item or node, list, key)
+        edges = []
+        new_edges: Dict[int, List[int]] = {}
+        for node in nodes:
+            seen = set()
+            for ref_list, ref_item in node["dependencies"]:
+                if (ref_list, ref_item) in seen:
+                    continue
+                seen.add((ref_list, ref_item))
+                required = existing_refs.get((ref_list, ref_item))
+                if required is None and ref_list == list_key:
+                    required = first_new.get(ref_item)
+                    if required is not None:
+                        new_edges.setdefault(node["index"], []).append(
+                            required["index"]
+                        )
+                if required is None:
+                    raise ValueError(
+                        f"Required item '{ref_item}' not found in list '{ref_list}'"
+                    )
+                edges.append((node, required, ref_list, ref_item))
+
+        # New items have no dependents yet, so a cycle can only run through
+        # dependencies between new items
+        cycle = self._find_dependency_cycle(new_edges, new_edges)
+        if cycle:
+            raise ValueError(
+                f"Dependencies of '{nodes[cycle[0]]['item_key']}' would create a circular dependency loop"
+            )
+
+        # Insert level by level; parent IDs come from the previous level
+        for level in levels:
+            rows = []
+            for node in level:
+                if node["parent"]:
+                    parent_item_id = node["parent"]["id"]
+                else:
+                    parent_item_id = parent_item.id if parent_item else None
+                rows.append(
+                    {
+                        "list_id": db_list.id,
+                        "item_key": node["item_key"],
+                        "content": node["content"],
+                        "position": node["position"],
+                        "parent_item_id": parent_item_id,
+                        "meta_data": node["metadata"],
+                    }
+                )
+            for node, item_id in zip(level, self.db.insert_items_bulk(rows)):
+                node["id"] = item_id
+
+        self.db.create_item_properties_bulk(
+            [
+                {
+                    "item_id": node["id"],
+                    "property_key": property_key,
+                    "property_value": str(property_value),
+                }
+                for node in nodes
+                for property_key, property_value in node["properties"].items()
+            ]
+        )
+
+        self.db.create_item_dependencies_bulk(
+            [
+                {
+                    "dependent_item_id": node["id"],
+                    "required_item_id": (
+                        required["id"] if isinstance(required, dict) else required.id
+                    ),
+                    "dependency_type": "blocks",
+                    "meta_data": {},
+                }
+                for node, required, _, _ in edges
+            ]
+        )
+
+        history_entries = []
+        for node in nodes:
+            if node["parent"] or parent_item:
+                history_entries.append(
+                    {
+                        "item_id": node["id"],
+                        "list_id": db_list.id,
+                        "action": "subitem_created",
+                        "new_value": {
+                            "parent_key": (
+                                node["parent"]["item_key"]
+                                if node["parent"]
+                                else parent_key
+                            ),
+                            "subitem_key": node["item_key"],
+                            "content": node["content"],
+                        },
+                        "user_context": "programmatic_api",
+                    }
+                )
+            else:
+                history_entries.append(
+                    {
+                        "item_id": node["id"],
+                        "list_id": db_list.id,
+                        "action": "created",
+                        "new_value": {
+                            "item_key": node["item_key"],
+                            "content": node["content"],
+                        },
+                        "user_context": "programmatic_api",
+                    }
+                )
+        for node, _, ref_list, ref_item in edges:
+            history_entries.append(
+                {
+                    "item_id": node["id"],
+                    "list_id": db_list.id,
+                    "action": "dependency_added",
+                    "new_value": {
+                        "required_list": ref_list,
+                        "required_item": ref_item,
+                        "dependency_type": "blocks",
+                    },
+                    "user_context": "programmatic_api",
+                }
+            )
+        self.db.create_history_entries(history_entries)
+
+        db_items = self.db.get_items_by_ids([node["id"] for node in nodes])
+        return [self._db_to_model(db_items[node["id"]], TodoItem) for node in nodes]
+
+    @unit_of_work
     def update_item_status(
         self,
         list_key: str,
@@ -133,15 +416,8 @@ class ItemsMixin:
 
             updates["completed_at"] = utc_now()
 
-        # Update the item
-        with self.db.get_session() as session:
-            db_item = self.db.update_item(db_item.id, updates)
-
-            # Sync parent status if this item has a parent
-            if db_item.parent_item_id:
-                self._sync_parent_status(db_item.parent_item_id, session)
-
-            session.commit()
+        # Update the item; its parent's status is re-derived by a database trigger
+        db_item = self.db.update_item(db_item.id, updates)
 
         # Save to history
         self._record_history(
@@ -154,6 +430,111 @@ class ItemsMixin:
 
         return self._db_to_model(db_item, TodoItem)
 
+    @unit_of_work
+    def update_items_status_bulk(
+        self,
+        list_key: str,
+        updates: List[Tuple[str, Optional[str], str]],
+    ) -> List[TodoItem]:
+        """Update the status of many items or subitems in one transaction
+
+        Keys are resolved in one query, item updates are written in one flush,
+        every affected parent is re-synchronized exactly once and history is
+        inserted in one batch. Either all updates are applied or none.
+
+        Args:
+            list_key: Key of the list containing the items
+            updates: List of (item_key, parent_item_key, status) tuples;
+                parent_item_key is None for top-level items
+
+        Returns:
+            Updated items, in the order they first appear in updates
+
+        Raises:
+            ValueError: If the list, an item or a status is invalid, or an item
+                has subtasks
+        """
+        from .database import utc_now
+
+        db_list = self.db.get_list_by_key(list_key)
+        if not db_list:
+            raise ValueError(f"List '{list_key}' does not exist")
+
+        valid_statuses = [status.value for status in ItemStatus]
+        for item_key, _, status in updates:
+            if status not in valid_statuses:
+                raise ValueError(
+                    f"Invalid status '{status}' for item '{item_key}'. "
+                    f"Valid statuses: {', '.join(valid_statuses)}"
+                )
+
+        key_pairs = [(item_key, parent_key) for item_key, parent_key, _ in updates]
+        db_items = self.db.get_items_by_key_pairs(db_list.id, key_pairs)
+        for item_key, parent_key in key_pairs:
+            if (item_key, parent_key) not in db_items:
+                if parent_key:
+                    raise ValueError(
+                        f"Item '{item_key}' not found under parent '{parent_key}' in list '{list_key}'"
+                    )
+                raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
+
+        with_children = self.db.get_item_ids_with_children(
+            [db_item.id for db_item in db_items.values()]
+        )
+        for (item_key, _), db_item in db_items.items():
+            if db_item.id in with_children:
+                raise ValueError(
+                    f"Cannot manually change status of item '{item_key}' because it has subtasks. Status is automatically synchronized based on subtask statuses."
+                )
+
+        # Apply updates in order, so repeated items behave like sequential calls.
+        # Every item gets the same columns, so one executemany UPDATE writes all.
+        now = utc_now()
+        item_updates: Dict[int, Dict[str, Any]] = {}
+        history_entries = []
+        for item_key, parent_key, status in updates:
+            db_item = db_items[(item_key, parent_key)]
+            fields = item_updates.setdefault(
+                db_item.id,
+                {
+                    "status": db_item.status,
+                    "started_at": db_item.started_at,
+                    "completed_at": db_item.completed_at,
+                    "updated_at": now,
+                },
+            )
+            old_status = fields["status"]
+
+            fields["status"] = status
+            if status == "in_progress" and fields["started_at"] is None:
+                fields["started_at"] = now
+            elif status == "completed":
+                fields["completed_at"] = now
+
+            history_entries.append(
+                {
+                    "item_id": db_item.id,
+                    "list_id": db_list.id,
+                    "action": "status_updated",
+                    "old_value": {"status": old_status},
+                    "new_value": {"status": status},
+                    "user_context": "programmatic_api",
+                }
+            )
+
+        # Each affected parent is re-derived once, after all items are written
+        updated_items = self.db.update_items_by_id(
+            item_updates, defer_parent_status=True
+        )
+
+        self.db.create_history_entries(history_entries)
+
+        return [
+            self._db_to_model(updated_items[item_id], TodoItem)
+            for item_id in item_updates
+        ]
+
+    @unit_of_work
     def clear_item_completion_states(
         self,
         list_key: str,
@@ -271,6 +652,7 @@ class ItemsMixin:
 
         return items
 
+    @unit_of_work
     def delete_item(
         self, list_key: str, item_key: str, parent_item_key: Optional[str] = None
     ) -> bool:
@@ -312,15 +694,10 @@ class ItemsMixin:
             old_value={"item_key": item_key, "content": db_item.content},
         )
 
-        # Delete the item
-        success = self.db.delete_item(db_item.id)
-
-        # Sync parent status if this item had a parent
-        if success and db_item.parent_item_id:
-            self._sync_parent_status(db_item.parent_item_id)
-
-        return success
+        # Delete the item; its parent's status is re-derived by a database trigger
+        return self.db.delete_item(db_item.id)
 
+    @unit_of_work
     def update_item_content(
         self,
         list_key: str,
@@ -374,6 +751,7 @@ class ItemsMixin:
 
         return self._db_to_model(db_item, TodoItem)
 
+    @unit_of_work
     def rename_item(
         self,
         list_key: str,
@@ -414,6 +792,7 @@ class ItemsMixin:
                 raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
         # Prepare updates and changes for history
+        old_content = db_item.content
         updates = {}
         changes = {}
 
@@ -453,7 +832,7 @@ class ItemsMixin:
             action="renamed",
             old_value={
                 "item_key": item_key,
-                "content": db_item.content,
+                "content": old_content,
             },
             new_value={
                 "item_key": updated_item.item_key,
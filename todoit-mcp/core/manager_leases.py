@@ -0,0 +1,178 @@
+"""
+TODOIT MCP - Work Claiming Mixin
+Atomic claiming of pending items by concurrent workers, with leases
+"""
+
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from .database import utc_now
+from .manager_base import unit_of_work
+from .models import HistoryAction, TodoItem
+
+
+class LeasesMixin:
+    """Mixin containing work claiming methods for TodoManager"""
+
+    def claim_next(
+        self,
+        list_key: str,
+        worker_id: str,
+        lease_seconds: int = 900,
+        smart_subtasks: bool = False,
+        count: int = 1,
+    ) -> Dict[str, Any]:
+        """Atomically claim the next pending item(s) of a list for a worker.
+
+        Selection and marking run in one BEGIN IMMEDIATE transaction, so two
+        workers calling this at the same time never receive the same item.
+        Claimed items are set to 'in_progress' and leased to worker_id until
+        the lease expires; expired leases of the list are released first.
+
+        Args:
+            list_key: The key of the list to claim items from.
+            worker_id: Identifier of the claiming worker.
+            lease_seconds: How long the claim is held before it may be released.
+            smart_subtasks: Use smart subtask selection (subitems before parents);
+                otherwise items that have subitems are never claimed and their
+                subitems are claimed in their place, in parent order.
+            count: Maximum number of items to claim in this call.
+
+        Returns:
+            A dictionary with the claimed 'items' (TodoItem objects, possibly
+            empty), 'worker_id' and 'lease_expires_at'.
+
+        Raises:
+            ValueError: If the list is not found or an argument is invalid.
+        """
+        if not worker_id:
+            raise ValueError("worker_id is required")
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        if count < 1:
+            raise ValueError("count must be at least 1")
+
+        with self.db.unit_of_work(immediate=True):
+            db_list = self.db.get_list_by_key(list_key)
+            if not db_list:
+                raise ValueError(f"List '{list_key}' does not exist")
+
+            self.release_expired_leases(list_key)
+
+            claimed_at = utc_now()
+            lease_expires_at = claimed_at + timedelta(seconds=lease_seconds)
+            claimed_ids: List[int] = []
+            for _ in range(count):
+                if smart_subtasks:
+                    next_item = self.get_next_pending_with_subtasks(list_key)
+                    if next_item is not None and self.db.has_subtasks(next_item.id):
+                        break
+                else:
+                    next_item = self.db.get_next_unblocked_pending_item(
+                        db_list.id, leaf_only=True
+                    )
+                if next_item is None:
+                    break
+
+                # Mark now, so the next selection in this loop moves on
+                self.db.update_items_by_id(
+                    {
+                        next_item.id: {
+                            "status": "in_progress",
+                            "started_at": next_item.started_at or claimed_at,
+                            "updated_at": claimed_at,
+                        }
+                    }
+                )
+                claimed_ids.append(next_item.id)
+
+            self.db.upsert_item_leases(
+                claimed_ids, worker_id, claimed_at, lease_expires_at
+            )
+            self.db.create_history_entries(
+                [
+                    {
+                        "item_id": item_id,
+                        "list_id": db_list.id,
+                        "action": HistoryAction.CLAIMED.value,
+                        "old_value": {"status": "pending"},
+                        "new_value": {
+                            "status": "in_progress",
+                            "worker_id": worker_id,
+                            "lease_expires_at": lease_expires_at.isoformat(),
+                        },
+                        "user_context": "programmatic_api",
+                    }
+                    for item_id in claimed_ids
+                ]
+            )
+            claimed = self.db.get_items_by_ids(claimed_ids)
+
+        return {
+            "items": [
+                self._db_to_model(claimed[item_id], TodoItem) for item_id in claimed_ids
+            ],
+            "worker_id": worker_id,
+            "lease_expires_at": lease_expires_at,
+        }
+
+    @unit_of_work
+    def release_expired_leases(self, list_key: Optional[str] = None) -> List[TodoItem]:
+        """Return items whose lease has expired to 'pending'.
+
+        Items that are no longer in progress (e.g. completed by their worker)
+        keep their status; only their expired lease is removed.
+
+        Args:
+            list_key: Only release leases of this list (default: all lists).
+
+        Returns:
+            A list of TodoItem objects that were set back to 'pending'.
+
+        Raises:
+            ValueError: If the list is not found.
+        """
+        list_id = None
+        if list_key is not None:
+            db_list = self.db.get_list_by_key(list_key)
+            if not db_list:
+                raise ValueError(f"List '{list_key}' does not exist")
+            list_id = db_list.id
+
+        now = utc_now()
+        expired = self.db.get_expired_item_leases(now, list_id)
+        if not expired:
+            return []
+
+        stale = [
+            (lease, db_item)
+            for lease, db_item in expired
+            if db_item.status == "in_progress"
+        ]
+        updated = self.db.update_items_by_id(
+            {
+                db_item.id: {"status": "pending", "updated_at": now}
+                for _, db_item in stale
+            }
+        )
+        self.db.create_history_entries(
+            [
+                {
+                    "item_id": db_item.id,
+                    "list_id": db_item.list_id,
+                    "action": HistoryAction.LEASE_EXPIRED.value,
+                    "old_value": {
+                        "status": "in_progress",
+                        "worker_id": lease.worker_id,
+                    },
+                    "new_value": {"status": "pending"},
+                    "user_context": "programmatic_api",
+                }
+                for lease, db_item in stale
+            ]
+        )
+        self.db.delete_item_leases([lease.item_id for lease, _ in expired])
+
+        return [
+            self._db_to_model(updated[db_item.id], TodoItem) for _, db_item in stale
+        ]
@@ -6,12 +6,14 @@ Collection of list management methods for TodoManager
 import re
 from typing import Any, Dict, List, Optional, Union
 
+from .manager_base import unit_of_work
 from .models import ListTag, ListTagAssignment, TodoList
 
 
 class ListsMixin:
     """Mixin containing list management methods for TodoManager"""
 
+    @unit_of_work
     def create_list(
         self,
         list_key: str,
@@ -3,14 +3,16 @@ TODOIT MCP - Subtasks and Hierarchy Management Mixin
 Collection of subtask and hierarchy methods for TodoManager
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from .manager_base import unit_of_work
 from .models import TodoItem
 
 
 class SubtasksMixin:
     """Mixin containing subtask and hierarchy management methods for TodoManager"""
 
+    @unit_of_work
     def add_subitem(
         self,
         list_key: str,
@@ -68,13 +70,9 @@ class SubtasksMixin:
             "meta_data": metadata or {},
         }
 
+        # Parent status is re-derived by a database trigger
         db_subitem = self.db.create_item(subitem_data)
 
-        # Synchronize parent status
-        with self.db.get_session() as session:
-            self._sync_parent_status(parent_item.id, session)
-            session.commit()
-
         # Record in history
         self._record_history(
             item_id=db_subitem.id,
@@ -124,15 +122,126 @@ class SubtasksMixin:
 
         return subitems
 
+    @unit_of_work
+    def get_item_tree_page(
+        self,
+        list_key: str,
+        limit: int = 100,
+        offset: int = 0,
+        include_subitems: bool = True,
+    ) -> Dict[str, Any]:
+        """Get one page of root items with their direct subitems and properties.
+
+        Roots are paged in SQL by position; subitems of the page come from one
+        grouped query and properties of all returned items from one more. With
+        include_subitems=False only subitem counts are loaded, so callers can
+        fetch subitems lazily (see get_subitems_with_properties).
+
+        Args:
+            list_key: The key of the list.
+            limit: Maximum number of root items to return.
+            offset: Number of root items to skip.
+            include_subitems: Whether to load the subitems of the page.
+
+        Returns:
+            Dict with 'items' (root TodoItems), 'total' (root item count),
+            'subitems' (root id -> TodoItems), 'subitem_counts' (root id -> int)
+            and 'properties' (item id -> {key: value}).
+
+        Raises:
+            ValueError: If the list is not found.
+        """
+        db_list = self.db.get_list_by_key(list_key)
+        if not db_list:
+            raise ValueError(f"List '{list_key}' does not exist")
+
+        db_roots, total = self.db.get_root_items_page(db_list.id, limit, offset)
+        root_ids = [db_item.id for db_item in db_roots]
+
+        subitems: Dict[int, List[TodoItem]] = {}
+        if include_subitems:
+            for parent_id, children in self.db.get_children_for_items(root_ids).items():
+                subitems[parent_id] = [
+                    self._db_to_model(child, TodoItem) for child in children
+                ]
+            subitem_counts = {
+                parent_id: len(children) for parent_id, children in subitems.items()
+            }
+        else:
+            subitem_counts = self.db.get_child_counts(root_ids)
+
+        item_ids = root_ids + [
+            child.id for children in subitems.values() for child in children
+        ]
+        properties = (
+            self.db.get_item_properties_for_list(db_list.id, item_ids=item_ids)
+            if item_ids
+            else {}
+        )
+
+        return {
+            "items": [self._db_to_model(db_item, TodoItem) for db_item in db_roots],
+            "total": total,
+            "subitems": subitems,
+            "subitem_counts": subitem_counts,
+            "properties": properties,
+        }
+
+    @unit_of_work
+    def get_subitems_with_properties(
+        self, list_key: str, parent_key: str
+    ) -> Dict[str, Any]:
+        """Get the subitems of an item together with their properties.
+
+        Args:
+            list_key: The key of the list containing the parent item.
+            parent_key: The key of the parent item.
+
+        Returns:
+            Dict with 'subitems' (TodoItems ordered by position) and
+            'properties' (item id -> {key: value}).
+
+        Raises:
+            ValueError: If the list or parent item is not found.
+        """
+        db_list = self.db.get_list_by_key(list_key)
+        if not db_list:
+            raise ValueError(f"List '{list_key}' does not exist")
+
+        # Root items are expanded, so resolve the key among them first
+        parent_item = self.db.get_item_by_key_and_parent(
+            db_list.id, parent_key, None
+        ) or self.db.get_item_by_key(db_list.id, parent_key)
+        if not parent_item:
+            raise ValueError(
+                f"Parent item '{parent_key}' not found in list '{list_key}'"
+            )
+
+        children = self.db.get_children_for_items([parent_item.id])[parent_item.id]
+        item_ids = [child.id for child in children]
+        properties = (
+            self.db.get_item_properties_for_list(db_list.id, item_ids=item_ids)
+            if item_ids
+            else {}
+        )
+
+        return {
+            "subitems": [self._db_to_model(child, TodoItem) for child in children],
+            "properties": properties,
+        }
+
     def get_item_hierarchy(self, list_key: str, item_key: str) -> Dict[str, Any]:
         """Get the hierarchical structure of an item and its subitems.
 
+        The whole subtree is loaded with one recursive query.
+
         Args:
             list_key: The key of the list containing the item.
             item_key: The key of the item.
 
         Returns:
-            A dictionary representing the hierarchical structure with the item and all its nested subitems.
+            A dictionary with the item, its nested subitems and stats counting
+            all descendants by status.
 
         Raises:
             ValueError: If the list or item is not found.
@@ -147,30 +256,36 @@ class SubtasksMixin:
         if not db_item:
             raise ValueError(f"Item '{item_key}' not found in list '{list_key}'")
 
-        def build_hierarchy(item_id: int, session=None) -> Dict[str, Any]:
-            """Recursively build hierarchy for an item"""
-            if session is None:
-                session = self.db.get_session()
+        rows = self.db.get_item_subtree(db_list.id, db_item.id)
+        return self._build_hierarchies(rows)[0]
 
-            # Get the item
-            from sqlalchemy.orm import selectinload
+    def get_list_hierarchy(self, list_key: str) -> List[Dict[str, Any]]:
+        """Get the hierarchical structure of every root item in a list.
 
-            db_item = (
-                session.query(self.db.TodoItemDB)
-                .options(selectinload(self.db.TodoItemDB.children))
-                .filter(self.db.TodoItemDB.id == item_id)
-                .first()
-            )
+        Args:
+            list_key: The key of the list.
 
-            if not db_item:
-                return {}
+        Returns:
+            A list of hierarchies in the format of get_item_hierarchy, one per
+            root item in natural order.
 
-            # Convert to Pydantic model
-            item = self._db_to_model(db_item, TodoItem)
+        Raises:
+            ValueError: If the list is not found.
+        """
+        db_list = self.db.get_list_by_key(list_key)
+        if not db_list:
+            raise ValueError(f"List '{list_key}' does not exist")
+
+        return self._build_hierarchies(self.db.get_item_subtree(db_list.id))
 
-            # Build hierarchy structure
-            hierarchy = {
-                "item": item.model_dump(),
+    def _build_hierarchies(self, rows: List[Tuple[Any, int]]) -> List[Dict[str, Any]]:
+        """Assemble nested hierarchies from depth-first (item, depth) rows in one pass"""
+        roots: List[Dict[str, Any]] = []
+        path: List[Dict[str, Any]] = []  # Current node of every level above
+        for db_item, depth in rows:
+            item = self._db_to_model(db_item, TodoItem)
+            node = {
+                "item": item.to_dict(),
                 "subitems": [],
                 "stats": {
                     "total_subitems": 0,
@@ -181,40 +296,22 @@ class SubtasksMixin:
                 },
             }
 
-            # Get direct children
-            children = self.db.get_item_children(item_id)
-            hierarchy["stats"]["total_subitems"] = len(children)
-
-            for child in children:
-                child_hierarchy = build_hierarchy(child.id, session)
-                hierarchy["subitems"].append(child_hierarchy)
-
-                # Update stats
-                if child.status == "completed":
-                    hierarchy["stats"]["completed_subitems"] += 1
-                elif child.status == "pending":
-                    hierarchy["stats"]["pending_subitems"] += 1
-                elif child.status == "in_progress":
-                    hierarchy["stats"]["in_progress_subitems"] += 1
-                elif child.status == "failed":
-                    hierarchy["stats"]["failed_subitems"] += 1
-
-                # Add nested stats
-                nested_stats = child_hierarchy.get("stats", {})
-                for stat_key in [
-                    "total_subitems",
-                    "completed_subitems",
-                    "pending_subitems",
-                    "in_progress_subitems",
-                    "failed_subitems",
-                ]:
-                    hierarchy["stats"][stat_key] += nested_stats.get(stat_key, 0)
-
-            return hierarchy
-
-        # Build and return hierarchy
-        with self.db.get_session() as session:
-            return build_hierarchy(db_item.id, session)
+            del path[depth:]
+            if path:
+                path[-1]["subitems"].append(node)
+            else:
+                roots.append(node)
+
+            # Roll the item up into the stats of all its ancestors
+            status_key = f"{db_item.status}_subitems"
+            for ancestor in path:
+                ancestor["stats"]["total_subitems"] += 1
+                if status_key in ancestor["stats"]:
+                    ancestor["stats"][status_key] += 1
+
+            path.append(node)
+
+        return roots
 
     def auto_complete_parent(self, list_key: str, item_key: str) -> bool:
         """Automatically complete a parent item if all its subitems are completed.
@@ -322,19 +419,9 @@ class SubtasksMixin:
             "parent_item_id": parent_item.id,
             "position": new_position,
         }
+        # Old and new parent statuses are re-derived by a database trigger
         updated_item = self.db.update_item(db_item.id, updates)
 
-        # Synchronize both old and new parent statuses
-        with self.db.get_session() as session:
-            # Sync new parent
-            self._sync_parent_status(parent_item.id, session)
-
-            # If item had an old parent, sync it too
-            if db_item.parent_item_id:
-                self._sync_parent_status(db_item.parent_item_id, session)
-
-            session.commit()
-
         # Record in history
         self._record_history(
             item_id=updated_item.id,
@@ -357,25 +444,5 @@ class SubtasksMixin:
         self, item_id: int, potential_parent_id: int
     ) -> bool:
         """Check if making potential_parent_id a parent of item_id would create a circular dependency."""
-        # Start from the potential parent and walk up the hierarchy
-        current_id = potential_parent_id
-        visited = set()
-
-        while current_id:
-            if current_id == item_id:
-                return True  # Circular dependency found
-
-            if current_id in visited:
-                # Infinite loop detected (shouldn't happen with proper data)
-                break
-
-            visited.add(current_id)
-
-            # Get parent of current item
-            db_item = self.db.get_item_by_id(current_id)
-            if not db_item:
-                break
-
-            current_id = db_item.parent_item_id
-
-        return False
+        # Circular if the item is the potential parent or one of its ancestors
+        return self.db.is_item_ancestor(item_id, potential_parent_id)
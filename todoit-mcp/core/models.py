@@ -51,6 +51,8 @@ class HistoryAction(str, Enum):
     SUBITEM_CREATED = "subitem_created"
     AUTO_COMPLETED = "auto_completed"
     MOVED_TO_SUBITEM = "moved_to_subitem"
+    CLAIMED = "claimed"
+    LEASE_EXPIRED = "lease_expired"
 
 
 class DependencyType(str, Enum):
@@ -13,7 +13,7 @@ from rich.console import Console
 from core.manager import TodoManager
 
 from .cli_modules.dependency_commands import dep
-from .cli_modules.io_stats_commands import interactive, io, schema_info, stats
+from .cli_modules.io_stats_commands import db, interactive, io, schema_info, stats
 from .cli_modules.item_commands import item
 
 # Import command modules
@@ -103,6 +103,7 @@ cli.add_command(tags)
 cli.add_command(stats)
 cli.add_command(io)
 cli.add_command(dep)
+cli.add_command(db)
 cli.add_command(schema_info)
 cli.add_command(interactive)
 cli.add_command(report_group, name="reports")
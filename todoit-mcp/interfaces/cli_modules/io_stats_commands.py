@@ -1,6 +1,6 @@
 """
-I/O, Stats and Schema commands for TODOIT CLI
-Handles import/export, progress stats, and system information
+I/O, Stats, Database and Schema commands for TODOIT CLI
+Handles import/export, progress stats, database maintenance and system information
 """
 
 import click
@@ -129,6 +129,50 @@ def io_export(ctx, list_key, file_path):
         console.print(f"[bold red]❌ Error:[/] {e}")
 
 
+# === Database maintenance commands ===
+
+
+@click.group()
+def db():
+    """Database maintenance"""
+    pass
+
+
+@db.command("recount")
+@click.option("--list", "list_key", help="Only recount this list")
+@click.pass_context
+def db_recount(ctx, list_key):
+    """Rebuild per-list status counters from the items"""
+    manager = get_manager(ctx.obj["db_path"])
+
+    try:
+        with console.status("[bold green]Recounting list counters..."):
+            result = manager.recount_list_counters(list_key)
+
+        console.print(
+            f"[green]✅ Recounted {result['lists']} list(s), "
+            f"corrected {result['corrected']}[/]"
+        )
+    except Exception as e:
+        console.print(f"[bold red]❌ Error:[/] {e}")
+
+
+@db.command("sync-parents")
+@click.option("--list", "list_key", help="Only sync parents in this list")
+@click.pass_context
+def db_sync_parents(ctx, list_key):
+    """Re-derive parent item statuses from their subtasks"""
+    manager = get_manager(ctx.obj["db_path"])
+
+    try:
+        with console.status("[bold green]Syncing parent statuses..."):
+            changed = manager.recompute_parent_statuses(list_key)
+
+        console.print(f"[green]✅ Synced parent statuses, {changed} changed[/]")
+    except Exception as e:
+        console.print(f"[bold red]❌ Error:[/] {e}")
+
+
 # === System schema command ===
 
 
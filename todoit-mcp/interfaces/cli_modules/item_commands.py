@@ -4,6 +4,7 @@ Handles add, status, edit, delete, list, tree operations with smart item/subitem
 """
 
 import json
+from typing import List, Optional, Tuple
 
 import click
 from rich.console import Console
@@ -60,14 +61,37 @@ def item():
     pass
 
 
+def _read_items_file(path: str) -> List[dict]:
+    """Read an item tree for bulk creation from a JSON or YAML file
+
+    The file holds a list of item specs (or {"items": [...]}); see
+    TodoManager.add_items_bulk for the spec format.
+    """
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f)  # YAML is a superset of JSON
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list):
+        raise ValueError("Items file must contain a list of items or {'items': [...]}")
+    return data
+
+
 @item.command("add")
 @click.option("--list", "list_key", required=True, help="List key")
-@click.option("--item", "item_key", required=True, help="Item key")
+@click.option("--item", "item_key", help="Item key")
 @click.option("--subitem", "subitem_key", help="Subitem key (if adding subitem)")
-@click.option("--title", required=True, help="Item or subitem title/description")
+@click.option("--title", help="Item or subitem title/description")
 @click.option("--metadata", "-m", help="Metadata JSON")
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Add an item tree (JSON/YAML) in one transaction; --item sets the parent",
+)
 @click.pass_context
-def item_add(ctx, list_key, item_key, subitem_key, title, metadata):
+def item_add(ctx, list_key, item_key, subitem_key, title, metadata, from_file):
     """Add item or subitem to TODO list
 
     Examples:
@@ -76,6 +100,9 @@ def item_add(ctx, list_key, item_key, subitem_key, title, metadata):
 
       # Add subitem
       todoit item add --list "project" --item "feature1" --subitem "step1" --title "Design UI"
+
+      # Add many items with subitems, properties and dependencies at once
+      todoit item add --list "project" --from-file items.yaml
     """
     manager = get_manager(ctx.obj["db_path"])
 
@@ -87,6 +114,22 @@ def item_add(ctx, list_key, item_key, subitem_key, title, metadata):
         )
         return
 
+    if from_file:
+        try:
+            items = manager.add_items_bulk(
+                list_key, _read_items_file(from_file), parent_key=item_key
+            )
+            console.print(f"[green]✅ Added {len(items)} items to list '{list_key}'[/]")
+        except Exception as e:
+            from .display import _output_error_or_message
+
+            _output_error_or_message(str(e), is_error=True)
+        return
+
+    if not item_key or not title:
+        console.print("[red]--item and --title are required (or use --from-file)[/]")
+        return
+
     try:
         meta = json.loads(metadata) if metadata else {}
 
@@ -131,19 +174,47 @@ def item_add(ctx, list_key, item_key, subitem_key, title, metadata):
         _output_error_or_message(str(e), is_error=True)
 
 
+def _read_status_updates_file(path: str) -> List[Tuple[str, Optional[str], str]]:
+    """Read bulk status updates from a file
+
+    Each non-empty line is "<item> <status>" or "<item> <subitem> <status>";
+    lines starting with # are ignored.
+    """
+    updates = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            if len(parts) == 2:
+                updates.append((parts[0], None, parts[1]))
+            elif len(parts) == 3:
+                updates.append((parts[1], parts[0], parts[2]))
+            else:
+                raise ValueError(
+                    f"Line {line_number}: expected '<item> [<subitem>] <status>'"
+                )
+    return updates
+
+
 @item.command("status")
 @click.option("--list", "list_key", required=True, help="List key")
-@click.option("--item", "item_key", required=True, help="Item key")
+@click.option("--item", "item_key", help="Item key")
 @click.option("--subitem", "subitem_key", help="Subitem key (if updating subitem)")
 @click.option(
     "--status",
-    required=True,
     type=click.Choice(["pending", "in_progress", "completed", "failed"]),
     help="Status: pending, in_progress, completed, failed",
 )
 @click.option("--state", "-s", multiple=True, help="State in format key=value")
+@click.option(
+    "--from-file",
+    "from_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Update many items in one transaction; lines: <item> [<subitem>] <status>",
+)
 @click.pass_context
-def item_status(ctx, list_key, item_key, subitem_key, status, state):
+def item_status(ctx, list_key, item_key, subitem_key, status, state, from_file):
     """Update item or subitem status
 
     Examples:
@@ -152,6 +223,9 @@ def item_status(ctx, list_key, item_key, subitem_key, status, state):
 
       # Update subitem status
       todoit item status --list "project" --item "feature1" --subitem "step1" --status completed
+
+      # Update many items at once (one "<item> [<subitem>] <status>" per line)
+      todoit item status --list "project" --from-file statuses.txt
     """
     manager = get_manager(ctx.obj["db_path"])
 
@@ -163,6 +237,23 @@ def item_status(ctx, list_key, item_key, subitem_key, status, state):
         )
         return
 
+    if from_file:
+        try:
+            updates = _read_status_updates_file(from_file)
+            items = manager.update_items_status_bulk(list_key, updates)
+            console.print(
+                f"[green]✅ Updated status of {len(items)} items in list '{list_key}'[/]"
+            )
+        except Exception as e:
+            from .display import _output_error_or_message
+
+            _output_error_or_message(str(e), is_error=True)
+        return
+
+    if not item_key or not status:
+        console.print("[red]--item and --status are required (or use --from-file)[/]")
+        return
+
     try:
         states = {}
         for s in state:
@@ -574,6 +665,77 @@ def item_next_smart(ctx, list_key, start):
         _output_error_or_message(str(e), is_error=True)
 
 
+@item.command("claim")
+@click.option("--list", "list_key", required=True, help="List key")
+@click.option("--worker", "worker_id", required=True, help="Worker identifier")
+@click.option(
+    "--lease",
+    "lease_seconds",
+    type=int,
+    default=900,
+    show_default=True,
+    help="Lease length in seconds",
+)
+@click.option("--count", type=int, default=1, show_default=True, help="Items to claim")
+@click.option("--smart", is_flag=True, help="Use smart subitem logic")
+@click.pass_context
+def item_claim(ctx, list_key, worker_id, lease_seconds, count, smart):
+    """Atomically claim next pending item(s) for a worker
+
+    Claimed items are set to in_progress and leased to the worker. When a lease
+    expires, unfinished items go back to pending on the next claim.
+
+    Example:
+      todoit item claim --list "project" --worker agent-1 --count 3
+    """
+    manager = get_manager(ctx.obj["db_path"])
+
+    # Check if list is accessible based on FORCE_TAGS (environment isolation)
+    if not _check_list_access(manager, list_key):
+        console.print(f"[red]List '{list_key}' not found or not accessible[/]")
+        console.print(
+            "[dim]Check your TODOIT_FORCE_TAGS environment variable if using environment isolation[/]"
+        )
+        return
+
+    try:
+        result = manager.claim_next(
+            list_key,
+            worker_id,
+            lease_seconds=lease_seconds,
+            smart_subtasks=smart,
+            count=count,
+        )
+        expires = result["lease_expires_at"].strftime("%Y-%m-%d %H:%M:%S")
+        data = [
+            {
+                "Item": item.content,
+                "Key": item.item_key,
+                "Position": str(item.position),
+                "Status": _get_status_for_output(item.status.value),
+                "Lease Until": expires,
+            }
+            for item in result["items"]
+        ]
+
+        columns = {
+            "Item": {"style": "cyan"},
+            "Key": {"style": "magenta"},
+            "Position": {"style": "yellow"},
+            "Status": {"style": "green"},
+            "Lease Until": {"style": "dim"},
+        }
+
+        _display_records(
+            data, f"🔒 Claimed by '{worker_id}' in list '{list_key}'", columns
+        )
+
+    except Exception as e:
+        from .display import _output_error_or_message
+
+        _output_error_or_message(str(e), is_error=True)
+
+
 @item.command("tree")
 @click.option("--list", "list_key", required=True, help="List key")
 @click.option("--item", "item_key", help="Item key (show hierarchy for specific item)")
@@ -651,35 +813,37 @@ def item_tree(ctx, list_key, item_key):
                 console.print(f"[red]List '{list_key}' not found[/]")
                 return
 
-            items = manager.get_list_items(list_key)
-            if not items:
+            hierarchies = manager.get_list_hierarchy(list_key)
+            if not hierarchies:
                 _display_records([], f"📋 Tree View for '{list_key}'", {})
                 return
 
-            # Convert items to hierarchical flat structure for unified display
+            # Flatten the hierarchy (depth-first) for unified display
             data = []
-            for item in items:
-                # Calculate indentation based on parent relationship
-                depth = 0
-                if hasattr(item, "parent_item_id") and item.parent_item_id:
-                    depth = 1  # Simplified depth calculation
 
+            def add_rows(node, depth):
+                item = node["item"]
                 indent = "  " * depth
-                status_icon = _get_status_icon(item.status.value)
+                status_icon = _get_status_icon(item["status"])
 
                 if depth == 0:
-                    hierarchy_display = f"{status_icon} {item.content}"
+                    hierarchy_display = f"{status_icon} {item['content']}"
                 else:
-                    hierarchy_display = f"{indent}└─ {status_icon} {item.content}"
+                    hierarchy_display = f"{indent}└─ {status_icon} {item['content']}"
 
                 data.append(
                     {
-                        "Position": str(item.position),
-                        "Key": item.item_key,
+                        "Position": str(item["position"]),
+                        "Key": item["item_key"],
                         "Status": status_icon,
                         "Item": hierarchy_display,
                     }
                 )
+                for subitem in node["subitems"]:
+                    add_rows(subitem, depth + 1)
+
+            for hierarchy in hierarchies:
+                add_rows(hierarchy, 0)
 
             columns = {
                 "Position": {"style": "dim", "width": 8},
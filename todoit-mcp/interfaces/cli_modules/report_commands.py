@@ -3,6 +3,7 @@ Report and analytics commands for TODOIT CLI
 Generate various reports for project management and troubleshooting
 """
 
+import json
 import re
 from typing import Optional
 
@@ -34,8 +35,13 @@ def report_group():
     "list_filter",
     help='Regex pattern to filter lists (e.g. "^\\d{4}_.*" for NNNN_*, ".*project.*" for containing "project")',
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Emit failed items as JSON Lines while they are read (one object per line)",
+)
 @click.pass_context
-def report_errors(ctx, list_filter):
+def report_errors(ctx, list_filter, stream):
     """Show all failed items from active lists with full details
 
     This command provides a centralized view of all items with 'failed' status
@@ -48,6 +54,7 @@ def report_errors(ctx, list_filter):
         todoit reports errors --filter "^\\d{4}_.*"     # Only NNNN_* lists
         todoit reports errors --filter ".*sprint.*"     # Lists containing "sprint"
         TODOIT_OUTPUT_FORMAT=json todoit reports errors # JSON output for scripts
+        todoit reports errors --stream                  # JSON Lines, streamed
     """
     manager = get_manager(ctx.obj["db_path"])
 
@@ -73,6 +80,13 @@ def report_errors(ctx, list_filter):
 
         force_tags = _get_force_tags()
 
+        if stream:
+            for item_info in manager.iter_failed_items(
+                list_filter=list_filter, tag_filter=force_tags if force_tags else None
+            ):
+                click.echo(json.dumps(item_info, default=str, ensure_ascii=False))
+            return
+
         # Get all failed items with filtering
         failed_items = manager.get_all_failed_items(
             list_filter=list_filter, tag_filter=force_tags if force_tags else None
@@ -0,0 +1,140 @@
+"""
+MCP Tool Dispatch for TODOIT
+Runs MCP tool bodies off the asyncio event loop: read-only tools on a bounded
+pool of worker threads, write tools one at a time on a single writer thread
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict
+
+DEFAULT_MAX_READERS = 4
+
+
+def resolve_max_readers() -> int:
+    """Read worker limit from TODOIT_MCP_MAX_WORKERS (0 = run tools inline)"""
+    value = os.getenv("TODOIT_MCP_MAX_WORKERS")
+    if value is None or value.strip() == "":
+        return DEFAULT_MAX_READERS
+    try:
+        return max(0, int(value))
+    except ValueError:
+        raise ValueError(
+            f"Invalid TODOIT_MCP_MAX_WORKERS '{value}': expected a non-negative integer"
+        )
+
+
+def run_coroutine_sync(coro: Coroutine) -> Any:
+    """Drive a coroutine that never suspends (a tool body) to completion.
+
+    Tool bodies are declared async for MCP but only call the synchronous
+    TodoManager, so they finish on the first step without an event loop.
+    """
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError("MCP tool body awaited; it cannot run on a worker thread")
+
+
+class ToolDispatcher:
+    """Dispatch tool calls to worker threads and record per-tool timings.
+
+    Read-only tools run concurrently on up to max_readers threads, each
+    database call opening its own pooled connection. Writes go through a
+    single writer thread, so they are serialized in submission order and never
+    compete with each other for SQLite's write lock. With max_readers=0 every
+    call runs inline on the event loop (the pre-dispatch behaviour).
+
+    Queue time is measured from submission until a worker starts the call,
+    execution time from start to finish.
+    """
+
+    def __init__(self, max_readers: int = DEFAULT_MAX_READERS):
+        self.max_readers = max_readers
+        self._read_pool = None
+        self._write_pool = None
+        if max_readers > 0:
+            self._read_pool = ThreadPoolExecutor(
+                max_workers=max_readers, thread_name_prefix="todoit-mcp-read"
+            )
+            self._write_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="todoit-mcp-write"
+            )
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+
+    async def run(
+        self, tool_name: str, read_only: bool, call: Callable[[], Any]
+    ) -> Any:
+        """Run call() for tool_name on the matching pool and return its result"""
+        submitted = time.perf_counter()
+
+        def timed_call():
+            started = time.perf_counter()
+            try:
+                return call()
+            finally:
+                self._record(
+                    tool_name, started - submitted, time.perf_counter() - started
+                )
+
+        if self._read_pool is None:
+            return timed_call()
+
+        pool = self._read_pool if read_only else self._write_pool
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, timed_call)
+
+    def _record(self, tool_name: str, queue_seconds: float, exec_seconds: float):
+        """Accumulate one call's queue and execution time"""
+        queue_ms = queue_seconds * 1000
+        exec_ms = exec_seconds * 1000
+        with self._stats_lock:
+            entry = self._stats.setdefault(
+                tool_name,
+                {
+                    "calls": 0,
+                    "queue_ms_total": 0.0,
+                    "queue_ms_max": 0.0,
+                    "exec_ms_total": 0.0,
+                    "exec_ms_max": 0.0,
+                },
+            )
+            entry["calls"] += 1
+            entry["queue_ms_total"] += queue_ms
+            entry["queue_ms_max"] = max(entry["queue_ms_max"], queue_ms)
+            entry["exec_ms_total"] += exec_ms
+            entry["exec_ms_max"] = max(entry["exec_ms_max"], exec_ms)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-tool call count and average/max queue and execution time (ms)"""
+        with self._stats_lock:
+            snapshot = {name: dict(entry) for name, entry in self._stats.items()}
+
+        result = {}
+        for name, entry in sorted(snapshot.items()):
+            calls = entry["calls"]
+            result[name] = {
+                "calls": calls,
+                "queue_ms_avg": round(entry["queue_ms_total"] / calls, 3),
+                "queue_ms_max": round(entry["queue_ms_max"], 3),
+                "exec_ms_avg": round(entry["exec_ms_total"] / calls, 3),
+                "exec_ms_max": round(entry["exec_ms_max"], 3),
+            }
+        return result
+
+    def reset_stats(self):
+        """Forget all recorded timings"""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def shutdown(self):
+        """Stop the worker threads after pending calls finish"""
+        for pool in (self._read_pool, self._write_pool):
+            if pool is not None:
+                pool.shutdown(wait=True)
@@ -3,6 +3,7 @@ TODOIT MCP Server
 MCP (Model Context Protocol) interface for TodoManager
 """
 
+import os
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -10,6 +11,11 @@ from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
 from core.manager import TodoManager
+from interfaces.mcp_dispatch import (
+    ToolDispatcher,
+    resolve_max_readers,
+    run_coroutine_sync,
+)
 from interfaces.mcp_tool_annotations import get_tool_annotations
 
 # Initialize FastMCP server
@@ -18,6 +24,10 @@ mcp = FastMCP("todoit-mcp")
 # Global manager instance
 manager = None
 
+# Tool bodies run off the event loop: reads on TODOIT_MCP_MAX_WORKERS threads,
+# writes serialized on one writer thread (0 workers = run inline)
+dispatcher = ToolDispatcher(resolve_max_readers())
+
 
 def init_manager(db_path: Optional[str] = None):
     """Initialize the TodoManager instance"""
@@ -28,6 +38,10 @@ def init_manager(db_path: Optional[str] = None):
             manager = TodoManager()
         else:
             manager = TodoManager(db_path)
+        if os.getenv("TODOIT_DEPENDENCY_INDEX", "").lower() in ("1", "true", "yes"):
+            manager.enable_dependency_index()
+        if os.getenv("TODOIT_KEY_CACHE", "").lower() in ("1", "true", "yes"):
+            manager.enable_key_cache()
     return manager
 
 
@@ -60,7 +74,13 @@ def _check_list_access(mgr, list_key: str, filter_tags: Optional[List[str]]) ->
 
 
 def mcp_error_handler(func: Callable) -> Callable:
-    """Decorator to handle MCP tool errors consistently."""
+    """Decorator to handle MCP tool errors consistently.
+
+    The tool body is dispatched to a worker thread (reads to the reader pool,
+    writes to the single writer) so it does not block other tool calls.
+    """
+    tool_name = func.__name__
+    read_only = get_tool_annotations(tool_name).get("readOnlyHint", False)
 
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Dict[str, Any]:
@@ -70,7 +90,11 @@ def mcp_error_handler(func: Callable) -> Callable:
             # Remove mgr from kwargs to avoid conflicts
             kwargs.pop("mgr", None)
             # Call the function with manager available in local scope
-            return await func(*args, mgr=mgr, **kwargs)
+            return await dispatcher.run(
+                tool_name,
+                read_only,
+                lambda: run_coroutine_sync(func(*args, mgr=mgr, **kwargs)),
+            )
         except ValueError as e:
             return {"success": False, "error": str(e), "error_type": "validation"}
         except Exception as e:
@@ -79,6 +103,36 @@ def mcp_error_handler(func: Callable) -> Callable:
     return wrapper
 
 
+def group_item_properties(properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Group get_all_items_properties rows by item_key with subitems nested."""
+    grouped_data = {}
+    for prop in properties:
+        item_key = prop["item_key"]
+        parent_item_key = prop.get("parent_item_key")
+
+        # Skip placeholder entries (like CLI JSON does)
+        if prop["property_key"] == "—":
+            continue
+
+        if parent_item_key:
+            # This is a subitem
+            if parent_item_key not in grouped_data:
+                grouped_data[parent_item_key] = {"properties": {}, "subitems": {}}
+            if item_key not in grouped_data[parent_item_key]["subitems"]:
+                grouped_data[parent_item_key]["subitems"][item_key] = {}
+            grouped_data[parent_item_key]["subitems"][item_key][
+                prop["property_key"]
+            ] = prop["property_value"]
+        else:
+            # This is a main item
+            if item_key not in grouped_data:
+                grouped_data[item_key] = {"properties": {}, "subitems": {}}
+            grouped_data[item_key]["properties"][prop["property_key"]] = prop[
+                "property_value"
+            ]
+    return grouped_data
+
+
 def map_item_content_to_title(item_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Map content field to title in item dictionary for consistent API."""
     if "content" in item_dict:
@@ -192,13 +246,31 @@ def paginate_results(
 
     return {
         "items": paginated,
-        "pagination": {
-            "limit": limit,
-            "offset": offset,
-            "total": total,
-            "has_more": offset + limit < total,
-            "next_offset": offset + limit if offset + limit < total else None,
-        },
+        "pagination": pagination_metadata(limit, offset, total),
+    }
+
+
+def pagination_metadata(limit: int, offset: int, total: int) -> Dict[str, Any]:
+    """
+    Build pagination metadata for a page whose total is already known.
+
+    Used by tools that paginate in the database instead of slicing a full
+    result list with paginate_results().
+
+    Args:
+        limit: Maximum number of items on the page
+        offset: Number of items skipped
+        total: Total number of matching items
+
+    Returns:
+        Dict with limit, offset, total, has_more, next_offset
+    """
+    return {
+        "limit": limit,
+        "offset": offset,
+        "total": total,
+        "has_more": offset + limit < total,
+        "next_offset": offset + limit if offset + limit < total else None,
     }
 
 
@@ -600,36 +672,32 @@ async def todo_list_all(
         Dictionary with success, lists, count, total, and pagination metadata
         (limit, offset, total, has_more, next_offset)
     """
-    # Get ALL lists first (we'll paginate in-memory for now)
-    # TODO: Future optimization - push pagination to database layer
-    all_lists = mgr.list_all(
-        limit=None, include_archived=include_archived, filter_tags=filter_tags
+    # Pagination, progress and tags are resolved in the database for this page only
+    page = mgr.list_all_page(
+        limit=limit,
+        offset=offset,
+        include_archived=include_archived,
+        filter_tags=filter_tags,
     )
+    total = page["total"]
 
     # Enhance each list with progress statistics and tag information
     enhanced_lists = []
-    for todo_list in all_lists:
+    for todo_list in page["lists"]:
         list_data = clean_to_dict_result(todo_list.to_dict(), "list")
-
-        # Add progress statistics
-        progress = mgr.get_progress(todo_list.list_key)
-        list_data["progress"] = progress.to_dict()
-
-        # Add tags information
-        tags = mgr.get_tags_for_list(todo_list.list_key)
-        list_data["tags"] = [clean_to_dict_result(tag.to_dict(), "tag") for tag in tags]
-
+        list_data["progress"] = page["progress"][todo_list.list_key].to_dict()
+        list_data["tags"] = [
+            clean_to_dict_result(tag.to_dict(), "tag")
+            for tag in page["tags"][todo_list.list_key]
+        ]
         enhanced_lists.append(list_data)
 
-    # Apply pagination
-    paginated = paginate_results(enhanced_lists, limit=limit, offset=offset)
-
     response = {
         "success": True,
-        "lists": paginated["items"],
-        "pagination": paginated["pagination"],
-        "count": len(paginated["items"]),  # Count of returned items
-        "total": paginated["pagination"]["total"],  # Total available items
+        "lists": enhanced_lists,
+        "pagination": pagination_metadata(limit, offset, total),
+        "count": len(enhanced_lists),  # Count of returned items
+        "total": total,  # Total available items
     }
 
     # Add filtering metadata if tags were used
@@ -719,6 +787,60 @@ async def todo_add_item(
         }
 
 
+@conditional_tool
+@mcp_error_handler
+async def todo_add_items_bulk(
+    list_key: str,
+    items: List[Dict[str, Any]],
+    parent_key: Optional[str] = None,
+    filter_tags: Optional[List[str]] = None,
+    mgr=None,
+) -> Dict[str, Any]:
+    """Add a tree of items with subitems, properties and dependencies in one transaction.
+
+    Args:
+        list_key: Key of the list to add items to (required)
+        items: Item specs, each {"item_key": ..., "title": ...} with optional
+               "metadata" (dict), "properties" (dict of key -> value),
+               "dependencies" (required items as "item_key" or "list_key:item_key";
+               items from the same call can be referenced) and "subitems"
+               (nested item specs)
+        parent_key: Optional existing item to add the top-level items under as subitems
+        filter_tags: Optional list of tag names to filter by (list must have ANY of these tags)
+
+    Returns:
+        Dictionary with success status, count and keys of the created items
+
+    Examples:
+        await todo_add_items_bulk("project", [
+            {"item_key": "scene_01", "title": "Scene 1",
+             "properties": {"priority": "high"},
+             "subitems": [{"item_key": "image", "title": "Generate image"}]},
+            {"item_key": "scene_02", "title": "Scene 2", "dependencies": ["scene_01"]},
+        ])
+
+    Note:
+        All items are added or none: a duplicate key, unknown dependency or
+        circular dependency fails the whole batch.
+    """
+    if not mgr.get_list(list_key):
+        return {"success": False, "error": f"List '{list_key}' not found"}
+
+    if not _check_list_access(mgr, list_key, filter_tags):
+        return {
+            "success": False,
+            "error": f"List '{list_key}' does not match tag filter",
+        }
+
+    created = mgr.add_items_bulk(list_key, items, parent_key=parent_key)
+    return {
+        "success": True,
+        "count": len(created),
+        "item_keys": [item.item_key for item in created],
+        "message": f"Added {len(created)} items to list '{list_key}'",
+    }
+
+
 @conditional_tool
 @mcp_error_handler
 async def todo_update_item_status(
@@ -788,6 +910,129 @@ async def todo_update_item_status(
     }
 
 
+@conditional_tool
+@mcp_error_handler
+async def todo_update_items_status_bulk(
+    list_key: str,
+    updates: List[Dict[str, str]],
+    filter_tags: Optional[List[str]] = None,
+    mgr=None,
+) -> Dict[str, Any]:
+    """Update the status of many items or subitems in one transaction.
+
+    Args:
+        list_key: Key of the list containing the items (required)
+        updates: List of updates, each {"item_key": ..., "status": ...} with
+                 optional "subitem_key". As in todo_update_item_status, item_key
+                 is the parent item key when subitem_key is given.
+                 Valid statuses: pending, in_progress, completed, failed
+        filter_tags: Optional list of tag names to filter by (list must have ANY of these tags)
+
+    Returns:
+        Dictionary with success status, updated items and count
+
+    Examples:
+        await todo_update_items_status_bulk("project", [
+            {"item_key": "feature1", "status": "completed"},
+            {"item_key": "feature2", "subitem_key": "step1", "status": "completed"},
+        ])
+
+    Note:
+        All updates are applied or none: an unknown item, invalid status or item
+        with subtasks fails the whole batch.
+    """
+    if not mgr.get_list(list_key):
+        return {"success": False, "error": f"List '{list_key}' not found"}
+
+    if not _check_list_access(mgr, list_key, filter_tags):
+        return {
+            "success": False,
+            "error": f"List '{list_key}' does not match tag filter",
+        }
+
+    bulk_updates = []
+    for entry in updates:
+        if not entry.get("item_key") or not entry.get("status"):
+            raise ValueError("Each update requires 'item_key' and 'status'")
+        if entry.get("subitem_key"):
+            bulk_updates.append(
+                (entry["subitem_key"], entry["item_key"], entry["status"])
+            )
+        else:
+            bulk_updates.append((entry["item_key"], None, entry["status"]))
+
+    items = mgr.update_items_status_bulk(list_key, bulk_updates)
+    return {
+        "success": True,
+        "items": [
+            map_item_content_to_title(clean_to_dict_result(item.to_dict(), "item"))
+            for item in items
+        ],
+        "count": len(items),
+        "message": f"Updated status of {len(items)} items",
+    }
+
+
+@conditional_tool
+@mcp_error_handler
+async def todo_claim_next(
+    list_key: str,
+    worker_id: str,
+    lease_seconds: int = 900,
+    count: int = 1,
+    smart_subtasks: bool = False,
+    filter_tags: Optional[List[str]] = None,
+    mgr=None,
+) -> Dict[str, Any]:
+    """Atomically claim the next pending item(s) for a worker agent.
+
+    Use this instead of todo_get_next_pending + todo_update_item_status when
+    several agents work on the same list: selection and the switch to
+    in_progress happen in one transaction, so no two workers get the same item.
+
+    Args:
+        list_key: Key of the list to claim items from (required)
+        worker_id: Identifier of the claiming worker (required)
+        lease_seconds: Lease length; once expired, unfinished items return to pending
+        count: Maximum number of items to claim in this call
+        smart_subtasks: Use smart subtask selection (subitems before parents)
+        filter_tags: Optional list of tag names to filter by (list must have ANY of these tags)
+
+    Returns:
+        Dictionary with success status, claimed items (possibly empty), count and lease expiry
+    """
+    if not mgr.get_list(list_key):
+        return {"success": False, "error": f"List '{list_key}' not found"}
+
+    if not _check_list_access(mgr, list_key, filter_tags):
+        return {
+            "success": False,
+            "error": f"List '{list_key}' does not match tag filter",
+        }
+
+    result = mgr.claim_next(
+        list_key,
+        worker_id,
+        lease_seconds=lease_seconds,
+        smart_subtasks=smart_subtasks,
+        count=count,
+    )
+    items = result["items"]
+    return {
+        "success": True,
+        "items": [
+            map_item_content_to_title(clean_to_dict_result(item.to_dict(), "item"))
+            for item in items
+        ],
+        "count": len(items),
+        "worker_id": worker_id,
+        "lease_expires_at": result["lease_expires_at"].isoformat(),
+        "message": (
+            f"Claimed {len(items)} items" if items else "No pending items available"
+        ),
+    }
+
+
 @conditional_tool
 @mcp_error_handler
 async def todo_get_next_pending(
@@ -1593,33 +1838,7 @@ async def todo_get_all_items_properties(
         return {"success": False, "error": f"List '{list_key}' does not match tag filter"}
     
     properties = mgr.get_all_items_properties(list_key, status, limit)
-
-    # Group properties by item_key with hierarchy support
-    grouped_data = {}
-    for prop in properties:
-        item_key = prop["item_key"]
-        parent_item_key = prop.get("parent_item_key")
-
-        # Skip placeholder entries (like CLI JSON does)
-        if prop["property_key"] == "—":
-            continue
-
-        if parent_item_key:
-            # This is a subitem
-            if parent_item_key not in grouped_data:
-                grouped_data[parent_item_key] = {"properties": {}, "subitems": {}}
-            if item_key not in grouped_data[parent_item_key]["subitems"]:
-                grouped_data[parent_item_key]["subitems"][item_key] = {}
-            grouped_data[parent_item_key]["subitems"][item_key][
-                prop["property_key"]
-            ] = prop["property_value"]
-        else:
-            # This is a main item
-            if item_key not in grouped_data:
-                grouped_data[item_key] = {"properties": {}, "subitems": {}}
-            grouped_data[item_key]["properties"][prop["property_key"]] = prop[
-                "property_value"
-            ]
+    grouped_data = group_item_properties(properties)
 
     return {"success": True, "properties": grouped_data, "count": len(grouped_data)}
 
@@ -2139,6 +2358,47 @@ async def todo_add_item_dependency(
     }
 
 
+@conditional_tool
+@mcp_error_handler
+async def todo_add_item_dependencies(
+    dependencies: List[Dict[str, Any]],
+    filter_tags: Optional[List[str]] = None,
+    mgr=None,
+) -> Dict[str, Any]:
+    """Add many dependencies between tasks in one transaction.
+
+    Args:
+        dependencies: List of dependencies, each {"dependent_list": ..., "dependent_item": ...,
+                      "required_list": ..., "required_item": ...} with optional
+                      "dependency_type" (blocks, requires, related) and "metadata"
+        filter_tags: Optional list of tag names to filter lists by
+
+    Returns:
+        Dictionary with success status, created dependencies and count
+
+    Note:
+        All dependencies are added or none: an unknown item, an existing dependency
+        or a circular loop anywhere in the batch fails the whole batch.
+    """
+    # Check access to every list involved
+    for dependency in dependencies:
+        for role in ("dependent", "required"):
+            list_key = dependency.get(f"{role}_list")
+            if list_key and not _check_list_access(mgr, list_key, filter_tags):
+                return {
+                    "success": False,
+                    "error": f"{role.capitalize()} list '{list_key}' does not match tag filter",
+                }
+
+    created = mgr.add_item_dependencies(dependencies)
+    return {
+        "success": True,
+        "dependencies": [dependency.to_dict() for dependency in created],
+        "count": len(created),
+        "message": f"Added {len(created)} dependencies",
+    }
+
+
 @conditional_tool
 @mcp_error_handler
 async def todo_remove_item_dependency(
@@ -2421,17 +2681,14 @@ async def todo_get_comprehensive_status(list_key: str, mgr=None) -> Dict[str, An
     # Get next task using Phase 3 smart algorithm
     next_task = mgr.get_next_pending_with_subtasks(list_key)
 
-    # Get items structure
-    items = mgr.get_list_items(list_key)
-
-    # Get all items and their blocking status
-    all_items = mgr.get_list_items(list_key)
+    # Items structure and blocking status of every item, from one item load
+    items, readiness = mgr.get_list_items_with_readiness(list_key)
     blocked_items = []
     available_items = []
 
-    for item in all_items:
+    for item in items:
         if item.status == "pending":
-            can_start_info = mgr.can_start_item(list_key, item.item_key)
+            can_start_info = readiness[item.id]
             if can_start_info["can_start"]:
                 available_items.append(
                     {
@@ -2455,26 +2712,12 @@ async def todo_get_comprehensive_status(list_key: str, mgr=None) -> Dict[str, An
                     }
                 )
 
-    # Get cross-list dependencies summary
-    db_list = mgr.db.get_list_by_key(list_key)
-    dependencies = mgr.db.get_all_dependencies_for_list(db_list.id) if db_list else []
-
-    dependency_summary = {
-        "total_dependencies": len(dependencies),
-        "as_dependent": 0,  # How many items in this list depend on others
-        "as_required": 0,  # How many items in this list block others
-    }
-
-    for dep in dependencies:
-        # Check if the dependent item is in this list
-        dependent_item = mgr.db.get_item_by_id(dep.dependent_item_id)
-        if dependent_item and dependent_item.list_id == db_list.id:
-            dependency_summary["as_dependent"] += 1
-
-        # Check if the required item is in this list
-        required_item = mgr.db.get_item_by_id(dep.required_item_id)
-        if required_item and required_item.list_id == db_list.id:
-            dependency_summary["as_required"] += 1
+    # Get cross-list dependencies summary (a list without items has none)
+    dependency_summary = (
+        mgr.db.get_dependency_summary_for_list(items[0].list_id)
+        if items
+        else {"total_dependencies": 0, "as_dependent": 0, "as_required": 0}
+    )
 
     return {
         "success": True,
@@ -2706,6 +2949,35 @@ async def todo_get_schema_info(mgr=None) -> Dict[str, Any]:
     }
 
 
+@conditional_tool
+@mcp_error_handler
+async def todo_tool_stats(reset: bool = False, mgr=None) -> Dict[str, Any]:
+    """Get per-tool call counts with queue and execution times of this server.
+
+    Args:
+        reset: Clear the collected timings after reading them (default: False)
+
+    Returns:
+        Dictionary with success status, worker limit, per-tool timings
+        (calls, queue_ms_avg, queue_ms_max, exec_ms_avg, exec_ms_max) and
+        key cache counters (None when TODOIT_KEY_CACHE is off)
+    """
+    tools = dispatcher.stats()
+    key_cache = mgr.db.key_cache
+    key_cache_stats = key_cache.stats() if key_cache is not None else None
+    if reset:
+        dispatcher.reset_stats()
+        if key_cache is not None:
+            key_cache.reset_stats()
+    return {
+        "success": True,
+        "max_workers": dispatcher.max_readers,
+        "tools": tools,
+        "count": len(tools),
+        "key_cache": key_cache_stats,
+    }
+
+
 # ===== LIST TAG MANAGEMENT MCP TOOLS =====
 
 
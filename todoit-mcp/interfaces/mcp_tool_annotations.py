@@ -1,6 +1,6 @@
 """
 MCP Tool Annotations for TODOIT
-Defines MCP protocol annotations for all 51 tools
+Defines MCP protocol annotations for all 56 tools
 """
 
 from typing import Dict
@@ -148,6 +148,10 @@ TOOL_ANNOTATIONS: Dict[str, Dict[str, bool]] = {
         "idempotentHint": True,
         "destructiveHint": False,
     },
+    "todo_add_items_bulk": {
+        "idempotentHint": False,  # Repeating the batch fails on existing item keys
+        "destructiveHint": False,
+    },
     "todo_quick_add": {
         "idempotentHint": True,
         "destructiveHint": False,
@@ -158,6 +162,14 @@ TOOL_ANNOTATIONS: Dict[str, Dict[str, bool]] = {
         "idempotentHint": True,
         "destructiveHint": False,  # Changing status is not destructive
     },
+    "todo_update_items_status_bulk": {
+        "idempotentHint": True,
+        "destructiveHint": False,
+    },
+    "todo_claim_next": {
+        "idempotentHint": False,  # Every call claims different items
+        "destructiveHint": False,
+    },
 
     # Property operations (upsert pattern - idempotent)
     "todo_set_list_property": {
@@ -184,7 +196,16 @@ TOOL_ANNOTATIONS: Dict[str, Dict[str, bool]] = {
         "idempotentHint": True,
         "destructiveHint": False,
     },
+    "todo_add_item_dependencies": {
+        "idempotentHint": False,  # Repeating the batch fails on existing dependencies
+        "destructiveHint": False,
+    },
 
+    # Server statistics
+    "todo_tool_stats": {
+        "idempotentHint": False,  # reset=True clears the collected timings
+        "destructiveHint": False,
+    },
     # Import/Export (idempotent operations)
     "todo_import_from_markdown": {
         "idempotentHint": True,
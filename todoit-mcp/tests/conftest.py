@@ -4,9 +4,11 @@ Pytest configuration and fixtures for TODOIT MCP tests
 
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
+from sqlalchemy import event
 
 from core.database import Database
 from core.manager import TodoManager
@@ -48,6 +50,30 @@ def manager(temp_db):
     return TodoManager(temp_db)
 
 
+@pytest.fixture
+def capture_sql(manager):
+    """Collect the SQL statements run through the manager's engine
+
+    Usage: ``with capture_sql() as statements: ...``; statements is the list
+    of executed SQL strings, so len(statements) is the query count.
+    """
+
+    @contextmanager
+    def capture():
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(manager.db.engine, "before_cursor_execute", before_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(manager.db.engine, "before_cursor_execute", before_execute)
+
+    return capture
+
+
 @pytest.fixture
 def sample_list(manager):
     """Create sample list with items for testing"""
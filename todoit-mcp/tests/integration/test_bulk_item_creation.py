@@ -0,0 +1,207 @@
+"""
+Integration tests for bulk item creation
+Tests add_items_bulk, the MCP tool and `todoit item add --from-file`
+"""
+
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from core.manager import TodoManager
+from interfaces.cli import cli
+from interfaces.mcp_server import todo_add_items_bulk
+
+
+def make_tree(count):
+    """Item specs with two subitems and a property each"""
+    return [
+        {
+            "item_key": f"scene_{i}",
+            "content": f"Scene {i}",
+            "properties": {"priority": "high"},
+            "subitems": [
+                {"item_key": "image", "content": "Image"},
+                {"item_key": "video", "content": "Video"},
+            ],
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+class TestAddItemsBulk:
+    """Test TodoManager.add_items_bulk"""
+
+    def test_creates_tree_with_properties_and_dependencies(self, manager):
+        """Hierarchy, positions, properties, dependencies and history are created"""
+        manager.create_list("bulk", "Bulk", items=["Existing"])
+        manager.create_list("other", "Other", items=["Other task"])
+
+        items = manager.add_items_bulk(
+            "bulk",
+            [
+                {
+                    "item_key": "build",
+                    "content": "Build",
+                    "metadata": {"owner": "ci"},
+                    "properties": {"priority": "high"},
+                    "subitems": [
+                        {
+                            "item_key": "compile",
+                            "title": "Compile",
+                            "subitems": [{"item_key": "link", "content": "Link"}],
+                        },
+                        {
+                            "item_key": "test",
+                            "content": "Test",
+                            "dependencies": ["compile"],
+                        },
+                    ],
+                },
+                {
+                    "item_key": "deploy",
+                    "content": "Deploy",
+                    "dependencies": ["build", "other:item_1"],
+                },
+            ],
+        )
+
+        assert [item.item_key for item in items] == [
+            "build",
+            "compile",
+            "link",
+            "test",
+            "deploy",
+        ]
+        assert [item.position for item in items] == [2, 1, 1, 2, 3]
+        assert items[1].parent_item_id == items[0].id
+        assert items[2].parent_item_id == items[1].id
+        assert items[0].metadata == {"owner": "ci"}
+
+        assert manager.get_item_properties("bulk", "build") == {"priority": "high"}
+        assert manager.is_item_blocked("bulk", "deploy")
+        blockers = manager.get_item_blockers("bulk", "deploy")
+        assert {blocker.item_key for blocker in blockers} == {"build", "item_1"}
+
+        assert manager.get_item_history("bulk", "build")[0].action == "created"
+        assert manager.db.get_item_history(items[2].id)[0].new_value == {
+            "parent_key": "compile",
+            "subitem_key": "link",
+            "content": "Link",
+        }
+
+    def test_adds_under_existing_parent_and_syncs_status(self, manager):
+        """parent_key attaches the tree and re-synchronizes the parent"""
+        manager.create_list("bulk", "Bulk", items=["Parent"])
+        manager.add_subitem("bulk", "item_1", "done", "Done")
+        manager.update_item_status(
+            "bulk", "done", "completed", parent_item_key="item_1"
+        )
+        assert manager.get_item("bulk", "item_1").status == "completed"
+
+        items = manager.add_items_bulk(
+            "bulk", [{"item_key": "new", "content": "New"}], parent_key="item_1"
+        )
+
+        assert items[0].position == 2
+        assert manager.get_item("bulk", "item_1").status == "in_progress"
+
+    def test_invalid_input_rolls_back_batch(self, manager):
+        """Duplicates, unknown dependencies and cycles fail the whole batch"""
+        manager.create_list("bulk", "Bulk", items=["Existing"])
+
+        with pytest.raises(ValueError, match="already exists"):
+            manager.add_items_bulk(
+                "bulk",
+                [
+                    {"item_key": "a", "content": "A"},
+                    {"item_key": "item_1", "content": "X"},
+                ],
+            )
+        with pytest.raises(ValueError, match="duplicated"):
+            manager.add_items_bulk(
+                "bulk",
+                [{"item_key": "a", "content": "A"}, {"item_key": "a", "content": "A"}],
+            )
+        with pytest.raises(ValueError, match="not found"):
+            manager.add_items_bulk(
+                "bulk", [{"item_key": "a", "content": "A", "dependencies": ["missing"]}]
+            )
+        with pytest.raises(ValueError, match="circular"):
+            manager.add_items_bulk(
+                "bulk",
+                [
+                    {"item_key": "a", "content": "A", "dependencies": ["b"]},
+                    {"item_key": "b", "content": "B", "dependencies": ["a"]},
+                ],
+            )
+
+        assert [item.item_key for item in manager.get_list_items("bulk")] == ["item_1"]
+
+    def test_statement_count_independent_of_tree_size(self, manager, capture_sql):
+        """Query count depends on tree depth, not on the number of items"""
+        manager.create_list("small", "Small")
+        manager.create_list("large", "Large")
+
+        with capture_sql() as small:
+            manager.add_items_bulk("small", make_tree(1))
+        with capture_sql() as large:
+            large_items = manager.add_items_bulk("large", make_tree(200))
+
+        assert len(large_items) == 600
+        assert len(large) == len(small)
+
+    @pytest.mark.asyncio
+    async def test_mcp_tool(self, manager):
+        """MCP tool accepts title like todo_add_item"""
+        manager.create_list("bulk", "Bulk")
+        with patch("interfaces.mcp_server.init_manager", return_value=manager):
+            result = await todo_add_items_bulk(
+                "bulk",
+                [
+                    {
+                        "item_key": "a",
+                        "title": "A",
+                        "subitems": [{"item_key": "b", "title": "B"}],
+                    }
+                ],
+            )
+            invalid = await todo_add_items_bulk("bulk", [{"item_key": "c"}])
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["item_keys"] == ["a", "b"]
+        assert manager.get_item("bulk", "b", "a").content == "B"
+        assert invalid["success"] is False
+
+    def test_cli_from_file(self):
+        """`item add --from-file` creates the whole tree in one call"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "cli.db")
+            manager = TodoManager(db_path)
+            manager.create_list("cli", "CLI")
+
+            items_path = os.path.join(tmp_dir, "items.json")
+            with open(items_path, "w") as f:
+                json.dump({"items": make_tree(3)}, f)
+
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "--db-path",
+                    db_path,
+                    "item",
+                    "add",
+                    "--list",
+                    "cli",
+                    "--from-file",
+                    items_path,
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "Added 9 items" in result.output
+            assert len(manager.get_list_items("cli")) == 9
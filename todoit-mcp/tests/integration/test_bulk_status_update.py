@@ -0,0 +1,165 @@
+"""
+Integration tests for batched status updates
+Tests update_items_status_bulk, the MCP tool and `todoit item status --from-file`
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import text
+
+from core.manager import TodoManager
+from interfaces.cli import cli
+from interfaces.mcp_server import todo_update_items_status_bulk
+
+
+@pytest.fixture
+def bulk_manager(manager):
+    """Manager with a list of items, subitems and a nested subitem"""
+    manager.create_list("bulk", "Bulk", items=[f"Task {i}" for i in range(1, 6)])
+    for parent in ["item_1", "item_2"]:
+        for step in ["s1", "s2"]:
+            manager.add_subitem("bulk", parent, step, f"{parent} {step}")
+    manager.add_subitem("bulk", "s1", "deep", "Nested under item_1/s1")
+    return manager
+
+
+class TestBulkStatusUpdate:
+    """Test TodoManager.update_items_status_bulk"""
+
+    def test_updates_items_parents_and_history(self, bulk_manager):
+        """Items are updated, parents synced through all levels, history written"""
+        items = bulk_manager.update_items_status_bulk(
+            "bulk",
+            [
+                ("deep", "s1", "completed"),
+                ("s2", "item_1", "completed"),
+                ("s1", "item_2", "in_progress"),
+                ("item_3", None, "failed"),
+            ],
+        )
+
+        assert [item.item_key for item in items] == ["deep", "s2", "s1", "item_3"]
+        assert items[0].completed_at is not None
+        assert items[2].started_at is not None
+
+        # deep -> item_1/s1 completed -> item_1 completed (all children done)
+        assert bulk_manager.get_item("bulk", "s1", "item_1").status == "completed"
+        assert bulk_manager.get_item("bulk", "item_1").status == "completed"
+        assert bulk_manager.get_item("bulk", "item_2").status == "in_progress"
+        assert bulk_manager.get_item("bulk", "item_4").status == "pending"
+
+        history = bulk_manager.get_item_history("bulk", "item_3")
+        assert history[0].action == "status_updated"
+        assert history[0].new_value == {"status": "failed"}
+
+    def test_invalid_update_rolls_back_batch(self, bulk_manager):
+        """A missing item, invalid status or parent item fails the whole batch"""
+        with pytest.raises(ValueError, match="not found"):
+            bulk_manager.update_items_status_bulk(
+                "bulk", [("item_3", None, "completed"), ("missing", None, "completed")]
+            )
+        with pytest.raises(ValueError, match="Invalid status"):
+            bulk_manager.update_items_status_bulk("bulk", [("item_3", None, "done")])
+        with pytest.raises(ValueError, match="has subtasks"):
+            bulk_manager.update_items_status_bulk(
+                "bulk", [("item_3", None, "completed"), ("item_1", None, "completed")]
+            )
+
+        assert bulk_manager.get_item("bulk", "item_3").status == "pending"
+
+    def test_statement_count_independent_of_batch_size(self, bulk_manager, capture_sql):
+        """Query count does not grow with the number of updated items"""
+        with capture_sql() as small:
+            bulk_manager.update_items_status_bulk(
+                "bulk", [("item_3", None, "completed")]
+            )
+        with capture_sql() as large:
+            bulk_manager.update_items_status_bulk(
+                "bulk", [(f"item_{i}", None, "in_progress") for i in (3, 4, 5)]
+            )
+
+        assert len(large) == len(small)
+
+    def test_parent_derived_once_per_batch(self, bulk_manager):
+        """Siblings updated together re-derive their parent a single time"""
+        with bulk_manager.db.get_session() as session:
+            session.execute(text("CREATE TABLE parent_writes (status TEXT)"))
+            session.execute(
+                text(
+                    "CREATE TRIGGER count_parent_writes "
+                    "AFTER UPDATE OF status ON todo_items "
+                    "WHEN NEW.item_key = 'item_2' "
+                    "BEGIN INSERT INTO parent_writes VALUES (NEW.status); END"
+                )
+            )
+            session.commit()
+
+        bulk_manager.update_items_status_bulk(
+            "bulk", [("s1", "item_2", "completed"), ("s2", "item_2", "completed")]
+        )
+
+        with bulk_manager.db.get_session() as session:
+            writes = session.execute(text("SELECT status FROM parent_writes")).all()
+            deferrals = session.execute(
+                text("SELECT COUNT(*) FROM parent_status_deferrals")
+            ).scalar()
+        # One at a time the parent would pass through in_progress first
+        assert [row.status for row in writes] == ["completed"]
+        assert deferrals == 0
+
+    @pytest.mark.asyncio
+    async def test_mcp_tool(self, bulk_manager):
+        """MCP tool maps item_key/subitem_key like todo_update_item_status"""
+        with patch("interfaces.mcp_server.init_manager", return_value=bulk_manager):
+            result = await todo_update_items_status_bulk(
+                "bulk",
+                [
+                    {"item_key": "item_2", "subitem_key": "s1", "status": "completed"},
+                    {"item_key": "item_4", "status": "completed"},
+                ],
+            )
+            invalid = await todo_update_items_status_bulk("bulk", [{"item_key": "x"}])
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["items"][0]["title"] == "item_2 s1"
+        assert bulk_manager.get_item("bulk", "item_2").status == "in_progress"
+        assert invalid["success"] is False
+        assert invalid["error_type"] == "validation"
+
+    def test_cli_from_file(self):
+        """`item status --from-file` applies every line in one call"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "cli.db")
+            manager = TodoManager(db_path)
+            manager.create_list("cli", "CLI", items=["A", "B"])
+            manager.add_subitem("cli", "item_1", "step", "Step")
+
+            updates_path = os.path.join(tmp_dir, "statuses.txt")
+            with open(updates_path, "w") as f:
+                f.write(
+                    "# item [subitem] status\nitem_1 step completed\nitem_2 failed\n"
+                )
+
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "--db-path",
+                    db_path,
+                    "item",
+                    "status",
+                    "--list",
+                    "cli",
+                    "--from-file",
+                    updates_path,
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "Updated status of 2 items" in result.output
+            assert manager.get_item("cli", "item_1").status == "completed"
+            assert manager.get_item("cli", "item_2").status == "failed"
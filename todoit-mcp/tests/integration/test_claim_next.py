@@ -0,0 +1,199 @@
+"""
+Integration tests for claiming items with leases
+Tests claim_next, release_expired_leases, the MCP tool and `todoit item claim`
+"""
+
+import os
+import tempfile
+import threading
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from core.database import ItemLeaseDB, utc_now
+from core.manager import TodoManager
+from interfaces.cli import cli
+from interfaces.mcp_server import todo_claim_next
+
+
+def expire_leases(manager):
+    """Move every lease expiry into the past"""
+    with manager.db.get_session() as session:
+        session.query(ItemLeaseDB).update(
+            {"lease_expires_at": utc_now() - timedelta(seconds=1)}
+        )
+        session.commit()
+
+
+class TestClaimNext:
+    """Test TodoManager.claim_next and lease expiry"""
+
+    def test_claims_marks_and_leases_items(self, manager):
+        """Claimed items are in progress, leased and recorded in history"""
+        manager.create_list("work", "Work", items=["A", "B", "C"])
+
+        result = manager.claim_next("work", "agent-1", lease_seconds=60, count=2)
+
+        assert [item.item_key for item in result["items"]] == ["item_1", "item_2"]
+        assert all(item.status == "in_progress" for item in result["items"])
+        assert result["lease_expires_at"] > utc_now()
+        leases = manager.db.get_item_leases([item.id for item in result["items"]])
+        assert {lease.worker_id for lease in leases.values()} == {"agent-1"}
+        history = manager.get_item_history("work", "item_1")
+        assert history[0].action == "claimed"
+
+        second = manager.claim_next("work", "agent-2", count=5)
+        assert [item.item_key for item in second["items"]] == ["item_3"]
+        assert manager.claim_next("work", "agent-3")["items"] == []
+
+    def test_respects_subitems_and_dependencies(self, manager):
+        """Parents are never claimed; their subitems are claimed instead"""
+        manager.create_list("work", "Work", items=["Parent", "Blocked", "Free"])
+        manager.create_list("other", "Other", items=["Required"])
+        manager.add_subitem("work", "item_1", "sub", "Subitem")
+        manager.add_item_dependency("work", "item_2", "other", "item_1")
+
+        plain = manager.claim_next("work", "agent-1", count=3)
+        assert [item.item_key for item in plain["items"]] == ["sub", "item_3"]
+        assert manager.get_item("work", "item_1").status == "in_progress"
+
+    def test_smart_mode_claims_subitems(self, manager):
+        """Smart mode claims subitems before moving on"""
+        manager.create_list("work", "Work", items=["Parent", "Free"])
+        manager.add_subitem("work", "item_1", "sub", "Subitem")
+
+        smart = manager.claim_next("work", "agent-1", smart_subtasks=True)
+        assert [item.item_key for item in smart["items"]] == ["sub"]
+
+    def test_default_mode_claims_from_hierarchical_list(self, manager):
+        """Subitems of a pending parent are claimable, in parent order"""
+        manager.create_list("L", "Hierarchy", items=["Parent", "Other"])
+        manager.add_subitem("L", "item_1", "s1", "Sub 1")
+        manager.add_subitem("L", "item_1", "s2", "Sub 2")
+        assert manager.get_next_pending("L").item_key == "item_1"
+
+        result = manager.claim_next("L", "w1", count=2)
+        assert [item.item_key for item in result["items"]] == ["s1", "s2"]
+        assert manager.claim_next("L", "w2")["items"][0].item_key == "item_2"
+
+    def test_default_mode_skips_blocked_and_failed_parents(self, manager):
+        """Subitems wait for a parent's requirements and stop under a failed parent"""
+        manager.create_list("L", "Hierarchy", items=["Blocked", "Failing", "Free"])
+        manager.create_list("other", "Other", items=["Required"])
+        manager.add_subitem("L", "item_1", "s1", "Sub 1")
+        manager.add_subitem("L", "item_2", "s2", "Sub 2")
+        manager.add_subitem("L", "item_2", "s3", "Sub 3")
+        manager.add_item_dependency("L", "item_1", "other", "item_1")
+        manager.update_item_status("L", "s2", "failed", parent_item_key="item_2")
+
+        result = manager.claim_next("L", "w1", count=5)
+        assert [item.item_key for item in result["items"]] == ["item_3"]
+
+        manager.update_item_status("other", "item_1", "completed")
+        assert manager.claim_next("L", "w1")["items"][0].item_key == "s1"
+
+    def test_expired_leases_return_to_pending(self, manager):
+        """Sweeping releases unfinished items and drops finished leases"""
+        manager.create_list("work", "Work", items=["A", "B"])
+        manager.claim_next("work", "agent-1", count=2)
+        manager.update_item_status("work", "item_2", "completed")
+        expire_leases(manager)
+
+        released = manager.release_expired_leases()
+
+        assert [item.item_key for item in released] == ["item_1"]
+        assert manager.get_item("work", "item_1").status == "pending"
+        assert manager.get_item("work", "item_2").status == "completed"
+        assert manager.db.get_item_leases([item.id for item in released]) == {}
+        assert manager.get_item_history("work", "item_1")[0].action == "lease_expired"
+
+        # The next claim picks the released item up again
+        result = manager.claim_next("work", "agent-2")
+        assert [item.item_key for item in result["items"]] == ["item_1"]
+
+    def test_concurrent_workers_never_share_items(self, temp_db):
+        """Workers on separate connections claim disjoint items"""
+        TodoManager(temp_db).create_list(
+            "work", "Work", items=[f"Task {i}" for i in range(40)]
+        )
+        claimed = {}
+        errors = []
+
+        def worker(worker_id):
+            worker_manager = TodoManager(temp_db)
+            keys = []
+            try:
+                while True:
+                    items = worker_manager.claim_next("work", worker_id)["items"]
+                    if not items:
+                        break
+                    keys.extend(item.item_key for item in items)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+            claimed[worker_id] = keys
+
+        threads = [
+            threading.Thread(target=worker, args=(f"agent-{i}",)) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        all_keys = [key for keys in claimed.values() for key in keys]
+        assert len(all_keys) == 40
+        assert len(set(all_keys)) == 40
+
+    def test_invalid_arguments(self, manager):
+        """Missing list and bad arguments raise ValueError"""
+        manager.create_list("work", "Work", items=["A"])
+        with pytest.raises(ValueError, match="does not exist"):
+            manager.claim_next("missing", "agent-1")
+        with pytest.raises(ValueError, match="worker_id"):
+            manager.claim_next("work", "")
+        with pytest.raises(ValueError, match="count"):
+            manager.claim_next("work", "agent-1", count=0)
+
+    @pytest.mark.asyncio
+    async def test_mcp_tool(self, manager):
+        """MCP tool returns claimed items and lease expiry"""
+        manager.create_list("work", "Work", items=["A", "B"])
+        with patch("interfaces.mcp_server.init_manager", return_value=manager):
+            result = await todo_claim_next("work", "agent-1", count=2)
+            empty = await todo_claim_next("work", "agent-1")
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert [item["item_key"] for item in result["items"]] == ["item_1", "item_2"]
+        assert result["lease_expires_at"]
+        assert empty["success"] is True
+        assert empty["items"] == []
+
+    def test_cli_claim(self):
+        """`item claim` claims items for the given worker"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "cli.db")
+            manager = TodoManager(db_path)
+            manager.create_list("cli", "CLI", items=["A", "B"])
+
+            result = CliRunner().invoke(
+                cli,
+                [
+                    "--db-path",
+                    db_path,
+                    "item",
+                    "claim",
+                    "--list",
+                    "cli",
+                    "--worker",
+                    "agent-1",
+                ],
+            )
+
+            assert result.exit_code == 0
+            assert "agent-1" in result.output
+            assert manager.get_item("cli", "item_1").status == "in_progress"
+            assert manager.get_item("cli", "item_2").status == "pending"
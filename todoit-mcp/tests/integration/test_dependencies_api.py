@@ -191,3 +191,185 @@ class TestDependenciesAPI:
 
         # Verify it returns a dictionary (actual structure may vary)
         assert isinstance(graph, dict)
+
+    def test_long_dependency_chain_cycle_check(self, manager):
+        """Cycle check walks long chains without recursion or a query per item"""
+        manager.create_list(
+            "chain", "Chain", items=[f"Step {i}" for i in range(1, 1501)]
+        )
+        manager.add_item_dependencies(
+            [
+                {
+                    "dependent_list": "chain",
+                    "dependent_item": f"item_{i + 1}",
+                    "required_list": "chain",
+                    "required_item": f"item_{i}",
+                }
+                for i in range(1, 1500)
+            ]
+        )
+
+        with pytest.raises(ValueError, match="circular"):
+            manager.add_item_dependency("chain", "item_1", "chain", "item_1500")
+
+    def test_add_item_dependencies_bulk(self, manager, sample_lists):
+        """Bulk dependencies are added together and validated as one graph"""
+        created = manager.add_item_dependencies(
+            [
+                {
+                    "dependent_list": "frontend",
+                    "dependent_item": "item_1",
+                    "required_list": "backend",
+                    "required_item": "item_1",
+                },
+                {
+                    "dependent_list": "frontend",
+                    "dependent_item": "item_2",
+                    "required_list": "frontend",
+                    "required_item": "item_1",
+                    "dependency_type": "related",
+                },
+            ]
+        )
+
+        assert [dep.dependency_type for dep in created] == ["blocks", "related"]
+        assert manager.is_item_blocked("frontend", "item_1")
+
+        # Loop formed only by combining the batch with existing dependencies
+        with pytest.raises(ValueError, match="circular"):
+            manager.add_item_dependencies(
+                [
+                    {
+                        "dependent_list": "backend",
+                        "dependent_item": "item_2",
+                        "required_list": "frontend",
+                        "required_item": "item_2",
+                    },
+                    {
+                        "dependent_list": "backend",
+                        "dependent_item": "item_1",
+                        "required_list": "backend",
+                        "required_item": "item_2",
+                    },
+                ]
+            )
+        with pytest.raises(ValueError, match="already exists"):
+            manager.add_item_dependencies(
+                [
+                    {
+                        "dependent_list": "frontend",
+                        "dependent_item": "item_1",
+                        "required_list": "backend",
+                        "required_item": "item_1",
+                    }
+                ]
+            )
+
+        # Failed batches add nothing
+        assert manager.get_item_blockers("backend", "item_2") == []
+
+    def test_get_next_pending_skips_blocked_in_one_query(
+        self, manager, sample_lists, capture_sql
+    ):
+        """Blocked items and subitems of unfinished parents are skipped in SQL"""
+        manager.add_item_dependency("backend", "item_1", "frontend", "item_1")
+        manager.add_item_dependency("backend", "item_2", "frontend", "item_2")
+        manager.add_subitem("backend", "item_3", "sub", "Subitem")
+        manager.update_item_status("frontend", "item_2", "completed")
+
+        with capture_sql() as statements:
+            next_item = manager.get_next_pending("backend")
+
+        assert next_item.item_key == "item_2"
+        # list lookup and the next item query
+        assert len(statements) == 2
+
+        manager.update_item_status("backend", "item_2", "completed")
+        assert manager.get_next_pending("backend").item_key == "item_3"
+        manager.update_item_status(
+            "backend", "sub", "in_progress", parent_item_key="item_3"
+        )
+        assert manager.get_next_pending("backend") is None
+        assert (
+            manager.get_next_pending("backend", respect_dependencies=False).item_key
+            == "item_1"
+        )
+
+
+class TestDependencyIndex:
+    """Test the in-memory dependency index"""
+
+    def test_index_matches_sql_and_follows_changes(self, manager, sample_lists):
+        """Blocker queries answer like SQL across status and dependency edits"""
+        manager.enable_dependency_index()
+        manager.add_item_dependency("frontend", "item_1", "backend", "item_1")
+        manager.add_item_dependency("frontend", "item_1", "backend", "item_2")
+
+        blockers = manager.get_item_blockers("frontend", "item_1")
+        assert [b.item_key for b in blockers] == ["item_1", "item_2"]
+        blocked = manager.get_items_blocked_by("backend", "item_2")
+        assert [(b.list_id, b.item_key) for b in blocked] == [
+            (sample_lists["frontend"].id, "item_1")
+        ]
+
+        manager.update_item_status("backend", "item_1", "completed")
+        blockers = manager.get_item_blockers("frontend", "item_1")
+        assert [b.item_key for b in blockers] == ["item_2"]
+        assert manager.is_item_blocked("frontend", "item_1")
+
+        manager.remove_item_dependency("frontend", "item_1", "backend", "item_2")
+        assert not manager.is_item_blocked("frontend", "item_1")
+        assert manager.can_start_item("frontend", "item_1")["can_start"] is True
+        assert manager.get_items_blocked_by("backend", "item_2") == []
+
+    def test_index_sees_other_processes_with_one_query(
+        self, manager, sample_lists, capture_sql
+    ):
+        """Writes through another connection are replayed from the change log"""
+        index = manager.enable_dependency_index()
+        manager.add_item_dependency("frontend", "item_1", "backend", "item_1")
+        assert manager.is_item_blocked("frontend", "item_1")
+
+        other = TodoManager(manager.db.db_path)
+        other.update_item_status("backend", "item_1", "completed")
+        item_id = manager.get_item("frontend", "item_1").id
+
+        with capture_sql() as statements:
+            assert index.is_blocked(item_id) is False
+        assert len(statements) == 1
+        assert "dependency_changes" in statements[0]
+
+        other.add_item_dependency("frontend", "item_1", "backend", "item_2")
+        assert manager.is_item_blocked("frontend", "item_1")
+
+    def test_index_reloads_when_log_was_pruned(self, manager, sample_lists):
+        """A version older than the retained log triggers a full reload"""
+        from sqlalchemy import text
+
+        index = manager.enable_dependency_index()
+        manager.add_item_dependency("frontend", "item_1", "backend", "item_1")
+        item_id = manager.get_item("frontend", "item_1").id
+        assert index.is_blocked(item_id) is True
+
+        manager.update_item_status("backend", "item_1", "completed")
+        with manager.db.engine.begin() as conn:
+            conn.execute(text("DELETE FROM dependency_changes"))
+            conn.execute(
+                text(
+                    "INSERT INTO dependency_changes (id, change, item_id) "
+                    "VALUES (1000000, 'status', 0)"
+                )
+            )
+
+        assert index.is_blocked(item_id) is False
+        assert index.version == 1000000
+
+    def test_index_not_used_inside_unit_of_work(self, manager, sample_lists):
+        """Uncommitted changes of the active unit of work are honoured"""
+        index = manager.enable_dependency_index()
+        manager.add_item_dependency("frontend", "item_1", "backend", "item_1")
+
+        with manager.db.unit_of_work():
+            manager.update_item_status("backend", "item_1", "completed")
+            assert index.is_blocked(manager.get_item("frontend", "item_1").id) is None
+            assert not manager.is_item_blocked("frontend", "item_1")
@@ -265,4 +265,59 @@ class TestCrossListSearch:
         }, None)
 
         # Should work across all lists
-        assert len(results) >= 0  # At least no errors
\ No newline at end of file
+        assert len(results) >= 0  # At least no errors
+
+
+class TestSetBasedSubitemMatching:
+    """Sibling conditions are matched in SQL, not one parent at a time."""
+
+    def test_query_count_independent_of_parent_count(self, manager, capture_sql):
+        """Matching many parents costs the same queries as matching one."""
+        manager.create_list("scenes", "Scenes")
+        manager.add_items_bulk(
+            "scenes",
+            [
+                {
+                    "item_key": f"scene_{i:03d}",
+                    "content": f"Scene {i}",
+                    "subitems": [
+                        {"item_key": "image", "content": "Image"},
+                        {"item_key": "video", "content": "Video"},
+                    ],
+                }
+                for i in range(1, 61)
+            ],
+        )
+        updates = [(f"scene_{i:03d}", None, "completed") for i in range(1, 61, 3)]
+        manager.update_items_status_bulk(
+            "scenes", [("image", key, status) for key, _, status in updates]
+        )
+
+        with capture_sql() as legacy_statements:
+            legacy = manager.find_items_by_status(
+                {"image": "completed", "video": "pending"}, "scenes", limit=5
+            )
+        with capture_sql() as complex_statements:
+            complex_matches = manager.find_items_by_status(
+                {"item": {"status": "in_progress"}, "subitem": {"image": "completed"}},
+                limit=50,
+            )
+
+        assert [m["parent"].item_key for m in legacy] == [
+            "scene_001",
+            "scene_004",
+            "scene_007",
+            "scene_010",
+            "scene_013",
+        ]
+        assert [s.item_key for s in legacy[0]["matching_subitems"]] == [
+            "image",
+            "video",
+        ]
+        assert len(complex_matches) == 20
+        assert [s.item_key for s in complex_matches[0]["matching_subitems"]] == [
+            "image"
+        ]
+        # list lookup, parents and subitems
+        assert len(legacy_statements) == 3
+        assert len(complex_statements) == 2
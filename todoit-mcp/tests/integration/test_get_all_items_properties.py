@@ -263,3 +263,39 @@ class TestGetAllItemsPropertiesIntegration:
         result_no_limit = manager.get_all_items_properties("testlist")
         assert len(result) == len(result_no_limit)
         assert result == result_no_limit
+
+    def test_get_all_items_properties_batched_queries(self, manager, capture_sql):
+        """Properties of a whole hierarchy are loaded with two item/property queries."""
+        manager.create_list("batch", "Batch")
+        manager.add_items_bulk(
+            "batch",
+            [
+                {
+                    "item_key": f"scene_{i}",
+                    "content": f"Scene {i}",
+                    "properties": {"priority": "high"},
+                    "subitems": [
+                        {
+                            "item_key": "image",
+                            "content": "Image",
+                            "properties": {"model": "x"},
+                        },
+                        {"item_key": "video", "content": "Video"},
+                    ],
+                }
+                for i in range(1, 51)
+            ],
+        )
+
+        with capture_sql() as statements:
+            result = manager.get_all_items_properties("batch")
+
+        # list lookup, items and properties
+        assert len(statements) == 3
+        assert len(result) == 150
+        assert [(r["item_key"], r["property_key"]) for r in result[:3]] == [
+            ("scene_1", "priority"),
+            ("image", "model"),
+            ("video", "—"),
+        ]
+        assert result[1]["parent_item_key"] == "scene_1"
@@ -0,0 +1,126 @@
+"""
+Integration tests for the trigger-maintained item_closure hierarchy index
+Tests depth, path, subtree and cycle checks beyond the old 10-level cap
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from core.database import ITEM_CLOSURE_SELECT
+
+
+def _closure_rows(manager):
+    with manager.db.get_session() as session:
+        return set(
+            session.execute(
+                text("SELECT ancestor_id, descendant_id, depth FROM item_closure")
+            ).all()
+        )
+
+
+def _expected_rows(manager):
+    """Closure recomputed from parent_item_id"""
+    with manager.db.get_session() as session:
+        return set(session.execute(text(ITEM_CLOSURE_SELECT)).all())
+
+
+@pytest.fixture
+def chain_manager(manager):
+    """A single chain level_0 -> level_1 -> ... -> level_14"""
+    manager.create_list("deep", "Deep")
+    manager.add_item("deep", "level_0", "Level 0")
+    for level in range(1, 15):
+        manager.add_subitem("deep", f"level_{level - 1}", f"level_{level}", "Step")
+    return manager
+
+
+def _item_id(manager, item_key):
+    db_list = manager.db.get_list_by_key("deep")
+    return manager.db.get_item_by_key(db_list.id, item_key).id
+
+
+class TestItemClosure:
+    """Test hierarchy queries backed by item_closure"""
+
+    def test_depth_and_path_beyond_ten_levels(self, chain_manager):
+        """Depth and path are exact for deep chains"""
+        leaf_id = _item_id(chain_manager, "level_14")
+
+        assert chain_manager.db.get_item_depth(leaf_id) == 14
+        path = chain_manager.db.get_item_path(leaf_id)
+        assert [item.item_key for item in path] == [
+            f"level_{level}" for level in range(15)
+        ]
+        assert chain_manager.get_progress("deep").hierarchy_depth == 14
+
+    def test_descendants_and_ancestry(self, chain_manager):
+        """Subtree and ancestor checks cover every level"""
+        root_id = _item_id(chain_manager, "level_0")
+        leaf_id = _item_id(chain_manager, "level_14")
+
+        descendants = chain_manager.db.get_item_descendants(root_id)
+        assert [item.item_key for item in descendants] == [
+            f"level_{level}" for level in range(1, 15)
+        ]
+        assert len(chain_manager.db.get_item_descendants(root_id, True)) == 15
+        assert chain_manager.db.is_item_ancestor(root_id, leaf_id)
+        assert chain_manager.db.is_item_ancestor(leaf_id, leaf_id)
+        assert not chain_manager.db.is_item_ancestor(leaf_id, root_id)
+
+    def test_circular_move_rejected_at_any_depth(self, chain_manager):
+        """Moving an item under its own deep descendant is refused"""
+        chain_manager.add_item("deep", "other", "Other")
+        chain_manager.move_to_subitem("deep", "other", "level_14")
+
+        with pytest.raises(ValueError, match="circular"):
+            chain_manager.move_to_subitem("deep", "level_0", "other")
+
+        # The closure also refuses cycles written behind the manager's back
+        with pytest.raises(IntegrityError):
+            with chain_manager.db.get_session() as session:
+                session.execute(
+                    text(
+                        "UPDATE todo_items SET parent_item_id = :leaf WHERE id = :root"
+                    ),
+                    {
+                        "leaf": _item_id(chain_manager, "other"),
+                        "root": _item_id(chain_manager, "level_0"),
+                    },
+                )
+                session.commit()
+
+    def test_closure_follows_moves_and_deletes(self, manager):
+        """Subtree moves and deletes keep the closure exact"""
+        manager.create_list("work", "Work", items=["A", "B", "C"])
+        manager.add_subitem("work", "item_1", "sub_1", "Sub 1")
+        manager.add_subitem("work", "sub_1", "sub_2", "Sub 2")
+        manager.add_subitem("work", "item_2", "sub_3", "Sub 3")
+
+        manager.move_to_subitem("work", "item_1", "sub_3")
+        assert _closure_rows(manager) == _expected_rows(manager)
+        db_list = manager.db.get_list_by_key("work")
+        sub_2 = manager.db.get_item_by_key(db_list.id, "sub_2")
+        assert manager.db.get_item_depth(sub_2.id) == 4
+
+        manager.delete_item("work", "sub_2", parent_item_key="sub_1")
+        manager.delete_item("work", "item_3")
+        assert _closure_rows(manager) == _expected_rows(manager)
+
+        manager.delete_list("work")
+        assert _closure_rows(manager) == set()
+
+    def test_migration_rebuilds_closure(self, chain_manager):
+        """A closure out of step with todo_items is rebuilt on open"""
+        expected = _closure_rows(chain_manager)
+        with chain_manager.db.get_session() as session:
+            session.execute(text("DELETE FROM item_closure WHERE depth > 3"))
+            session.execute(
+                text("DELETE FROM item_closure WHERE descendant_id = :id"),
+                {"id": _item_id(chain_manager, "level_14")},
+            )
+            session.commit()
+
+        chain_manager.db.run_item_closure_migration()
+
+        assert _closure_rows(chain_manager) == expected
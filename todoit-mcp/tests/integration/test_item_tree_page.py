@@ -0,0 +1,67 @@
+"""
+Integration tests for get_item_tree_page and get_subitems_with_properties
+Tests root paging, grouped subitem loading and page-restricted properties
+"""
+
+import pytest
+
+
+@pytest.fixture
+def tree_manager(manager):
+    """Manager with three root items, two of them with subitems"""
+    manager.create_list("tree", "Tree", items=["Root 1", "Root 2", "Root 3"])
+    manager.add_subitem("tree", "item_1", "sub_b", "Sub B")
+    manager.add_subitem("tree", "item_1", "sub_a", "Sub A")
+    manager.add_subitem("tree", "item_2", "sub_a", "Other Sub A")
+    manager.set_item_property("tree", "item_1", "priority", "high")
+    manager.set_item_property("tree", "sub_a", "notes", "first", "item_1")
+    manager.set_item_property("tree", "item_3", "priority", "low")
+    return manager
+
+
+class TestItemTreePage:
+    """Test paged item tree loading"""
+
+    def test_page_roots_subitems_and_properties(self, tree_manager):
+        """Roots are paged; subitems and properties cover the page only"""
+        page = tree_manager.get_item_tree_page("tree", limit=2, offset=0)
+
+        assert page["total"] == 3
+        roots = page["items"]
+        assert [item.item_key for item in roots] == ["item_1", "item_2"]
+
+        first_subitems = page["subitems"][roots[0].id]
+        assert [item.item_key for item in first_subitems] == ["sub_b", "sub_a"]
+        assert page["subitem_counts"] == {roots[0].id: 2, roots[1].id: 1}
+
+        properties = page["properties"]
+        assert properties[roots[0].id] == {"priority": "high"}
+        assert properties[first_subitems[1].id] == {"notes": "first"}
+        # item_3 is not on the page
+        assert {"priority": "low"} not in properties.values()
+
+    def test_lazy_page_counts_without_subitems(self, tree_manager):
+        """include_subitems=False returns counts only"""
+        page = tree_manager.get_item_tree_page(
+            "tree", limit=10, offset=1, include_subitems=False
+        )
+
+        roots = page["items"]
+        assert [item.item_key for item in roots] == ["item_2", "item_3"]
+        assert page["subitems"] == {}
+        assert page["subitem_counts"] == {roots[0].id: 1, roots[1].id: 0}
+
+    def test_subitems_with_properties(self, tree_manager):
+        """Subitems of one root with their properties"""
+        result = tree_manager.get_subitems_with_properties("tree", "item_1")
+
+        subitems = result["subitems"]
+        assert [item.item_key for item in subitems] == ["sub_b", "sub_a"]
+        assert result["properties"] == {subitems[1].id: {"notes": "first"}}
+
+    def test_missing_list_or_parent(self, tree_manager):
+        """Unknown list or parent raises ValueError"""
+        with pytest.raises(ValueError):
+            tree_manager.get_item_tree_page("missing")
+        with pytest.raises(ValueError):
+            tree_manager.get_subitems_with_properties("tree", "missing")
@@ -0,0 +1,132 @@
+"""
+Integration tests for the key resolution cache
+Tests hits, invalidation on key changes and the data_version bypass
+"""
+
+import pytest
+from sqlalchemy import text
+
+from core.database import Database
+from core.key_cache import KeyCache
+
+
+@pytest.fixture
+def cached_manager(manager):
+    manager.create_list("work", "Work", items=["A", "B"])
+    manager.add_subitem("work", "item_1", "sub_1", "Sub 1")
+    manager.enable_key_cache()
+    return manager
+
+
+class TestKeyCache:
+    """Test key lookups served from the key cache"""
+
+    def test_repeated_lookups_hit(self, cached_manager):
+        """Second resolution of the same keys comes from the cache"""
+        cache = cached_manager.db.key_cache
+        cached_manager.set_item_property(
+            "work", "sub_1", "size", "10", parent_item_key="item_1"
+        )
+        cached_manager.get_item_property(
+            "work", "sub_1", "size", parent_item_key="item_1"
+        )
+        cache.reset_stats()
+
+        assert (
+            cached_manager.get_item_property(
+                "work", "sub_1", "size", parent_item_key="item_1"
+            )
+            == "10"
+        )
+        assert cache.stats()["hits"] == 3
+        assert cache.stats()["misses"] == 0
+        assert cached_manager.get_item("work", "item_2").content == "B"
+        assert cached_manager.get_item("work", "item_2").content == "B"
+        assert cache.stats()["hit_rate"] > 0.5
+
+    def test_own_commit_clears_cache(self, cached_manager):
+        """Commits through other pooled connections also change data_version"""
+        cache = cached_manager.db.key_cache
+        cached_manager.get_list_properties("work")
+        cached_manager.set_list_property("work", "owner", "me")
+
+        cache.reset_stats()
+        cached_manager.get_list_properties("work")
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["clears"] == 1
+
+    def test_lru_eviction(self, temp_db):
+        """The least recently used entry is evicted first"""
+        cache = KeyCache(temp_db, max_size=2)
+        for key, row_id in (("a", 1), ("b", 2)):
+            cache.put(KeyCache.list_entry(key), row_id, cache.generation())
+        assert cache.get(KeyCache.list_entry("a")) == 1
+        cache.put(KeyCache.list_entry("c"), 3, cache.generation())
+
+        assert cache.get(KeyCache.list_entry("b")) is None
+        assert cache.get(KeyCache.list_entry("a")) == 1
+        assert cache.stats()["size"] == 2
+
+    def test_renames_and_moves_invalidate(self, cached_manager):
+        """Old keys stop resolving after rename_list, rename_item and moves"""
+        cached_manager.get_list_property("work", "missing")
+        cached_manager.get_item_properties("work", "item_2")
+
+        cached_manager.rename_item("work", "item_2", new_key="renamed")
+        with pytest.raises(ValueError, match="Item 'item_2' not found"):
+            cached_manager.get_item_properties("work", "item_2")
+        assert cached_manager.get_item_properties("work", "renamed") == {}
+
+        cached_manager.move_to_subitem("work", "renamed", "item_1")
+        cached_manager.get_item_properties("work", "renamed", parent_item_key="item_1")
+
+        cached_manager.rename_list("work", new_key="job")
+        with pytest.raises(ValueError, match="List 'work' not found"):
+            cached_manager.get_list_properties("work")
+        assert cached_manager.get_list_properties("job") == {}
+
+    def test_deletes_invalidate(self, cached_manager):
+        """Deleted items and lists stop resolving, and keys can be reused"""
+        cached_manager.get_item_properties("work", "item_2")
+        cached_manager.delete_item("work", "item_2")
+        with pytest.raises(ValueError, match="Item 'item_2' not found"):
+            cached_manager.get_item_properties("work", "item_2")
+
+        cached_manager.get_list_properties("work")
+        cached_manager.delete_item("work", "sub_1", parent_item_key="item_1")
+        cached_manager.delete_list("work")
+        with pytest.raises(ValueError, match="List 'work' not found"):
+            cached_manager.get_list_properties("work")
+
+        new_list = cached_manager.create_list("work", "Work again")
+        assert cached_manager.db.get_list_by_key("work").id == new_list.id
+
+    def test_other_connection_commit_clears_cache(self, cached_manager):
+        """A commit from another process is seen through PRAGMA data_version"""
+        cache = cached_manager.db.key_cache
+        cached_manager.get_list_properties("work")
+        assert cache.stats()["size"] > 0
+
+        other = Database(cached_manager.db.db_path)
+        with other.get_session() as session:
+            session.execute(
+                text("UPDATE todo_lists SET list_key = 'moved' WHERE list_key = 'work'")
+            )
+            session.commit()
+
+        with pytest.raises(ValueError, match="List 'work' not found"):
+            cached_manager.get_list_properties("work")
+        assert cache.stats()["clears"] >= 1
+        assert cached_manager.get_list_properties("moved") == {}
+
+    def test_rolled_back_rows_are_not_returned(self, cached_manager):
+        """Entries stored inside a rolled back unit of work are verified away"""
+        with pytest.raises(RuntimeError):
+            with cached_manager.db.unit_of_work():
+                cached_manager.create_list("temp", "Temp")
+                assert cached_manager.db.get_list_by_key("temp") is not None
+                raise RuntimeError("abort")
+
+        assert cached_manager.db.get_list_by_key("temp") is None
+        with pytest.raises(ValueError, match="List 'temp' not found"):
+            cached_manager.get_list_properties("temp")
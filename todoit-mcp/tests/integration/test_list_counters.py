@@ -0,0 +1,153 @@
+"""
+Integration tests for trigger-maintained list_counters
+Tests that counters stay exact across writes and that recount repairs them
+"""
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import text
+
+from interfaces.cli import cli
+
+
+def _naive(timestamp):
+    """Drop tzinfo; timestamps are stored both with and without a UTC offset"""
+    return timestamp.replace(tzinfo=None) if timestamp else None
+
+
+def _fresh_counts(manager, list_key):
+    """Counts computed directly from todo_items"""
+    db_list = manager.db.get_list_by_key(list_key)
+    items = manager.db.get_list_items(db_list.id)
+    counts = {
+        "total": len(items),
+        "pending": 0,
+        "in_progress": 0,
+        "completed": 0,
+        "failed": 0,
+        "root_items": sum(1 for item in items if item.parent_item_id is None),
+        "subtasks": sum(1 for item in items if item.parent_item_id is not None),
+        "last_item_update": max(
+            (_naive(item.updated_at) for item in items), default=None
+        ),
+    }
+    for item in items:
+        counts[item.status] += 1
+    return counts
+
+
+def _stored_counts(manager, list_key):
+    db_list = manager.db.get_list_by_key(list_key)
+    counters = manager.db.get_counters_for_lists([db_list.id])[db_list.id]
+    counters["last_item_update"] = _naive(counters["last_item_update"])
+    return counters
+
+
+class TestListCounters:
+    """Test list_counters maintenance"""
+
+    def test_counters_follow_writes(self, manager):
+        """Creates, status changes, subitems, moves and deletes keep counters exact"""
+        manager.create_list("work", "Work", items=["A", "B", "C", "D"])
+        assert _stored_counts(manager, "work") == _fresh_counts(manager, "work")
+
+        manager.add_subitem("work", "item_1", "sub_1", "Sub 1")
+        manager.add_subitem("work", "item_1", "sub_2", "Sub 2")
+        manager.update_item_status("work", "item_2", "completed")
+        manager.update_item_status("work", "item_3", "failed")
+        manager.update_item_status(
+            "work", "sub_1", "in_progress", parent_item_key="item_1"
+        )
+        assert _stored_counts(manager, "work") == _fresh_counts(manager, "work")
+
+        manager.move_to_subitem("work", "item_4", "item_2")
+        manager.delete_item("work", "item_3")
+        stored = _stored_counts(manager, "work")
+        assert stored == _fresh_counts(manager, "work")
+        assert stored["root_items"] == 2
+        assert stored["subtasks"] == 3
+
+    def test_stats_readers_use_counters(self, manager):
+        """get_list_stats and status counts reflect the counters"""
+        manager.create_list("work", "Work", items=["A", "B", "C"])
+        manager.update_item_status("work", "item_1", "completed")
+        db_list = manager.db.get_list_by_key("work")
+
+        assert manager.db.get_list_stats(db_list.id) == {
+            "total": 3,
+            "pending": 2,
+            "in_progress": 0,
+            "completed": 1,
+            "failed": 0,
+        }
+        counts = manager.db.get_status_counts_for_lists([db_list.id])
+        assert counts[db_list.id]["completed"] == 1
+
+    def test_empty_and_deleted_lists(self, manager):
+        """Empty lists count zero; deleting a list removes its counters row"""
+        manager.create_list("empty", "Empty")
+        assert _stored_counts(manager, "empty")["total"] == 0
+        assert _stored_counts(manager, "empty")["last_item_update"] is None
+
+        db_list = manager.db.get_list_by_key("empty")
+        manager.delete_list("empty")
+        with manager.db.get_session() as session:
+            remaining = session.execute(
+                text("SELECT COUNT(*) FROM list_counters WHERE list_id = :id"),
+                {"id": db_list.id},
+            ).scalar()
+        assert remaining == 0
+
+    def test_archive_requires_completed_counters(self, manager):
+        """archive_list refuses lists whose counters show open items"""
+        manager.create_list("work", "Work", items=["A"])
+        with pytest.raises(ValueError, match="Incomplete: 1/1"):
+            manager.archive_list("work")
+
+        manager.update_item_status("work", "item_1", "completed")
+        assert manager.archive_list("work").status == "archived"
+
+    def test_recount_repairs_counters(self, manager):
+        """recount_list_counters fixes rows changed behind the triggers"""
+        manager.create_list("work", "Work", items=["A", "B"])
+        manager.create_list("other", "Other", items=["C"])
+        with manager.db.get_session() as session:
+            session.execute(text("UPDATE list_counters SET total = 99, pending = 0"))
+            session.commit()
+
+        assert manager.recount_list_counters("work") == {"lists": 1, "corrected": 1}
+        assert _stored_counts(manager, "work") == _fresh_counts(manager, "work")
+        assert _stored_counts(manager, "other")["total"] == 99
+
+        assert manager.recount_list_counters() == {"lists": 2, "corrected": 1}
+        assert manager.recount_list_counters() == {"lists": 2, "corrected": 0}
+
+    def test_recount_unknown_list(self, manager):
+        """Unknown list raises ValueError"""
+        with pytest.raises(ValueError, match="does not exist"):
+            manager.recount_list_counters("missing")
+
+    def test_migration_backfills_existing_lists(self, manager):
+        """Lists without a counters row are backfilled when the database opens"""
+        manager.create_list("work", "Work", items=["A", "B"])
+        with manager.db.get_session() as session:
+            session.execute(text("DELETE FROM list_counters"))
+            session.commit()
+
+        manager.db.run_list_counters_migration()
+        assert _stored_counts(manager, "work") == _fresh_counts(manager, "work")
+
+
+def test_db_recount_cli(tmp_path):
+    """todoit db recount reports checked and corrected lists"""
+    temp_db_path = str(tmp_path / "test.db")
+    runner = CliRunner()
+    runner.invoke(
+        cli,
+        ["--db-path", temp_db_path, "list", "create", "--list", "work", "--title", "W"],
+    )
+
+    result = runner.invoke(cli, ["--db-path", temp_db_path, "db", "recount"])
+
+    assert result.exit_code == 0
+    assert "Recounted 1 list(s), corrected 0" in result.output
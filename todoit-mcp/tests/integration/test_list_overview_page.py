@@ -0,0 +1,86 @@
+"""
+Integration tests for list_overview_page (web dashboard list page)
+Tests that search, favorites and tag filters run before pagination and that
+counts, properties and tags are resolved for the returned page
+"""
+
+import pytest
+
+
+@pytest.fixture
+def overview_manager(manager):
+    """Manager with searchable, favorite and tagged lists"""
+    manager.create_list("alpha_docs", "Alpha Documentation", items=["A", "B", "C"])
+    manager.create_list("beta_app", "Beta App", items=["A", "B"])
+    manager.create_list("gamma_app", "Gamma 100%_done", items=["A"])
+    manager.create_list("old_stuff", "Old Stuff", items=["A"])
+    manager.update_item_status("alpha_docs", "item_1", "completed")
+    manager.update_item_status("alpha_docs", "item_2", "failed")
+    manager.set_list_property("beta_app", "is_favorite", "true")
+    manager.set_list_property("beta_app", "priority", "high")
+    manager.set_list_property("gamma_app", "is_favorite", "false")
+    manager.add_tag_to_list("beta_app", "work")
+    manager.add_tag_to_list("gamma_app", "work")
+    manager.archive_list("old_stuff", force=True)
+    return manager
+
+
+class TestListOverviewPage:
+    """Test list_overview_page filtering and bulk loading"""
+
+    def test_page_order_total_and_counts(self, overview_manager):
+        """Active lists ordered by key, counts and last activity per list"""
+        page = overview_manager.list_overview_page(limit=2, offset=0)
+
+        assert page["total"] == 3
+        assert [lst.list_key for lst in page["lists"]] == ["alpha_docs", "beta_app"]
+
+        summary = page["summaries"]["alpha_docs"]
+        assert summary["total"] == 3
+        assert summary["completed"] == 1
+        assert summary["failed"] == 1
+        assert summary["pending"] == 1
+        assert summary["last_item_update"] is not None
+
+    def test_search_is_case_insensitive_and_escaped(self, overview_manager):
+        """Search matches key or title substrings; % and _ are literal"""
+        page = overview_manager.list_overview_page(search="APP")
+        assert [lst.list_key for lst in page["lists"]] == ["beta_app", "gamma_app"]
+
+        page = overview_manager.list_overview_page(search="documentation")
+        assert [lst.list_key for lst in page["lists"]] == ["alpha_docs"]
+
+        page = overview_manager.list_overview_page(search="0%_d")
+        assert [lst.list_key for lst in page["lists"]] == ["gamma_app"]
+
+    def test_search_folds_non_ascii_case(self, overview_manager):
+        """Search ignores case of non-ASCII letters too"""
+        overview_manager.create_list("lodz", "Łódź Świętokrzyska")
+
+        page = overview_manager.list_overview_page(search="łódź")
+        assert [lst.list_key for lst in page["lists"]] == ["lodz"]
+        page = overview_manager.list_overview_page(search="ŚWIĘTO")
+        assert page["total"] == 1
+
+    def test_favorites_and_tag_filters(self, overview_manager):
+        """Property and tag filters narrow the total before paging"""
+        page = overview_manager.list_overview_page(
+            property_filters={"is_favorite": "true"}
+        )
+        assert page["total"] == 1
+        assert page["properties"]["beta_app"] == {
+            "is_favorite": "true",
+            "priority": "high",
+        }
+
+        page = overview_manager.list_overview_page(tag="work", limit=1, offset=1)
+        assert page["total"] == 2
+        assert [lst.list_key for lst in page["lists"]] == ["gamma_app"]
+        assert page["tags"]["gamma_app"] == ["work"]
+
+    def test_property_keys_restrict_loaded_properties(self, overview_manager):
+        """Only the requested property keys are returned"""
+        page = overview_manager.list_overview_page(
+            search="beta", property_keys=["priority"]
+        )
+        assert page["properties"]["beta_app"] == {"priority": "high"}
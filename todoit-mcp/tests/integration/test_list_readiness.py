@@ -0,0 +1,113 @@
+"""
+Integration tests for get_list_readiness
+Tests that the bulk analysis matches can_start_item for every item
+"""
+
+import pytest
+
+
+@pytest.fixture
+def readiness_manager(manager):
+    """List with subtasks, a cross-list blocker and finished items"""
+    manager.create_list("work", "Work", items=["Build", "Test", "Ship", "Docs"])
+    manager.create_list("infra", "Infra", items=["Server"])
+    manager.add_subitem("work", "item_1", "compile", "Compile")
+    manager.add_subitem("work", "item_1", "link", "Link")
+    manager.add_item_dependency("work", "item_3", "infra", "item_1")
+    manager.add_item_dependency("work", "item_3", "work", "item_2")
+    manager.update_item_status("work", "item_4", "completed")
+    return manager
+
+
+class TestListReadiness:
+    """Test bulk blocking analysis"""
+
+    def test_matches_can_start_item(self, readiness_manager):
+        """Every item gets the same result as the single-item check"""
+        readiness = readiness_manager.get_list_readiness("work")
+        db_list = readiness_manager.db.get_list_by_key("work")
+        db_items = readiness_manager.db.get_list_items(db_list.id)
+
+        assert set(readiness) == {item.id for item in db_items}
+        for item in db_items:
+            if item.parent_item_id is None:
+                expected = readiness_manager.can_start_item("work", item.item_key)
+                assert readiness[item.id] == expected
+
+    def test_blockers_subtasks_and_reasons(self, readiness_manager):
+        """Blocked items list blockers and pending subtasks with a reason"""
+        readiness = readiness_manager.get_list_readiness("work")
+        by_key = {
+            item.item_key: readiness[item.id]
+            for item in readiness_manager.get_list_items("work")
+            if item.parent_item_id is None
+        }
+
+        assert by_key["item_1"]["blocked_by_subtasks"] is True
+        assert [s["key"] for s in by_key["item_1"]["pending_subtasks"]] == [
+            "compile",
+            "link",
+        ]
+        assert by_key["item_1"]["reason"] == "has pending subtasks: compile, link"
+
+        assert by_key["item_2"]["can_start"] is True
+        assert by_key["item_2"]["reason"] == "ready to start"
+
+        ship = by_key["item_3"]
+        assert ship["blocked_by_dependencies"] is True
+        assert [b["key"] for b in ship["blockers"]] == ["item_1", "item_2"]
+        assert ship["reason"] == "blocked by dependencies: item_1, item_2"
+
+        assert by_key["item_4"]["reason"] == "Item is already completed"
+
+    def test_completed_blocker_unblocks(self, readiness_manager):
+        """Completing a required item removes it from the blockers"""
+        readiness_manager.update_item_status("infra", "item_1", "completed")
+        readiness = readiness_manager.get_list_readiness("work")
+        ship = readiness_manager.get_item("work", "item_3")
+
+        assert [b["key"] for b in readiness[ship.id]["blockers"]] == ["item_2"]
+
+    def test_uses_dependency_index(self, readiness_manager):
+        """Results are the same when blockers come from the dependency index"""
+        expected = readiness_manager.get_list_readiness("work")
+        readiness_manager.enable_dependency_index()
+
+        assert readiness_manager.get_list_readiness("work") == expected
+
+    def test_items_with_readiness_load_items_once(self, readiness_manager):
+        """Items and readiness come from a single load of the list's items"""
+        db = readiness_manager.db
+        calls = []
+        original = db.get_list_items
+
+        def counting_get_list_items(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        db.get_list_items = counting_get_list_items
+        try:
+            items, readiness = readiness_manager.get_list_items_with_readiness("work")
+        finally:
+            del db.get_list_items
+
+        assert len(calls) == 1
+        assert [item.item_key for item in items] == [
+            item.item_key for item in readiness_manager.get_list_items("work")
+        ]
+        assert readiness == readiness_manager.get_list_readiness("work")
+
+    def test_missing_list(self, manager):
+        """Unknown list raises ValueError"""
+        with pytest.raises(ValueError, match="not found"):
+            manager.get_list_readiness("missing")
+
+    def test_dependency_summary(self, readiness_manager):
+        """Dependency summary counts both directions in one query"""
+        db_list = readiness_manager.db.get_list_by_key("work")
+
+        assert readiness_manager.db.get_dependency_summary_for_list(db_list.id) == {
+            "total_dependencies": 2,
+            "as_dependent": 2,
+            "as_required": 1,
+        }
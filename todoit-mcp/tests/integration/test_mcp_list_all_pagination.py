@@ -0,0 +1,85 @@
+"""
+Integration tests for todo_list_all database-level pagination
+Tests that pages, totals, progress and tags are resolved for the returned page only
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from interfaces.mcp_server import todo_list_all
+
+
+@pytest.fixture
+def paged_manager(manager):
+    """Manager with naturally ordered lists, one archived and some tagged"""
+    for i in [1, 2, 10, 11, 3]:
+        manager.create_list(f"list_{i}", f"List {i}", items=["A", "B"])
+    manager.update_item_status("list_2", "item_1", "completed")
+    manager.add_tag_to_list("list_2", "work")
+    manager.add_tag_to_list("list_10", "work")
+    manager.add_tag_to_list("list_10", "urgent")
+    manager.archive_list("list_11", force=True)
+    return manager
+
+
+class TestListAllPagination:
+    """Test database-level pagination of todo_list_all"""
+
+    def test_lists_page_natural_order_and_total(self, paged_manager):
+        """Page follows natural order and total counts all matching lists"""
+        page, total = paged_manager.db.get_lists_page(limit=2, offset=1)
+
+        assert total == 4  # archived list_11 excluded
+        assert [lst.list_key for lst in page] == ["list_2", "list_3"]
+
+        page, total = paged_manager.db.get_lists_page(
+            limit=10, offset=0, include_archived=True
+        )
+        assert total == 5
+        assert [lst.list_key for lst in page][-2:] == ["list_10", "list_11"]
+
+    def test_lists_page_tag_filters(self, paged_manager):
+        """OR and AND tag filtering happen before pagination"""
+        page, total = paged_manager.db.get_lists_page(tag_names=["WORK", "urgent"])
+        assert total == 2
+        assert [lst.list_key for lst in page] == ["list_2", "list_10"]
+
+        page, total = paged_manager.db.get_lists_page(
+            tag_names=["work", "urgent"], match_all_tags=True
+        )
+        assert total == 1
+        assert page[0].list_key == "list_10"
+
+    @pytest.mark.asyncio
+    async def test_todo_list_all_page_metadata(self, paged_manager):
+        """Tool returns the requested page with pagination metadata"""
+        with patch("interfaces.mcp_server.init_manager", return_value=paged_manager):
+            result = await todo_list_all(limit=2, offset=0)
+
+        assert result["success"] is True
+        assert result["count"] == 2
+        assert result["total"] == 4
+        assert result["pagination"]["has_more"] is True
+        assert result["pagination"]["next_offset"] == 2
+
+        list_2 = result["lists"][1]
+        assert list_2["list_key"] == "list_2"
+        assert list_2["progress"]["completed"] == 1
+        assert list_2["progress"]["available"] == 1
+        assert [tag["name"] for tag in list_2["tags"]] == ["work"]
+
+    @pytest.mark.asyncio
+    async def test_todo_list_all_last_page(self, paged_manager):
+        """Last page has no next offset"""
+        with patch("interfaces.mcp_server.init_manager", return_value=paged_manager):
+            result = await todo_list_all(limit=3, offset=3)
+
+        assert result["count"] == 1
+        assert result["lists"][0]["list_key"] == "list_10"
+        assert result["pagination"]["has_more"] is False
+        assert result["pagination"]["next_offset"] is None
+        assert sorted(tag["name"] for tag in result["lists"][0]["tags"]) == [
+            "urgent",
+            "work",
+        ]
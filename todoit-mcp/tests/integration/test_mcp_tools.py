@@ -42,8 +42,8 @@ class TestMCPToolsBasic:
             )
 
         tool_count = int(result.stdout.strip())
-        # Expected count is 51 as per current implementation
-        expected_count = 51
+        # Expected count is 56 as per current implementation
+        expected_count = 56
         assert (
             tool_count == expected_count
         ), f"Expected exactly {expected_count} MCP tools, found {tool_count}"
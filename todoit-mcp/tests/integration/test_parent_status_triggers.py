@@ -0,0 +1,133 @@
+"""
+Integration tests for trigger-derived parent statuses
+Tests propagation inside the writing transaction and set-based recompute
+"""
+
+import pytest
+from sqlalchemy import text
+
+
+@pytest.fixture
+def tree_manager(manager):
+    """grandparent -> parent -> (child_1, child_2) plus a second root"""
+    manager.create_list("tree", "Tree")
+    manager.add_item("tree", "grandparent", "Grandparent")
+    manager.add_item("tree", "other", "Other")
+    manager.add_subitem("tree", "grandparent", "parent", "Parent")
+    manager.add_subitem("tree", "parent", "child_1", "Child 1")
+    manager.add_subitem("tree", "parent", "child_2", "Child 2")
+    return manager
+
+
+def _status(manager, item_key, parent_key=None):
+    return manager.get_item("tree", item_key, parent_item_key=parent_key).status
+
+
+def _set_status_sql(manager, item_key, status):
+    """Change a status behind the manager's back"""
+    with manager.db.get_session() as session:
+        session.execute(
+            text("UPDATE todo_items SET status = :status WHERE item_key = :key"),
+            {"status": status, "key": item_key},
+        )
+        session.commit()
+
+
+class TestParentStatusTriggers:
+    """Test parent status derivation in the database"""
+
+    def test_raw_sql_change_propagates_to_root(self, tree_manager):
+        """Any write to a child status re-derives every ancestor"""
+        _set_status_sql(tree_manager, "child_1", "failed")
+
+        assert _status(tree_manager, "parent", "grandparent") == "failed"
+        assert _status(tree_manager, "grandparent") == "failed"
+        assert _status(tree_manager, "other") == "pending"
+
+    def test_propagation_rolls_back_with_the_child(self, tree_manager):
+        """Parent updates belong to the child's transaction"""
+        with pytest.raises(RuntimeError):
+            with tree_manager.db.unit_of_work():
+                tree_manager.update_item_status(
+                    "tree", "child_1", "completed", parent_item_key="parent"
+                )
+                assert _status(tree_manager, "grandparent") == "in_progress"
+                raise RuntimeError("abort")
+
+        assert _status(tree_manager, "parent", "grandparent") == "pending"
+        assert _status(tree_manager, "grandparent") == "pending"
+
+    def test_insert_and_delete_of_children(self, tree_manager):
+        """Adding a pending child reopens a completed parent; deleting it closes it"""
+        for child in ("child_1", "child_2"):
+            tree_manager.update_item_status(
+                "tree", child, "completed", parent_item_key="parent"
+            )
+        assert _status(tree_manager, "grandparent") == "completed"
+
+        tree_manager.add_subitem("tree", "parent", "child_3", "Child 3")
+        assert _status(tree_manager, "parent", "grandparent") == "in_progress"
+        assert _status(tree_manager, "grandparent") == "in_progress"
+
+        tree_manager.delete_item("tree", "child_3", parent_item_key="parent")
+        assert _status(tree_manager, "grandparent") == "completed"
+
+    def test_move_updates_old_and_new_parent(self, tree_manager):
+        """Moving a child re-derives both the old and the new parent"""
+        tree_manager.update_item_status(
+            "tree", "child_1", "completed", parent_item_key="parent"
+        )
+        tree_manager.move_to_subitem("tree", "other", "parent")
+        assert _status(tree_manager, "parent", "grandparent") == "in_progress"
+
+        tree_manager.move_to_subitem("tree", "child_2", "grandparent")
+        tree_manager.delete_item("tree", "other", parent_item_key="parent")
+
+        assert _status(tree_manager, "parent", "grandparent") == "completed"
+        assert _status(tree_manager, "grandparent") == "in_progress"
+
+    def test_recompute_repairs_drift(self, tree_manager):
+        """recompute_parent_statuses fixes parents and propagates upwards"""
+        _set_status_sql(tree_manager, "parent", "completed")
+        _set_status_sql(tree_manager, "other", "completed")
+        assert _status(tree_manager, "grandparent") == "completed"
+
+        changed = tree_manager.recompute_parent_statuses("tree")
+
+        assert changed == 2
+        assert _status(tree_manager, "parent", "grandparent") == "pending"
+        assert _status(tree_manager, "grandparent") == "pending"
+        # Items without children keep their status
+        assert _status(tree_manager, "other") == "completed"
+        assert tree_manager.recompute_parent_statuses() == 0
+
+    def test_migration_replaces_trigger_without_deferral(self, tree_manager):
+        """A child_changed trigger from before batch deferral is replaced"""
+        with tree_manager.db.get_session() as session:
+            session.execute(text("DROP TRIGGER trg_parent_status_child_changed"))
+            session.execute(
+                text(
+                    "CREATE TRIGGER trg_parent_status_child_changed "
+                    "AFTER UPDATE OF status ON todo_items "
+                    "BEGIN SELECT 1; END"
+                )
+            )
+            session.commit()
+
+        tree_manager.db.run_parent_status_triggers_migration()
+
+        with tree_manager.db.get_session() as session:
+            definition = session.execute(
+                text(
+                    "SELECT sql FROM sqlite_master "
+                    "WHERE name = 'trg_parent_status_child_changed'"
+                )
+            ).scalar()
+        assert "parent_status_deferrals" in definition
+        _set_status_sql(tree_manager, "child_1", "failed")
+        assert _status(tree_manager, "grandparent") == "failed"
+
+    def test_recompute_unknown_list(self, manager):
+        """Unknown list raises ValueError"""
+        with pytest.raises(ValueError, match="does not exist"):
+            manager.recompute_parent_statuses("missing")
@@ -0,0 +1,70 @@
+"""
+Test aggregate progress statistics
+Verifies get_progress values and that the query count does not grow with list size
+"""
+
+from core.models import ProgressStats
+
+
+class TestProgressStats:
+    """Test get_progress aggregate statistics"""
+
+    def test_progress_counts_hierarchy_and_blocking(self, manager, sample_lists):
+        """All ProgressStats fields are computed from the aggregate query"""
+        manager.add_subitem("frontend", "item_1", "design", "Design UI")
+        manager.add_subitem("frontend", "item_1", "build", "Build UI")
+        manager.add_subitem("frontend", "item_1", "review", "Review UI")
+        manager.update_item_status("frontend", "build", "completed", "item_1")
+
+        # item_2 and item_3 wait for backend work
+        manager.add_item_dependency("frontend", "item_2", "backend", "item_1")
+        manager.add_item_dependency("frontend", "item_3", "backend", "item_2")
+        manager.update_item_status("backend", "item_2", "completed")
+
+        progress = manager.get_progress("frontend")
+
+        assert isinstance(progress, ProgressStats)
+        assert progress.total == 6
+        assert progress.completed == 1
+        assert progress.in_progress == 1  # item_1 synced from its subitems
+        assert progress.pending == 4
+        assert progress.failed == 0
+        assert progress.root_items == 3
+        assert progress.subtasks == 3
+        assert progress.hierarchy_depth == 1
+        assert progress.blocked == 1  # only item_2, backend item_2 is completed
+        assert progress.available == 3
+        assert progress.dependency_count == 2
+
+        backend = manager.get_progress("backend")
+        assert backend.dependency_count == 2
+        assert backend.hierarchy_depth == 0
+        assert backend.blocked == 0
+
+    def test_progress_empty_list(self, manager):
+        """Empty list returns zeroed statistics"""
+        manager.create_list("empty", "Empty")
+
+        progress = manager.get_progress("empty")
+
+        assert progress.total == 0
+        assert progress.completion_percentage == 0.0
+        assert progress.hierarchy_depth == 0
+        assert progress.blocked == 0
+        assert progress.available == 0
+
+    def test_progress_query_count_is_constant(self, manager, capture_sql):
+        """Query count must not depend on the number of items"""
+        manager.create_list("small", "Small", items=["a", "b"])
+        manager.create_list("large", "Large", items=[f"Task {i}" for i in range(60)])
+        for i in range(1, 11):
+            manager.add_subitem("large", f"item_{i}", "sub", f"Sub {i}")
+
+        with capture_sql() as small:
+            manager.get_progress("small")
+        with capture_sql() as large:
+            progress = manager.get_progress("large")
+
+        assert progress.total == 70
+        assert progress.subtasks == 10
+        assert len(large) == len(small)
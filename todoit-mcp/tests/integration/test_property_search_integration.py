@@ -423,6 +423,45 @@ class TestPropertySearchIntegration:
 
         assert len(results) == 0
 
+    def test_manager_find_items_by_property_returns_context_keys(self, manager):
+        """List and parent keys are filled in from the joined query."""
+        manager.create_list("ctx1", "Context List 1")
+        manager.create_list("ctx2", "Context List 2")
+        manager.add_item("ctx1", "parent", "Parent")
+        manager.add_subitem("ctx1", "parent", "child", "Child")
+        manager.add_item("ctx2", "other", "Other")
+
+        manager.set_item_property("ctx1", "child", "owner", "bob", "parent")
+        manager.set_item_property("ctx2", "other", "owner", "bob")
+
+        results = manager.find_items_by_property(None, "owner", "bob")
+        by_key = {item.item_key: item for item in results}
+
+        assert by_key["child"].list_key == "ctx1"
+        assert by_key["child"].parent_item_key == "parent"
+        assert by_key["other"].list_key == "ctx2"
+        assert by_key["other"].parent_item_key is None
+
+    def test_manager_find_items_by_property_cursor_pages(self, manager):
+        """Cursor paging walks all matches once, in order."""
+        manager.create_list("paged", "Paged List")
+        for i in range(1, 8):
+            manager.add_item("paged", f"item{i}", f"Item {i}")
+            manager.set_item_property("paged", f"item{i}", "batch", "a")
+
+        seen = []
+        cursor = None
+        while True:
+            page = manager.find_items_by_property(
+                "paged", "batch", "a", limit=3, cursor=cursor
+            )
+            if not page:
+                break
+            seen.extend(item.item_key for item in page)
+            cursor = page[-1].id
+
+        assert seen == [f"item{i}" for i in range(1, 8)]
+
     def test_database_find_items_by_property_all_lists(self, manager):
         """Test database layer find_items_by_property with list_id=None."""
         # Create test data
@@ -0,0 +1,103 @@
+"""
+Test natural ordering through the stored sort_key column
+Verifies sort keys are maintained, ordering and limits happen in SQL,
+and existing databases are migrated
+"""
+
+import os
+import sqlite3
+import tempfile
+
+from core.database import Database, natural_sort_value
+from core.manager import TodoManager
+
+
+class TestSortKeyOrdering:
+    """Test SQL natural ordering via sort_key"""
+
+    def test_sort_value_matches_natural_sort_key(self):
+        """Binary order of sort values equals natural_sort_key order"""
+        keys = ["item_10", "Item_2", "item_1", "0014_jane", "scene_0020", "a", "a1"]
+
+        by_value = sorted(keys, key=natural_sort_value)
+        by_natural = sorted(keys, key=Database.natural_sort_key)
+
+        assert by_value == by_natural
+
+    def test_sort_key_maintained_on_insert_and_rename(self, manager):
+        """sort_key follows item_key and list_key changes"""
+        manager.create_list("list_1", "List")
+        manager.add_item("list_1", "task_9", "Task")
+
+        manager.rename_item("list_1", "task_9", new_key="task_10")
+        manager.rename_list("list_1", new_key="list_20")
+
+        todo_list = manager.db.get_list_by_key("list_20")
+        item = manager.db.get_item_by_key(todo_list.id, "task_10")
+        assert item.sort_key == natural_sort_value("task_10")
+        assert todo_list.sort_key == natural_sort_value("list_20")
+
+    def test_list_items_hierarchical_order_with_limit_in_sql(
+        self, manager, capture_sql
+    ):
+        """Main items are followed by their subitems and LIMIT is pushed to SQL"""
+        manager.create_list("work", "Work")
+        for key in ["task_10", "task_2", "task_1"]:
+            manager.add_item("work", key, key)
+        manager.add_subitem("work", "task_2", "step_10", "Step")
+        manager.add_subitem("work", "task_2", "step_9", "Step")
+        list_id = manager.db.get_list_by_key("work").id
+
+        with capture_sql() as statements:
+            items = manager.db.get_list_items(list_id, limit=4)
+
+        assert [item.item_key for item in items] == [
+            "task_1",
+            "task_2",
+            "step_9",
+            "step_10",
+        ]
+        assert any("LIMIT" in statement for statement in statements)
+
+        all_items = manager.db.get_list_items(list_id)
+        assert [item.item_key for item in all_items][-1] == "task_10"
+
+    def test_items_by_status_follow_position(self, manager):
+        """get_items_by_status keeps position order, get_list_items natural order"""
+        manager.create_list("work", "Work")
+        for key in ["task_10", "task_2", "task_1"]:
+            manager.add_item("work", key, key)
+        list_id = manager.db.get_list_by_key("work").id
+
+        by_status = manager.db.get_items_by_status(list_id, "pending")
+        assert [item.item_key for item in by_status] == ["task_10", "task_2", "task_1"]
+        limited = manager.db.get_items_by_status(list_id, "pending", limit=2)
+        assert [item.item_key for item in limited] == ["task_10", "task_2"]
+
+        natural = manager.db.get_list_items(list_id, status="pending")
+        assert [item.item_key for item in natural] == ["task_1", "task_2", "task_10"]
+
+    def test_existing_database_is_migrated(self):
+        """Databases without sort_key get the column and backfilled values"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, "old.db")
+            TodoManager(db_path).create_list("list_10", "L", items=["A", "B"])
+
+            # Simulate a database created before sort_key existed
+            conn = sqlite3.connect(db_path)
+            conn.execute("DROP INDEX idx_todo_items_list_parent_sort")
+            conn.execute("DROP INDEX idx_todo_lists_sort_key")
+            conn.execute("ALTER TABLE todo_items DROP COLUMN sort_key")
+            conn.execute("ALTER TABLE todo_lists DROP COLUMN sort_key")
+            conn.commit()
+            conn.close()
+
+            manager = TodoManager(db_path)
+            todo_list = manager.db.get_list_by_key("list_10")
+            items = manager.db.get_list_items(todo_list.id)
+
+            assert todo_list.sort_key == natural_sort_value("list_10")
+            assert [item.sort_key for item in items] == [
+                natural_sort_value("item_1"),
+                natural_sort_value("item_2"),
+            ]
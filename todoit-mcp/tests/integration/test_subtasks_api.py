@@ -47,6 +47,40 @@ class TestSubtasksAPI:
         assert "subitems" in hierarchy
         assert len(hierarchy["subitems"]) == 1
 
+    def test_get_item_hierarchy_order_and_stats(
+        self, manager, sample_list, capture_sql
+    ):
+        """Hierarchy is loaded in one query, naturally ordered, with rolled-up stats"""
+        for key in ["step10", "step2", "step1"]:
+            manager.add_subitem("test_list", "item_1", key, f"Step {key}")
+        manager.add_subitem("test_list", "step2", "deep", "Deep step")
+        manager.update_item_status(
+            "test_list", "deep", "completed", parent_item_key="step2"
+        )
+        manager.update_item_status(
+            "test_list", "step1", "failed", parent_item_key="item_1"
+        )
+
+        with capture_sql() as statements:
+            hierarchy = manager.get_item_hierarchy("test_list", "item_1")
+
+        keys = [node["item"]["item_key"] for node in hierarchy["subitems"]]
+        assert keys == ["step1", "step2", "step10"]
+        assert hierarchy["subitems"][1]["subitems"][0]["item"]["item_key"] == "deep"
+        assert hierarchy["stats"]["total_subitems"] == 4
+        assert hierarchy["stats"]["completed_subitems"] == 2  # deep and step2
+        assert hierarchy["stats"]["failed_subitems"] == 1
+        assert hierarchy["subitems"][1]["stats"]["total_subitems"] == 1
+        # list lookup, item lookup and the recursive subtree query
+        assert len(statements) == 3
+
+        list_tree = manager.get_list_hierarchy("test_list")
+        assert [node["item"]["item_key"] for node in list_tree] == [
+            "item_1",
+            "item_2",
+            "item_3",
+        ]
+
     def test_move_to_subitem(self, manager, sample_list):
         """Test converting existing item to subitem"""
         # Move item_2 to be subitem of item_1
@@ -0,0 +1,82 @@
+"""
+Test unit-of-work sessions
+Verifies manager operations commit once and roll back as a whole on failure
+"""
+
+import pytest
+from sqlalchemy import event
+
+
+def count_commits(manager, func, *args, **kwargs):
+    """Run func and return (result, number of commits on the engine)"""
+    commits = []
+
+    def on_commit(conn):
+        commits.append(conn)
+
+    event.listen(manager.db.engine, "commit", on_commit)
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        event.remove(manager.db.engine, "commit", on_commit)
+    return result, len(commits)
+
+
+class TestUnitOfWork:
+    """Test single-session manager operations"""
+
+    def test_add_item_commits_once(self, manager, sample_list):
+        """add_item writes item and history in a single commit"""
+        item, commits = count_commits(
+            manager, manager.add_item, sample_list.list_key, "uow", "Unit of work"
+        )
+
+        assert item.item_key == "uow"
+        assert commits == 1
+        history = manager.get_item_history(sample_list.list_key, "uow")
+        assert len(history) == 1
+
+    def test_update_status_with_parent_sync_commits_once(self, manager, sample_list):
+        """Status change and parent synchronization share one commit"""
+        manager.add_item(sample_list.list_key, "parent", "Parent")
+        manager.add_subitem(sample_list.list_key, "parent", "child", "Child")
+
+        _, commits = count_commits(
+            manager,
+            manager.update_item_status,
+            sample_list.list_key,
+            "child",
+            "completed",
+            parent_item_key="parent",
+        )
+
+        assert commits == 1
+        parent = manager.get_item(sample_list.list_key, "parent")
+        assert parent.status == "completed"
+
+    def test_failure_rolls_back_whole_unit(self, manager, sample_list):
+        """Exception inside a unit of work discards all writes"""
+        with pytest.raises(RuntimeError):
+            with manager.db.unit_of_work():
+                manager.add_item(sample_list.list_key, "first", "First")
+                manager.add_item(sample_list.list_key, "second", "Second")
+                raise RuntimeError("abort")
+
+        assert manager.get_item(sample_list.list_key, "first") is None
+        assert manager.get_item(sample_list.list_key, "second") is None
+
+    def test_nested_units_join_outer_session(self, manager, sample_list):
+        """Nested units of work reuse the outer session and commit once"""
+
+        def add_two():
+            with manager.db.unit_of_work() as outer:
+                manager.add_item(sample_list.list_key, "a", "A")
+                with manager.db.unit_of_work() as inner:
+                    assert inner is outer
+                    manager.add_item(sample_list.list_key, "b", "B")
+
+        _, commits = count_commits(manager, add_two)
+
+        assert commits == 1
+        assert manager.get_item(sample_list.list_key, "a") is not None
+        assert manager.get_item(sample_list.list_key, "b") is not None
@@ -0,0 +1,83 @@
+"""
+Test SQLite engine profiles
+Verifies pragmas, pool configuration, profile selection and per-engine listeners
+"""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from core.database import Database, resolve_sqlite_profile
+
+
+@pytest.fixture
+def db_path():
+    """Temporary database path"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield os.path.join(tmp_dir, "profile.db")
+
+
+def read_pragma(db, name):
+    """Read a PRAGMA value through the engine"""
+    with db.engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestDatabaseProfiles:
+    """Test engine profile configuration"""
+
+    def test_default_profile_keeps_base_pragmas(self, db_path):
+        """Default profile applies foreign keys, WAL and busy timeout"""
+        db = Database(db_path, profile="default")
+
+        assert read_pragma(db, "foreign_keys") == 1
+        assert read_pragma(db, "journal_mode") == "wal"
+        assert read_pragma(db, "busy_timeout") == 5000
+        assert read_pragma(db, "synchronous") == 2  # FULL, SQLite default
+
+    def test_performance_profile_pragmas_and_pool(self, db_path):
+        """Performance profile applies tuned pragmas and a thread-safe pool"""
+        db = Database(db_path, profile="performance")
+
+        assert read_pragma(db, "synchronous") == 1  # NORMAL
+        assert read_pragma(db, "cache_size") == -65536
+        assert read_pragma(db, "temp_store") == 2  # MEMORY
+        assert read_pragma(db, "foreign_keys") == 1
+        assert isinstance(db.engine.pool, QueuePool)
+        assert db.engine.pool.size() == 5
+
+    def test_settings_override_single_values(self, db_path):
+        """Single settings can be overridden for benchmarking"""
+        db = Database(db_path, profile="performance", settings={"synchronous": "FULL"})
+
+        assert read_pragma(db, "synchronous") == 2
+        assert read_pragma(db, "temp_store") == 2
+
+    def test_profile_from_environment(self, db_path):
+        """TODOIT_DB_PROFILE selects the profile when none is passed"""
+        with patch.dict(os.environ, {"TODOIT_DB_PROFILE": "performance"}):
+            db = Database(db_path)
+
+        assert db.settings["synchronous"] == "NORMAL"
+        assert read_pragma(db, "synchronous") == 1
+
+    def test_unknown_profile_or_setting_raises(self):
+        """Invalid profile names and settings are rejected"""
+        with pytest.raises(ValueError, match="Unknown database profile"):
+            resolve_sqlite_profile("turbo")
+        with pytest.raises(ValueError, match="Unknown database setting"):
+            resolve_sqlite_profile("default", {"page_size": 8192})
+
+    def test_listener_scoped_to_engine(self, db_path):
+        """Creating databases does not register global Engine listeners"""
+        first = Database(db_path)
+        second = Database(db_path)
+
+        assert event.contains(first.engine, "connect", first._set_sqlite_pragmas)
+        assert not event.contains(first.engine, "connect", second._set_sqlite_pragmas)
+        assert not event.contains(Engine, "connect", first._set_sqlite_pragmas)
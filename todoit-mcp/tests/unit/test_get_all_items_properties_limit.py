@@ -11,6 +11,15 @@ import pytest
 from core.manager import TodoManager
 
 
+def limited(items):
+    """Mock side effect applying the limit like the SQL queries do"""
+
+    def query(list_id, status=None, limit=None):
+        return items if limit is None else items[:limit]
+
+    return query
+
+
 class TestGetAllItemsPropertiesLimit:
     """Unit tests for get_all_items_properties limit parameter"""
 
@@ -63,18 +72,19 @@ class TestGetAllItemsPropertiesLimit:
         ]
         mock_manager.db.get_list_items.return_value = mock_items
 
-        # Mock properties for each item
-        mock_manager.db.get_item_properties.side_effect = [
-            {"prop1": "val1", "prop2": "val2"},  # task1
-            {"prop3": "val3"},  # task2
-            {"prop4": "val4", "prop5": "val5"},  # task3
-        ]
+        # Mock properties for each item (loaded in one call)
+        mock_manager.db.get_item_properties_for_list.return_value = {
+            1: {"prop1": "val1", "prop2": "val2"},  # task1
+            2: {"prop3": "val3"},  # task2
+            3: {"prop4": "val4", "prop5": "val5"},  # task3
+        }
 
         result = mock_manager.get_all_items_properties("testlist")
 
         # Should process all 3 items
         assert len(result) == 5  # 2 + 1 + 2 properties
-        assert mock_manager.db.get_item_properties.call_count == 3
+        assert mock_manager.db.get_item_properties_for_list.call_count == 1
+        assert mock_manager.db.get_item_properties.call_count == 0
 
     def test_get_all_items_properties_with_limit(self, mock_manager):
         """Test that limit restricts number of items processed."""
@@ -107,19 +117,24 @@ class TestGetAllItemsPropertiesLimit:
                 parent_item_id=None,
             ),
         ]
-        mock_manager.db.get_list_items.return_value = mock_items
+        mock_manager.db.get_list_items.side_effect = limited(mock_items)
 
         # Mock properties for each item
-        mock_manager.db.get_item_properties.side_effect = [
-            {"prop1": "val1", "prop2": "val2"},  # task1
-            {"prop3": "val3"},  # task2 (task3 should not be processed)
-        ]
+        mock_manager.db.get_item_properties_for_list.return_value = {
+            1: {"prop1": "val1", "prop2": "val2"},  # task1
+            2: {"prop3": "val3"},  # task2 (task3 should not be processed)
+        }
 
         result = mock_manager.get_all_items_properties("testlist", limit=2)
 
+        # The limit is applied by the item query
+        mock_manager.db.get_list_items.assert_called_once_with(1, limit=2)
+
         # Should process only first 2 items
         assert len(result) == 3  # 2 + 1 properties
-        assert mock_manager.db.get_item_properties.call_count == 2
+        assert mock_manager.db.get_item_properties_for_list.call_count == 1
+        _, kwargs = mock_manager.db.get_item_properties_for_list.call_args
+        assert kwargs["item_ids"] == [1, 2]
 
         # Verify correct items were processed
         item_keys = {prop["item_key"] for prop in result}
@@ -134,12 +149,13 @@ class TestGetAllItemsPropertiesLimit:
 
         # Mock items (should not be processed)
         mock_items = [Mock(id=1, item_key="task1", status="pending")]
-        mock_manager.db.get_list_items.return_value = mock_items
+        mock_manager.db.get_list_items.side_effect = limited(mock_items)
 
         result = mock_manager.get_all_items_properties("testlist", limit=0)
 
         # Should return empty list and not process any items
         assert len(result) == 0
+        assert mock_manager.db.get_item_properties_for_list.call_count == 0
         assert mock_manager.db.get_item_properties.call_count == 0
 
     def test_get_all_items_properties_limit_with_status_filter(self, mock_manager):
@@ -166,20 +182,23 @@ class TestGetAllItemsPropertiesLimit:
                 parent_item_id=None,
             ),
         ]
-        mock_manager.db.get_items_by_status.return_value = mock_items
+        mock_manager.db.get_items_by_status.side_effect = limited(mock_items)
 
         # Mock properties
-        mock_manager.db.get_item_properties.side_effect = [
-            {"prop1": "val1"}  # Only task1 should be processed due to limit=1
-        ]
+        mock_manager.db.get_item_properties_for_list.return_value = {
+            1: {"prop1": "val1"}  # Only task1 should be processed due to limit=1
+        }
 
         result = mock_manager.get_all_items_properties(
             "testlist", status="pending", limit=1
         )
 
+        # The limit is applied by the status query
+        mock_manager.db.get_items_by_status.assert_called_once_with(1, "pending", 1)
+
         # Should process only 1 item despite 2 matching status filter
         assert len(result) == 1
-        assert mock_manager.db.get_item_properties.call_count == 1
+        assert mock_manager.db.get_item_properties_for_list.call_count == 1
         assert result[0]["item_key"] == "task1"
         assert result[0]["status"] == "pending"
 
@@ -203,13 +222,15 @@ class TestGetAllItemsPropertiesLimit:
         mock_manager.db.get_list_items.return_value = mock_items
 
         # Mock properties
-        mock_manager.db.get_item_properties.return_value = {"prop1": "val1"}
+        mock_manager.db.get_item_properties_for_list.return_value = {
+            1: {"prop1": "val1"}
+        }
 
         result = mock_manager.get_all_items_properties("testlist", limit=10)
 
         # Should process the 1 available item
         assert len(result) == 1
-        assert mock_manager.db.get_item_properties.call_count == 1
+        assert mock_manager.db.get_item_properties_for_list.call_count == 1
         assert result[0]["item_key"] == "task1"
 
     def test_get_all_items_properties_limit_none_means_no_limit(self, mock_manager):
@@ -246,14 +267,15 @@ class TestGetAllItemsPropertiesLimit:
         mock_manager.db.get_list_items.return_value = mock_items
 
         # Mock properties for each item
-        mock_manager.db.get_item_properties.side_effect = [
-            {"prop1": "val1"},
-            {"prop2": "val2"},
-            {"prop3": "val3"},
-        ]
+        mock_manager.db.get_item_properties_for_list.return_value = {
+            1: {"prop1": "val1"},
+            2: {"prop2": "val2"},
+            3: {"prop3": "val3"},
+        }
 
         result = mock_manager.get_all_items_properties("testlist", limit=None)
 
         # Should process all items (same as no limit parameter)
         assert len(result) == 3
-        assert mock_manager.db.get_item_properties.call_count == 3
+        assert mock_manager.db.get_item_properties_for_list.call_count == 1
+        assert mock_manager.db.get_item_properties.call_count == 0
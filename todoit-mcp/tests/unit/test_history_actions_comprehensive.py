@@ -35,6 +35,8 @@ class TestHistoryActionsComprehensive:
             "subitem_created",
             "auto_completed",
             "moved_to_subitem",
+            "claimed",
+            "lease_expired",
         }
 
         actual_actions = {action.value for action in HistoryAction}
@@ -277,7 +277,7 @@ class TestTodoManagerUnit:
         new_parent = MagicMock(id=200)
 
         mock_db.get_item_by_key.side_effect = [item_to_move, new_parent]
-        mock_db.get_item_path.return_value = []
+        mock_db.is_item_ancestor.return_value = False
 
         with patch.object(
             manager_with_mock,
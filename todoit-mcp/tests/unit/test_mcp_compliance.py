@@ -147,6 +147,15 @@ class TestIdempotentTools:
                 f"{tool_name} should have destructiveHint=False"
             )
 
+    def test_batch_tools_failing_on_repeat_not_idempotent(self):
+        """Batches that reject existing keys or dependencies are not idempotent"""
+        for tool_name in ["todo_add_items_bulk", "todo_add_item_dependencies"]:
+            annotations = get_tool_annotations(tool_name)
+            assert (
+                annotations.get("idempotentHint") is False
+            ), f"{tool_name} should have idempotentHint=False"
+            assert annotations.get("destructiveHint") is False
+
 
 class TestDestructiveTools:
     """Test that destructive tools are properly categorized"""
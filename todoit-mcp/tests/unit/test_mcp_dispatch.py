@@ -0,0 +1,161 @@
+"""
+Unit tests for MCP tool dispatch
+Tests reader concurrency, writer serialization, inline mode and timings
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from interfaces.mcp_dispatch import ToolDispatcher, run_coroutine_sync
+
+
+class ConcurrencyProbe:
+    """Callable that records how many calls overlapped"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return "done"
+
+
+class TestToolDispatcher:
+    """Test ToolDispatcher pools and statistics"""
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently(self):
+        dispatcher = ToolDispatcher(max_readers=4)
+        probe = ConcurrencyProbe()
+        try:
+            results = await asyncio.gather(
+                *[dispatcher.run("todo_read", True, probe) for _ in range(4)]
+            )
+        finally:
+            dispatcher.shutdown()
+
+        assert results == ["done"] * 4
+        assert probe.peak > 1
+        assert all(name.startswith("todoit-mcp-read") for name in probe.threads)
+
+    @pytest.mark.asyncio
+    async def test_writes_are_serialized(self):
+        dispatcher = ToolDispatcher(max_readers=4)
+        probe = ConcurrencyProbe(delay=0.01)
+        try:
+            await asyncio.gather(
+                *[dispatcher.run("todo_write", False, probe) for _ in range(4)]
+            )
+        finally:
+            dispatcher.shutdown()
+
+        assert probe.peak == 1
+        assert probe.threads == {"todoit-mcp-write_0"}
+
+    @pytest.mark.asyncio
+    async def test_inline_mode_and_stats(self):
+        dispatcher = ToolDispatcher(max_readers=0)
+        probe = ConcurrencyProbe(delay=0.01)
+
+        await dispatcher.run("todo_write", False, probe)
+        await dispatcher.run("todo_write", False, probe)
+
+        assert probe.threads == {threading.current_thread().name}
+        stats = dispatcher.stats()
+        assert stats["todo_write"]["calls"] == 2
+        assert stats["todo_write"]["exec_ms_max"] >= 10
+        assert stats["todo_write"]["exec_ms_avg"] <= stats["todo_write"]["exec_ms_max"]
+
+        dispatcher.reset_stats()
+        assert dispatcher.stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_queue_time_recorded_when_writer_busy(self):
+        dispatcher = ToolDispatcher(max_readers=1)
+        probe = ConcurrencyProbe(delay=0.05)
+        try:
+            await asyncio.gather(
+                dispatcher.run("todo_write", False, probe),
+                dispatcher.run("todo_write", False, probe),
+            )
+        finally:
+            dispatcher.shutdown()
+
+        assert dispatcher.stats()["todo_write"]["queue_ms_max"] >= 40
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_timed(self):
+        dispatcher = ToolDispatcher(max_readers=1)
+
+        def failing():
+            raise ValueError("boom")
+
+        try:
+            with pytest.raises(ValueError, match="boom"):
+                await dispatcher.run("todo_fail", True, failing)
+        finally:
+            dispatcher.shutdown()
+
+        assert dispatcher.stats()["todo_fail"]["calls"] == 1
+
+    def test_run_coroutine_sync(self):
+        async def body():
+            return 42
+
+        async def suspends():
+            await asyncio.sleep(0)
+
+        assert run_coroutine_sync(body()) == 42
+        with pytest.raises(RuntimeError):
+            run_coroutine_sync(suspends())
+
+
+class TestToolStatsTool:
+    """Test timings exposed through the todo_tool_stats MCP tool"""
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_are_timed(self, manager):
+        from interfaces import mcp_server
+
+        manager.create_list("stats_list", "Stats List", items=["A"])
+        with patch("interfaces.mcp_server.init_manager", return_value=manager):
+            await mcp_server.todo_tool_stats(reset=True)
+            await mcp_server.todo_get_list("stats_list")
+            await mcp_server.todo_update_item_status(
+                "stats_list", "item_1", status="completed"
+            )
+            result = await mcp_server.todo_tool_stats()
+
+        assert result["success"] is True
+        assert result["key_cache"] is None
+        assert result["tools"]["todo_get_list"]["calls"] == 1
+        assert result["tools"]["todo_update_item_status"]["calls"] == 1
+        assert set(result["tools"]["todo_get_list"]) == {
+            "calls",
+            "queue_ms_avg",
+            "queue_ms_max",
+            "exec_ms_avg",
+            "exec_ms_max",
+        }
+
+    def test_not_annotated_read_only(self):
+        """reset=True clears server state, so the tool is not read-only"""
+        from interfaces.mcp_tool_annotations import get_tool_annotations
+
+        annotations = get_tool_annotations("todo_tool_stats")
+        assert not annotations.get("readOnlyHint")
+        assert annotations["destructiveHint"] is False
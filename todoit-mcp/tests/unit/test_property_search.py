@@ -53,7 +53,10 @@ class TestPropertySearchUnit:
             created_at=datetime(2024, 1, 2),
         )
 
-        mock_db.find_items_by_property.return_value = [mock_item1, mock_item2]
+        mock_db.find_items_by_property_with_context.return_value = [
+            (mock_item1, "test", None),
+            (mock_item2, "test", None),
+        ]
 
         # Mock the model conversion
         mock_todo1 = TodoItem(
@@ -89,8 +92,8 @@ class TestPropertySearchUnit:
         assert result[0].item_key == "task1"
         assert result[1].item_key == "task2"
         mock_db.get_list_by_key.assert_called_once_with("test")
-        mock_db.find_items_by_property.assert_called_once_with(
-            1, "priority", "high", None
+        mock_db.find_items_by_property_with_context.assert_called_once_with(
+            1, "priority", "high", None, None
         )
 
     def test_find_items_by_property_with_limit(self, manager_with_mock, mock_db):
@@ -98,7 +101,9 @@ class TestPropertySearchUnit:
         mock_item = MagicMock(
             id=1, item_key="task1", content="First item", status="pending"
         )
-        mock_db.find_items_by_property.return_value = [mock_item]
+        mock_db.find_items_by_property_with_context.return_value = [
+            (mock_item, "test", None)
+        ]
 
         mock_todo = TodoItem(
             id=1,
@@ -117,8 +122,8 @@ class TestPropertySearchUnit:
             )
 
         assert len(result) == 1
-        mock_db.find_items_by_property.assert_called_once_with(
-            1, "status", "reviewed", 1
+        mock_db.find_items_by_property_with_context.assert_called_once_with(
+            1, "status", "reviewed", 1, None
         )
 
     def test_find_items_by_property_list_not_found(self, manager_with_mock, mock_db):
@@ -130,15 +135,15 @@ class TestPropertySearchUnit:
 
     def test_find_items_by_property_empty_result(self, manager_with_mock, mock_db):
         """Test property search with no matching items."""
-        mock_db.find_items_by_property.return_value = []
+        mock_db.find_items_by_property_with_context.return_value = []
 
         result = manager_with_mock.find_items_by_property(
             "test", "nonexistent", "value"
         )
 
         assert result == []
-        mock_db.find_items_by_property.assert_called_once_with(
-            1, "nonexistent", "value", None
+        mock_db.find_items_by_property_with_context.assert_called_once_with(
+            1, "nonexistent", "value", None, None
         )
 
     def test_database_find_items_by_property_query(self):
@@ -174,7 +179,10 @@ class TestPropertySearchUnit:
             created_at=datetime(2024, 1, 2),
         )
 
-        mock_db.find_items_by_property.return_value = [mock_item1, mock_item2]
+        mock_db.find_items_by_property_with_context.return_value = [
+            (mock_item1, "test", None),
+            (mock_item2, "test", None),
+        ]
 
         # Mock the model conversion
         mock_todo1 = TodoItem(
@@ -213,9 +221,9 @@ class TestPropertySearchUnit:
         # Should not call get_list_by_key when list_key is None
         mock_db.get_list_by_key.assert_not_called()
 
-        # Should call find_items_by_property with list_id=None
-        mock_db.find_items_by_property.assert_called_once_with(
-            None, "priority", "high", None
+        # Should call find_items_by_property_with_context with list_id=None
+        mock_db.find_items_by_property_with_context.assert_called_once_with(
+            None, "priority", "high", None, None
         )
 
     def test_find_items_by_property_no_list_key_with_limit(
@@ -225,7 +233,9 @@ class TestPropertySearchUnit:
         mock_item = MagicMock(
             id=1, list_id=1, item_key="task1", content="First item", status="pending"
         )
-        mock_db.find_items_by_property.return_value = [mock_item]
+        mock_db.find_items_by_property_with_context.return_value = [
+            (mock_item, "test", None)
+        ]
 
         mock_todo = TodoItem(
             id=1,
@@ -245,6 +255,6 @@ class TestPropertySearchUnit:
 
         assert len(result) == 1
         mock_db.get_list_by_key.assert_not_called()
-        mock_db.find_items_by_property.assert_called_once_with(
-            None, "status", "reviewed", 1
+        mock_db.find_items_by_property_with_context.assert_called_once_with(
+            None, "status", "reviewed", 1, None
         )
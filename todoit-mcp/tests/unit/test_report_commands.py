@@ -173,6 +173,68 @@ class TestReportCommands:
         assert len(failed_items) == 1
         assert failed_items[0]["list_key"] == "0023_beta_sprint"
 
+    def test_get_all_failed_items_filter_matches_from_start(
+        self, manager_with_failed_tasks
+    ):
+        """Test that the list filter keeps re.match semantics"""
+        # "beta" occurs inside 0023_beta_sprint but not at its start
+        assert manager_with_failed_tasks.get_all_failed_items(list_filter="beta") == []
+        matched = manager_with_failed_tasks.get_all_failed_items(list_filter="0023")
+        assert [item["list_key"] for item in matched] == ["0023_beta_sprint"]
+
+    def test_get_all_failed_items_filter_inline_flags(self, manager_with_failed_tasks):
+        """Test that global inline flags in the list filter are honoured"""
+        matched = manager_with_failed_tasks.get_all_failed_items(
+            list_filter="(?i)0023_BETA"
+        )
+        assert [item["list_key"] for item in matched] == ["0023_beta_sprint"]
+        assert (
+            manager_with_failed_tasks.get_all_failed_items(list_filter="(?i)BETA") == []
+        )
+
+    def test_iter_failed_items_includes_subitems_without_properties(self, manager):
+        """Test streaming failed subitems and items without properties"""
+        manager.create_list("stream_list", "Stream List")
+        manager.add_item("stream_list", "parent", "Parent")
+        manager.add_subitem("stream_list", "parent", "child", "Child")
+        manager.add_item("stream_list", "plain", "Plain")
+        manager.update_item_status(
+            "stream_list", "child", status="failed", parent_item_key="parent"
+        )
+        manager.update_item_status("stream_list", "plain", status="failed")
+        manager.set_item_property("stream_list", "child", "code", "E1", "parent")
+
+        failed_items = list(manager.iter_failed_items())
+
+        by_key = {item["item_key"]: item for item in failed_items}
+        assert {"child", "plain"} <= set(by_key)
+        assert by_key["child"]["properties"] == {"code": "E1"}
+        assert by_key["child"]["parent_item_id"] is not None
+        assert by_key["plain"]["properties"] == {}
+
+    def test_cli_report_errors_stream_json_lines(self, manager_with_failed_tasks):
+        """Test that --stream emits one JSON object per failed item"""
+        import json
+
+        from click.testing import CliRunner
+
+        from interfaces.cli_modules.report_commands import report_errors
+
+        runner = CliRunner()
+        result = runner.invoke(
+            report_errors,
+            ["--stream"],
+            obj={"db_path": manager_with_failed_tasks.db.db_path},
+        )
+
+        assert result.exit_code == 0
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        assert [line["list_key"] for line in lines] == [
+            "0001_project_alpha",
+            "0023_beta_sprint",
+        ]
+        assert lines[0]["properties"]["error_type"] == "timeout"
+
     @pytest.mark.asyncio
     async def test_mcp_todo_report_errors_basic(self, manager_with_failed_tasks):
         """Test MCP tool basic functionality"""
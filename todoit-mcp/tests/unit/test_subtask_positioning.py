@@ -3,7 +3,7 @@ Unit tests for subitem positioning logic
 Tests the fix for position conflicts in add_subitem method
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -24,7 +24,7 @@ class TestSubtaskPositioning:
         os.close(fd)
         try:
             manager = TodoManager(db_path)
-            manager.db = Mock()
+            manager.db = MagicMock()
             return manager
         finally:
             if os.path.exists(db_path):
@@ -5,10 +5,13 @@ FastAPI application for web-based TODO management
 
 import os
 import sys
+import threading
+from contextlib import asynccontextmanager
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 
+from anyio import CapacityLimiter, to_thread
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -21,11 +24,28 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.manager import TodoManager
 from core.models import ItemStatus
 
+# Routes that touch the database are plain "def" functions: FastAPI runs them
+# on a worker thread, so a slow request never blocks the event loop. The pool
+# is bounded by TODOIT_WEB_WORKERS; request handling is mostly GIL-bound Python,
+# so a few threads are enough (see benchmark_concurrency.py).
+WEB_WORKER_THREADS = int(os.environ.get("TODOIT_WEB_WORKERS", "4"))
+
+# Health checks get a thread of their own, so the probe is not queued behind
+# slow requests holding every worker thread
+_health_check_limiter = CapacityLimiter(1)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the worker thread pool used for synchronous routes"""
+    to_thread.current_default_thread_limiter().total_tokens = WEB_WORKER_THREADS
+    yield
+
 # Initialize FastAPI app
 app = FastAPI(
     title="TODOIT Web Interface",
     description="Web-based TODO list management",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Mount static files
@@ -34,8 +54,10 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Templates
 templates = Jinja2Templates(directory="templates")
 
-# Global manager instance
+# Global manager instance, shared by all worker threads (each database call
+# opens its own session)
 manager = None
+_manager_lock = threading.Lock()
 
 def load_env_file():
     """Load environment variables from .env file if it exists"""
@@ -52,7 +74,12 @@ def load_env_file():
 def get_manager():
     """Get or create TodoManager instance"""
     global manager
-    if manager is None:
+    if manager is not None:
+        return manager
+    with _manager_lock:
+        if manager is not None:
+            return manager
+
         # Load .env file first
         load_env_file()
         
@@ -86,117 +113,60 @@ async def root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 @app.get("/api/lists")
-async def get_all_lists(limit: int = 50, offset: int = 0, search: str = "", favorites_only: bool = False, tag: str = ""):
+def get_all_lists(limit: int = 50, offset: int = 0, search: str = "", favorites_only: bool = False, tag: str = ""):
     """Get paginated list of TODO lists with stats and properties"""
     try:
         mgr = get_manager()
-        all_lists = mgr.list_all()
-        
-        # Filter lists
-        filtered_lists = []
-        for list_obj in all_lists:
-            # Search filter
-            if search and search.lower() not in list_obj.title.lower() and search.lower() not in list_obj.list_key.lower():
-                continue
-                
-            # Get properties
-            properties = {}
-            is_favorite = False
-            try:
-                # Get all common properties for this list
-                known_props = ['is_favorite', 'priority', 'category', 'owner', 'deadline', 'color']
-                for prop_key in known_props:
-                    try:
-                        prop_result = mgr.get_list_property(list_obj.list_key, prop_key)
-                        # TodoManager returns string value directly
-                        if prop_result and isinstance(prop_result, str):
-                            properties[prop_key] = prop_result
-                            if prop_key == 'is_favorite' and prop_result == 'true':
-                                is_favorite = True
-                    except:
-                        continue
-            except:
-                pass
-            
-            # Favorites filter
-            if favorites_only and not is_favorite:
-                continue
-            
-            # Tag filter
-            if tag:
-                # Get list tags using TodoManager's tag system
-                list_tags = []
-                try:
-                    tags_result = mgr.get_tags_for_list(list_obj.list_key)
-                    list_tags = [t.name for t in tags_result] if tags_result else []
-                except:
-                    pass
-                
-                # If tag filter is specified but list doesn't have the tag, skip
-                if tag and tag not in list_tags:
-                    continue
-            
-            # Get item stats
-            items = mgr.get_list_items(list_obj.list_key, limit=1000)
-            total_items = len(items)
-            
-            # Count by status
-            def _status_str(s: Any) -> str:
-                try:
-                    return s.value if hasattr(s, 'value') else str(s)
-                except Exception:
-                    return str(s)
-
-            pending_count = sum(1 for item in items if _status_str(getattr(item, 'status', 'pending')) == 'pending')
-            in_progress_count = sum(1 for item in items if _status_str(getattr(item, 'status', 'pending')) == 'in_progress')
-            completed_count = sum(1 for item in items if _status_str(getattr(item, 'status', 'pending')) == 'completed')
-            failed_count = sum(1 for item in items if _status_str(getattr(item, 'status', 'pending')) == 'failed')
-            
-            # Get last activity
+
+        # Filters and pagination run in SQL; stats, properties and tags are
+        # then loaded for the requested page only
+        known_props = ['is_favorite', 'priority', 'category', 'owner', 'deadline', 'color']
+        page = mgr.list_overview_page(
+            limit=limit,
+            offset=offset,
+            search=search,
+            property_filters={'is_favorite': 'true'} if favorites_only else None,
+            tag=tag,
+            property_keys=known_props,
+        )
+
+        paginated_lists = []
+        for list_obj in page["lists"]:
+            properties = page["properties"][list_obj.list_key]
+            summary = page["summaries"][list_obj.list_key]
+            total_items = summary["total"]
+            completed_count = summary["completed"]
+
+            # Last activity is the newest of the list and its items
             last_updated = list_obj.updated_at
-            if items:
-                # Find most recent item update
-                for item in items:
-                    if hasattr(item, 'updated_at') and item.updated_at:
-                        try:
-                            # Handle timezone awareness
-                            item_updated = item.updated_at
-                            if hasattr(item_updated, 'replace') and item_updated.tzinfo is not None:
-                                item_updated = item_updated.replace(tzinfo=None)
-                            if hasattr(last_updated, 'replace') and last_updated.tzinfo is not None:
-                                last_updated = last_updated.replace(tzinfo=None)
-                            
-                            if item_updated > last_updated:
-                                last_updated = item_updated
-                        except (TypeError, AttributeError):
-                            # Skip if datetime comparison fails
-                            pass
-            
-            filtered_lists.append({
+            item_updated = summary["last_item_update"]
+            if item_updated and last_updated:
+                if item_updated.tzinfo is not None:
+                    item_updated = item_updated.replace(tzinfo=None)
+                if last_updated.tzinfo is not None:
+                    last_updated = last_updated.replace(tzinfo=None)
+                last_updated = max(last_updated, item_updated)
+
+            paginated_lists.append({
                 'list_key': list_obj.list_key,
                 'title': list_obj.title,
                 'description': list_obj.description,
                 'status': getattr(list_obj.status, 'value', str(list_obj.status)),
-                'is_favorite': is_favorite,
+                'is_favorite': properties.get('is_favorite') == 'true',
                 'properties': properties,
                 'properties_count': len(properties),
+                'tags': page["tags"][list_obj.list_key],
                 'total_items': total_items,
-                'pending_items': pending_count,
-                'in_progress_items': in_progress_count,
+                'pending_items': summary["pending"],
+                'in_progress_items': summary["in_progress"],
                 'completed_items': completed_count,
-                'failed_items': failed_count,
+                'failed_items': summary["failed"],
                 'completion_percentage': round((completed_count / total_items * 100) if total_items > 0 else 0, 1),
                 'created_at': str(list_obj.created_at),
                 'updated_at': str(last_updated)
             })
-        
-        # Sort by list_key (alphabetical)
-        filtered_lists.sort(key=lambda x: x['list_key'])
-        
-        # Apply pagination
-        total_count = len(filtered_lists)
-        paginated_lists = filtered_lists[offset:offset + limit]
-        
+
+        total_count = page["total"]
         return {
             "success": True,
             "data": paginated_lists,
@@ -212,7 +182,7 @@ async def get_all_lists(limit: int = 50, offset: int = 0, search: str = "", favo
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/tags")
-async def get_all_tags():
+def get_all_tags():
     """Get all available tags"""
     try:
         mgr = get_manager()
@@ -229,7 +199,7 @@ async def get_all_tags():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/lists/{list_key}")
-async def get_list_details(list_key: str):
+def get_list_details(list_key: str):
     """Get detailed information about a specific list"""
     try:
         mgr = get_manager()
@@ -273,96 +243,52 @@ async def get_list_details(list_key: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+ITEM_KNOWN_PROPS = ['priority', 'category', 'assignee', 'deadline', 'tags', 'notes', 'difficulty']
+SUBITEM_KNOWN_PROPS = ['priority', 'assignee', 'deadline', 'notes', 'difficulty', 'estimated_time', 'test_priority']
+
+def _item_row(item, properties: Dict[str, str], known_props: List[str]) -> Dict[str, Any]:
+    """Serialize an item with its known properties for the items table"""
+    item_properties = {key: properties[key] for key in known_props if properties.get(key)}
+    item_dict = item.to_dict()
+    return {
+        'item_key': item_dict['item_key'],
+        'content': item_dict['content'],
+        'status': str(item_dict['status']),
+        'position': item_dict['position'],
+        'created_at': str(item_dict['created_at']),
+        'updated_at': str(item_dict['updated_at']),
+        'properties': item_properties,
+        'properties_count': len(item_properties)
+    }
+
 @app.get("/api/lists/{list_key}/items")
-async def get_list_items(list_key: str, limit: int = 100, offset: int = 0):
-    """Get paginated items for specific list with subitems"""
+def get_list_items(list_key: str, limit: int = 100, offset: int = 0, lazy_subitems: bool = False):
+    """Get paginated items for specific list with subitems
+
+    With lazy_subitems=true only subitem counts are returned; rows load their
+    subitems on expand via /api/lists/{list_key}/items/{item_key}/subitems.
+    """
     try:
         mgr = get_manager()
-        
-        # Get all items for this list
-        all_items = mgr.get_list_items(list_key, limit=10000)  # Get all to organize properly
-        
-        # Organize items with subitems
-        organized_items = []
-        items_by_id = {getattr(item, 'id', None): item for item in all_items if hasattr(item, 'id')}
-        
-        for item in all_items:
-            # Convert item to dict
-            if hasattr(item, 'to_dict'):
-                item_dict = item.to_dict()
-            elif hasattr(item, '__dict__'):
-                item_dict = {k: v for k, v in item.__dict__.items() if not k.startswith('_')}
-            else:
-                item_dict = item if isinstance(item, dict) else {}
-            
-            # Only process root items (no parent)
-            if not item_dict.get('parent_item_id'):
-                # Find subitems
-                subitems = []
-                item_id = item_dict.get('id')
-                for child in all_items:
-                    child_dict = child.to_dict() if hasattr(child, 'to_dict') else (child.__dict__ if hasattr(child, '__dict__') else child)
-                    if child_dict.get('parent_item_id') == item_id:
-                        # Get properties for this subitem
-                        subitem_properties = {}
-                        subitem_known_props = ['priority', 'assignee', 'deadline', 'notes', 'difficulty', 'estimated_time', 'test_priority']
-                        for prop_key in subitem_known_props:
-                            try:
-                                result = mgr.get_item_property(list_key, child_dict.get('item_key', ''), prop_key, parent_item_key=item_dict.get('item_key', ''))
-                                # TodoManager returns string value directly
-                                if result and isinstance(result, str):
-                                    subitem_properties[prop_key] = result
-                            except:
-                                continue
-                        
-                        clean_child = {
-                            'item_key': child_dict.get('item_key', ''),
-                            'content': child_dict.get('content', ''),
-                            'status': str(child_dict.get('status', 'pending')),
-                            'position': child_dict.get('position', 0),
-                            'created_at': str(child_dict.get('created_at', '')),
-                            'updated_at': str(child_dict.get('updated_at', '')),
-                            'properties': subitem_properties,
-                            'properties_count': len(subitem_properties)
-                        }
-                        subitems.append(clean_child)
-                
-                # Sort subitems by position
-                subitems.sort(key=lambda x: x['position'])
-                
-                # Get properties for main item
-                item_properties = {}
-                known_props = ['priority', 'category', 'assignee', 'deadline', 'tags', 'notes', 'difficulty']
-                for prop_key in known_props:
-                    try:
-                        result = mgr.get_item_property(list_key, item_dict.get('item_key', ''), prop_key)
-                        # TodoManager returns string value directly
-                        if result and isinstance(result, str):
-                            item_properties[prop_key] = result
-                    except:
-                        continue
-                
-                organized_item = {
-                    'item_key': item_dict.get('item_key', ''),
-                    'content': item_dict.get('content', ''),
-                    'status': str(item_dict.get('status', 'pending')),
-                    'position': item_dict.get('position', 0),
-                    'created_at': str(item_dict.get('created_at', '')),
-                    'updated_at': str(item_dict.get('updated_at', '')),
-                    'subitems_count': len(subitems),
-                    'subitems': subitems,
-                    'properties': item_properties,
-                    'properties_count': len(item_properties)
-                }
-                organized_items.append(organized_item)
-        
-        # Sort by position
-        organized_items.sort(key=lambda x: x['position'])
-        
-        # Apply pagination
-        total_count = len(organized_items)
-        paginated_items = organized_items[offset:offset + limit]
-        
+
+        # Root page, its subitems and their properties in a few grouped queries
+        page = mgr.get_item_tree_page(
+            list_key, limit=limit, offset=offset, include_subitems=not lazy_subitems
+        )
+        properties = page["properties"]
+
+        paginated_items = []
+        for item in page["items"]:
+            subitems = [
+                _item_row(child, properties.get(child.id, {}), SUBITEM_KNOWN_PROPS)
+                for child in page["subitems"].get(item.id, [])
+            ]
+            organized_item = _item_row(item, properties.get(item.id, {}), ITEM_KNOWN_PROPS)
+            organized_item['subitems_count'] = page["subitem_counts"].get(item.id, 0)
+            organized_item['subitems'] = subitems
+            paginated_items.append(organized_item)
+
+        total_count = page["total"]
         return {
             "success": True,
             "data": paginated_items,
@@ -376,8 +302,28 @@ async def get_list_items(list_key: str, limit: int = 100, offset: int = 0):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/lists/{list_key}/items/{item_key}/subitems")
+def get_item_subitems(list_key: str, item_key: str):
+    """Get subitems of one item with their properties (lazy row expansion)"""
+    try:
+        mgr = get_manager()
+        result = mgr.get_subitems_with_properties(list_key, item_key)
+        subitems = [
+            _item_row(child, result["properties"].get(child.id, {}), SUBITEM_KNOWN_PROPS)
+            for child in result["subitems"]
+        ]
+        return {
+            "success": True,
+            "data": subitems,
+            "count": len(subitems)
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.put("/api/items/{list_key}/{item_key}")
-async def update_item(list_key: str, item_key: str, update: ItemUpdate):
+def update_item(list_key: str, item_key: str, update: ItemUpdate):
     """Update item content or status"""
     try:
         mgr = get_manager()
@@ -404,7 +350,7 @@ async def update_item(list_key: str, item_key: str, update: ItemUpdate):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/subitems/{list_key}/{item_key}/{subitem_key}")
-async def update_subitem(list_key: str, item_key: str, subitem_key: str, update: ItemUpdate):
+def update_subitem(list_key: str, item_key: str, subitem_key: str, update: ItemUpdate):
     """Update subitem content or status"""
     try:
         mgr = get_manager()
@@ -427,16 +373,6 @@ async def update_subitem(list_key: str, item_key: str, subitem_key: str, update:
                 status=update.status,
                 parent_item_key=item_key
             )
-            
-            # Explicitly trigger parent status synchronization
-            try:
-                # Get the parent item to sync its status
-                parent_items = mgr.get_list_items(list_key)
-                parent_item = next((item for item in parent_items if getattr(item, 'item_key', None) == item_key), None)
-                if parent_item and hasattr(parent_item, 'id'):
-                    mgr._sync_parent_status(parent_item.id)
-            except Exception as e:
-                print(f"Warning: Could not sync parent status: {e}")
         
         return {"success": True, "message": "Subitem updated successfully"}
     
@@ -444,7 +380,7 @@ async def update_subitem(list_key: str, item_key: str, subitem_key: str, update:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/lists/{list_key}/favorite")
-async def toggle_favorite(list_key: str):
+def toggle_favorite(list_key: str):
     """Toggle favorite status for a list"""
     try:
         mgr = get_manager()
@@ -506,7 +442,7 @@ async def update_config(config: ConfigUpdate):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/lists/{list_key}/properties")
-async def get_list_properties(list_key: str):
+def get_list_properties(list_key: str):
     """Get all properties for a specific list (complete set)."""
     try:
         mgr = get_manager()
@@ -529,7 +465,7 @@ async def get_list_properties(list_key: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/lists/{list_key}/properties")
-async def set_list_property(list_key: str, property_data: dict):
+def set_list_property(list_key: str, property_data: dict):
     """Set a property for a list"""
     try:
         mgr = get_manager()
@@ -559,7 +495,7 @@ async def set_list_property(list_key: str, property_data: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/lists/{list_key}/properties/{property_key}")
-async def delete_list_property(list_key: str, property_key: str):
+def delete_list_property(list_key: str, property_key: str):
     """Delete a property from a list"""
     try:
         mgr = get_manager()
@@ -577,22 +513,21 @@ async def delete_list_property(list_key: str, property_key: str):
 
 # === BATCH ENDPOINTS ===
 @app.get("/api/lists/{list_key}/items/properties-batch")
-async def get_items_properties_batch(list_key: str):
+def get_items_properties_batch(list_key: str):
     """Get properties for all items in a list in a single request (performance optimization)"""
     try:
-        # Use the MCP function which handles the manager correctly
-        from interfaces.mcp_server import todo_get_all_items_properties
+        # Same grouping as the todo_get_all_items_properties MCP tool
+        from interfaces.mcp_server import group_item_properties
         mgr = get_manager()
-        result = await todo_get_all_items_properties(list_key, mgr=mgr)
-        
-        if result["success"]:
-            return {
-                "success": True,
-                "data": result["properties"],
-                "count": result["count"]
-            }
-        else:
-            return {"success": False, "error": result.get("error", "Unknown error")}
+        if not mgr.get_list(list_key):
+            return {"success": False, "error": f"List '{list_key}' not found"}
+
+        grouped_data = group_item_properties(mgr.get_all_items_properties(list_key))
+        return {
+            "success": True,
+            "data": grouped_data,
+            "count": len(grouped_data)
+        }
         
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -603,7 +538,7 @@ async def get_items_properties_batch(list_key: str):
         raise HTTPException(status_code=500, detail=f"Error getting batch properties: {str(e)}")
 
 @app.get("/api/lists/{list_key}/items/{item_key}/properties")
-async def get_item_properties(list_key: str, item_key: str):
+def get_item_properties(list_key: str, item_key: str):
     """Get all properties for a specific item (complete set)."""
     try:
         mgr = get_manager()
@@ -619,7 +554,7 @@ async def get_item_properties(list_key: str, item_key: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/lists/{list_key}/items/{item_key}/properties")
-async def set_item_property(list_key: str, item_key: str, property_data: dict):
+def set_item_property(list_key: str, item_key: str, property_data: dict):
     """Set a property for an item"""
     try:
         mgr = get_manager()
@@ -646,7 +581,7 @@ async def set_item_property(list_key: str, item_key: str, property_data: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/lists/{list_key}/items/{item_key}/subitems/{subitem_key}/properties")
-async def get_subitem_properties(list_key: str, item_key: str, subitem_key: str):
+def get_subitem_properties(list_key: str, item_key: str, subitem_key: str):
     """Get all properties for a specific subitem (complete set)."""
     try:
         mgr = get_manager()
@@ -663,7 +598,7 @@ async def get_subitem_properties(list_key: str, item_key: str, subitem_key: str)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/lists/{list_key}/items/{item_key}/subitems/{subitem_key}/properties")
-async def set_subitem_property(list_key: str, item_key: str, subitem_key: str, property_data: dict):
+def set_subitem_property(list_key: str, item_key: str, subitem_key: str, property_data: dict):
     """Set a property for a subitem"""
     try:
         mgr = get_manager()
@@ -690,7 +625,7 @@ async def set_subitem_property(list_key: str, item_key: str, subitem_key: str, p
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/lists/{list_key}/items/{item_key}/properties/{property_key}")
-async def delete_item_property(list_key: str, item_key: str, property_key: str):
+def delete_item_property(list_key: str, item_key: str, property_key: str):
     """Delete a property from an item"""
     try:
         mgr = get_manager()
@@ -711,7 +646,7 @@ async def delete_item_property(list_key: str, item_key: str, property_key: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/lists/{list_key}/items/{item_key}/subitems/{subitem_key}/properties/{property_key}")
-async def delete_subitem_property(list_key: str, item_key: str, subitem_key: str, property_key: str):
+def delete_subitem_property(list_key: str, item_key: str, subitem_key: str, property_key: str):
     """Delete a property from a subitem"""
     try:
         mgr = get_manager()
@@ -732,37 +667,12 @@ async def delete_subitem_property(list_key: str, item_key: str, subitem_key: str
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/lists/{list_key}/sync-parent-statuses")
-async def sync_parent_statuses(list_key: str):
+def sync_parent_statuses(list_key: str):
     """Manually sync all parent statuses in a list"""
     try:
         mgr = get_manager()
-        
-        # Get all items in the list
-        all_items = mgr.get_list_items(list_key, limit=10000)
-        
-        # Find all parent items (items that have subitems)
-        parent_items = []
-        parent_ids = set()
-        
-        for item in all_items:
-            item_dict = item.to_dict() if hasattr(item, 'to_dict') else (item.__dict__ if hasattr(item, '__dict__') else item)
-            parent_id = item_dict.get('parent_item_id')
-            if parent_id and parent_id not in parent_ids:
-                parent_ids.add(parent_id)
-                # Find the parent item by ID
-                parent_item = next((i for i in all_items if getattr(i, 'id', None) == parent_id), None)
-                if parent_item:
-                    parent_items.append(parent_item)
-        
-        # Sync status for each parent
-        synced_count = 0
-        for parent_item in parent_items:
-            try:
-                if hasattr(parent_item, 'id'):
-                    mgr._sync_parent_status(parent_item.id)
-                    synced_count += 1
-            except Exception as e:
-                print(f"Error syncing parent {getattr(parent_item, 'item_key', 'unknown')}: {e}")
+        # One set-based UPDATE; changes propagate up the tree via triggers
+        synced_count = mgr.recompute_parent_statuses(list_key)
         
         return {
             "success": True,
@@ -770,16 +680,24 @@ async def sync_parent_statuses(list_key: str):
             "synced_count": synced_count
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint
+
+    The database query runs on a worker thread with its own limiter: the event
+    loop never blocks, and the probe stays responsive even while every
+    regular worker thread is busy with slow requests.
+    """
     try:
-        mgr = get_manager()
         # Try a simple operation to verify database connection
-        lists = mgr.list_all(limit=1)
+        lists = await to_thread.run_sync(
+            lambda: get_manager().list_all(limit=1), limiter=_health_check_limiter
+        )
         return {
             "success": True,
             "status": "healthy",
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the TODOIT web API
+Runs N concurrent clients against /api/lists, the items of one large list and
+/api/health, and reports p50/p99 latency per endpoint. Without --url a uvicorn server is started on a
+seeded temporary database, so client and server do not share an event loop
+and time spent queued behind other requests is measured.
+
+Usage:
+    python benchmark_concurrency.py                      # 50 clients, own server
+    python benchmark_concurrency.py --clients 50 --lists 1500
+    python benchmark_concurrency.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import httpx
+
+WEB_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(WEB_DIR))
+
+
+def seed_database(db_path, num_lists, items_per_list, big_list_items):
+    """Create lists with items, properties and tags plus one large list"""
+    from core.manager import TodoManager
+
+    manager = TodoManager(db_path)
+    manager.create_list(
+        "big_list", "Large list", items=[f"Task {n}" for n in range(big_list_items)]
+    )
+    for i in range(num_lists):
+        list_key = f"bench_{i:04d}"
+        manager.create_list(
+            list_key,
+            f"Benchmark list {i}",
+            items=[f"Task {n}" for n in range(items_per_list)],
+        )
+        if i % 3 == 0:
+            manager.set_list_property(list_key, "is_favorite", "true")
+        if i % 5 == 0:
+            manager.add_tag_to_list(list_key, "bench")
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def run_client(client, paths, requests_per_client, latencies, errors):
+    """One client issuing its requests sequentially, alternating endpoints"""
+    for n in range(requests_per_client):
+        path = paths[n % len(paths)]
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            errors[path.split("?")[0]] += 1
+            continue
+        latencies[path.split("?")[0]].append((time.perf_counter() - start) * 1000)
+
+
+async def run_benchmark(base_url, clients, requests_per_client):
+    paths = [
+        "/api/lists?limit=50",
+        "/api/health",
+        "/api/lists/big_list/items?limit=1000",
+        "/api/health",
+    ]
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[
+                run_client(client, paths, requests_per_client, latencies, errors)
+                for _ in range(clients)
+            ]
+        )
+        elapsed = time.perf_counter() - start
+
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"📊 WEB CONCURRENCY BENCHMARK ({clients} clients, {total} requests)")
+    print(f"   Wall time: {elapsed:.2f}s ({total / elapsed:.1f} req/s)")
+    for path, samples in sorted(latencies.items()):
+        print(
+            f"   {path:<32} p50={statistics.median(samples):8.1f}ms"
+            f"  p99={percentile(samples, 99):8.1f}ms"
+            f"  max={max(samples):8.1f}ms"
+            f"  errors={errors[path]}"
+        )
+
+
+def start_server(db_path):
+    """Start uvicorn serving the web app on a free local port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    env = dict(os.environ, TODOIT_DB_PATH=db_path)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=WEB_DIR,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            httpx.get(f"{base_url}/api/health", timeout=1)
+            return server, base_url
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("Web server did not start")
+
+
+async def main_async(args):
+    if args.url:
+        await run_benchmark(args.url, args.clients, args.requests)
+        return
+
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark_web.db")
+    print(f"Seeding {args.lists} lists x {args.items} items into {db_path} ...")
+    seed_database(db_path, args.lists, args.items, args.big_list_items)
+
+    server, base_url = start_server(db_path)
+    try:
+        await run_benchmark(base_url, args.clients, args.requests)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Benchmark a running server instead")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=10, help="per client")
+    parser.add_argument("--lists", type=int, default=300)
+    parser.add_argument("--items", type=int, default=10, help="per list")
+    parser.add_argument("--big-list-items", type=int, default=5000)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()